@@ -1,7 +1,23 @@
 from .attrLinker import Linker, LinkManager
-from .presets import linkDictionary, multiLinkDictionary, formattedTextFromDict, linkList, multiLinkList, linkObject, multiLinkObject
+from .compiledLinker import CompiledLinker, LinkDescriptor
+from .presets import linkDictionary, multiLinkDictionary, formattedTextFromDict, linkList, linkSlice, linkIndexes, multiLinkList, linkObject, multiLinkObject, linkColumn, multiLinkColumn, linkPath, multiLinkPath, linkSharedRecord, multiLinkSharedRecord, linkStruct, multiLinkStruct, linkDerived
 from .linkMethod import LinkMethod
+from .textTemplate import CompiledTemplate
+from .columnStore import ColumnStore
+from .pathResolver import PathResolver, compilePath
+from .coercion import Coercer, coercerOf
+from .recordLayout import RecordLayout
+from .sharedRecord import SharedRecordStore, SharedRecord
+from .recordFile import RecordFile
 from .preparedLink import PreparedLink
-from .decorator import LinkedClass
-from .exceptions import LinkerException, LinkerExists, LinkerNotFound, LinkerNotReady
+from .decorator import LinkedClass, materializeLinks
+from .collection import LinkedCollection, RefreshResult
+from .index import HashIndex, SortedIndex, IndexSet, indexesOf
+from .derived import DependencyGraph, derivedOf
+from .ingest import iterRecords, ingest, ingestInto
+from .changeTracker import ChangeTracker, Change
+from .instrumentation import Instrumentation, ReportEntry
+from .refresher import AsyncRefresher, RefreshMetrics
+from .exporter import Exporter, getExporter
+from .exceptions import LinkerException, LinkerExists, LinkerNotFound, LinkerNotReady, DependencyCycle, CoercionError
 
@@ -1,14 +1,18 @@
 from .utils import DefaultLambda, DictUpdater
 from .exceptions import LinkerExists, LinkerNotFound, LinkerNotReady
 
-from typing import Any, Dict
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable
 
 class Linker:
     '''Linker object to link between attributes of a class' instance using property'''
     
-    __slots__ = ['sourceVar', 'getterConverter', 'setterOverrider', 'setterConverter', 'doc', 'property', 'links']
+    __slots__ = ['sourceVar', 'getterConverter', 'setterOverrider', 'setterConverter', 'doc', 'accessSpec', 'property', 'links']
     
-    def __init__(self, sourceVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = None):
+    def __init__(self, sourceVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = None, accessSpec: tuple = None):
         '''
         Params
         ------
@@ -17,14 +21,16 @@ class Linker:
         setterConverter:Callable is the function that gets called to process a replacement before being set to the sourceVar. Called with 2 args=(instance_self, replacement)
         setterOverrider:Callable is the function that gets called to do the setter process. Called with 3 args=(instance_self, Linker.sourceVar, replacement)
         doc:str is the documentation string (docstring) for the property
+        accessSpec:tuple is an optional description of what the converters do, in the form of (kind, *args). Ex: ('item', key, default). Used by linker classes which specialize their accessors, ignored otherwise.
         '''
         self.sourceVar = sourceVar
         self.getterConverter = getterConverter
         self.setterOverrider = setterOverrider
         self.setterConverter = setterConverter
         self.doc = doc or "Linker to instance variable: {}".format(self.sourceVar)
+        self.accessSpec = accessSpec
         self.property = None
-        self.links = {} # dictionary of targetClass and targetVar, Ex: {Class1: [Var1,Var2,Var3,...],...}
+        self.links = weakref.WeakKeyDictionary() # dictionary of targetClass and targetVar, Ex: {Class1: [Var1,Var2,Var3,...],...}. Weak keyed, so linked classes can be garbage collected.
 
     def __repr__(self):
         return "<{} SourceVar={} Ready={}>".format(self.__class__.__name__, self.sourceVar, self.ready)
@@ -74,27 +80,49 @@ class Linker:
         if not self.ready:
             raise LinkerNotReady("Linker is not ready yet! Please call setup first to set it up.")
         setattr(targetClass, targetVar, self.property)
-        self.links[targetClass] = self.links.get(targetClass, []) + [targetVar] #Ex: {Class1: [Var1,Var2,...]}
+        targetVars = self.links.get(targetClass, [])
+        if targetVar not in targetVars: # Re-applying at the same targetVar, Ex: after a swap, is not recorded twice
+            self.links[targetClass] = targetVars + [targetVar] #Ex: {Class1: [Var1,Var2,...]}
+
+    def unapply(self, targetClass: type, targetVar: str):
+        '''
+        Removes the linker from given class at the target variable name, deleting the property if it is still the linker's.
+
+        Params
+        ------
+        targetClass:type is the class to be unlinked
+        targetVar:str is the class's instance attribute name to be unlinked
+        '''
+        if targetClass.__dict__.get(targetVar) is self.property:
+            delattr(targetClass, targetVar)
+        targetVars = [var for var in self.links.get(targetClass, []) if var != targetVar]
+        if targetVars:
+            self.links[targetClass] = targetVars
+        else:
+            self.links.pop(targetClass, None)
 
 
 class LinkManager:
     _DEFAULT_MANAGER = None # Manager for preset linkers/bindings
-    _MANAGERS = [] # Keep track of created managers
+    _MANAGERS = weakref.WeakSet() # Keep track of created managers, without keeping them alive
     _LINKER_CLASS = Linker # Linker class to create links
+    _DEFAULT_LOCK = threading.Lock()
 
-    __slots__ = ['autoLinkWithManager', 'linkerSetupOptions', 'linkers', 'links']
+    __slots__ = ['autoLinkWithManager', 'linkerSetupOptions', 'fuseChains', 'linkers', 'links', 'targets', 'version', 'classVersions', 'changeTracker', 'instrumentation', 'sources', '_ownedNames', '_lock', '_writeLocks', '_sequences', '_linkerTables', '_staged', '_fusedClasses', '__weakref__']
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         # Keep track of managers
         instance = super().__new__(cls)
-        cls._MANAGERS.append(instance)
+        cls._MANAGERS.add(instance)
         return instance
 
     @classmethod
     def _getDefault(cls):
         '''Gets the default link manager, if not available, create one. Used by presets.'''
         if not isinstance(cls._DEFAULT_MANAGER, cls):
-            cls._DEFAULT_MANAGER = cls()
+            with cls._DEFAULT_LOCK:
+                if not isinstance(cls._DEFAULT_MANAGER, cls):
+                    cls._DEFAULT_MANAGER = cls()
         return cls._DEFAULT_MANAGER
 
     @classmethod
@@ -110,16 +138,31 @@ class LinkManager:
             raise RuntimeError('Given Linker Class Replacement Must Inherit From <Linker>.')
         cls._LINKER_CLASS = linkerClass
 
-    def __init__(self, autoLinkWithManager: bool = True, linkerSetupOptions: Dict[str, Any] = {}):
+    def __init__(self, autoLinkWithManager: bool = True, linkerSetupOptions: Dict[str, Any] = {}, fuseChains: bool = False):
         '''
         Params
         ------
-        autoLinkWithManager:bool is whether to record the link pairs in the LinkManager's links attribute
-        linkerSetupOpntions:dict is to update the default setup options of the LinkManager'''
+        autoLinkWithManager:bool is whether to record the applied linkers in the LinkManager's links attribute
+        linkerSetupOpntions:dict is to update the default setup options of the LinkManager
+        fuseChains:bool whether to fuse the chained links of every class, see fuse. Defaults to False'''
         self.autoLinkWithManager = autoLinkWithManager
         self.linkerSetupOptions = DictUpdater({'enableSetter':True}, linkerSetupOptions)
+        self.fuseChains = fuseChains
         self.linkers = {}
-        self.links = {}
+        self.links = weakref.WeakKeyDictionary() # Linkers applied per class, Ex: {Class1: {targetVar1: linker1,...},...}
+        self.targets = weakref.WeakKeyDictionary() # Names of the linkers applied per class, Ex: {Class1: {targetVar1: linkerName1,...},...}
+        self.sources = weakref.WeakKeyDictionary() # Linked attributes per source of a class, Ex: {Class1: {sourceVar1: {targetVar1, targetVar2,...},...},...}
+        self.version = 0 # Incremented whenever a link is applied or removed, so cached lookups know when to be rebuilt
+        self.classVersions = weakref.WeakKeyDictionary() # Version per class, incremented whenever a link of the class is applied or removed, see versionOf
+        self.changeTracker = None
+        self.instrumentation = None
+        self._ownedNames = weakref.WeakKeyDictionary() # Generated linker names per class, their linkers are removed with the class, Ex: {Class1: {linkerName1,...},...}
+        self._lock = threading.RLock() # Guards the registries above, reentrant since binding may apply lazy links which bind in turn
+        self._writeLocks = weakref.WeakKeyDictionary() # Serialize the writers per instance, apart from the registries, Ex: {instance1: RLock,...}
+        self._sequences = weakref.WeakKeyDictionary() # Write sequence per instance, odd while a write is in progress, Ex: {instance1: 2,...}
+        self._linkerTables = weakref.WeakKeyDictionary() # linkersOf per class for snapshots, Ex: {Class1: (version, {targetVar: linker,...}),...}
+        self._fusedClasses = weakref.WeakSet() # Classes whose chained links are fused, see fuse
+        self._staged = None # Links applied and removed within staging, waiting to be swapped in, Ex: [('apply', linkerName, Class1, targetVar1), ('unbind', Class1, targetVar2),...]
 
     def __repr__(self):
         return "<{} LinkerClass={} LinkersCount={}>".format(self.__class__.__name__, self.linkerClass, len(self.linkers))
@@ -128,7 +171,336 @@ class LinkManager:
     def linkerClass(self):
         return self.__class__._LINKER_CLASS
 
-    def createLinker(self, name: str, sourceVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = '', overwrite: bool = False, doSetup: bool = True, setupOptions: Dict[str, Any] = {}):
+    def linkersOf(self, targetClass: type):
+        '''
+        Returns the linkers of this manager applied to targetClass and its bases, in the form of {targetVar: linker}. Links of a subclass take precedence over its bases.
+
+        Params
+        ------
+        targetClass:type is the class to look up
+        '''
+        from .decorator import materializeLinks
+        materializeLinks(targetClass) # Lazy linked classes get their links applied before being looked up
+        found = {}
+        with self._lock:
+            for klass in reversed(targetClass.__mro__):
+                for targetVar, name in self.targets.get(klass, {}).items():
+                    found[targetVar] = self.linkers[name]
+        return found
+
+    def versionOf(self, targetClass: type) -> int:
+        '''
+        Returns the version of the links of targetClass and its bases, which changes whenever one of them is applied or removed.
+        Unlike version, it is left as is by links of unrelated classes.
+
+        Params
+        ------
+        targetClass:type is the class to look up
+        '''
+        classVersions = self.classVersions
+        return sum(classVersions.get(klass, 0) for klass in targetClass.__mro__)
+
+    def linkerAt(self, targetClass: type, targetVar: str) -> Linker:
+        '''
+        Returns the linker of this manager serving targetVar of targetClass, looking up its bases if it is not linked on the class itself. None if there is none.
+
+        Params
+        ------
+        targetClass:type is the class to look up
+        targetVar:str is the linked attribute name
+        '''
+        for klass in targetClass.__mro__:
+            name = self.targets.get(klass, {}).get(targetVar)
+            if name is not None:
+                return self.linkers.get(name)
+        return None
+
+    def targetsOf(self, targetClass: type, sourceVar: str) -> frozenset:
+        '''
+        Returns the attribute names of targetClass linked to sourceVar by this manager. Links applied to its bases are not included.
+
+        Params
+        ------
+        targetClass:type is the class to look up
+        sourceVar:str is the source attribute name of an instance
+        '''
+        return frozenset(self.sources.get(targetClass, {}).get(sourceVar, ()))
+
+    @contextmanager
+    def staging(self):
+        '''
+        Stages the links applied and removed within, then swaps them in as one step on exit, while holding the lock of the manager.
+        Lookups of the manager, snapshots and other binds never see a part of the swap, the link map changes from the old one to the new one at once.
+        If an exception is raised within, nothing is applied and the linkers generated meanwhile are dropped. Nested staging joins the outer one.
+        Ex: with manager.staging(): linkDictionary(User, 'userData', 'onlineTime', 'onlineSeconds')
+        '''
+        with self._lock:
+            if self._staged is not None:
+                yield self._staged
+                return
+            staged = self._staged = []
+            try:
+                yield staged
+            except BaseException:
+                self._staged = None
+                self._discardStaged(staged)
+                raise
+            self._staged = None
+            for operation, *args in staged: # Tight loop, the properties are replaced one after another without anything else in between
+                if operation == 'apply':
+                    self._applyLinker(*args)
+                else:
+                    self._unbind(*args)
+        if self.changeTracker is not None:
+            for targetClass in {args[-2] for _, *args in staged}:
+                self.changeTracker.forget(targetClass)
+
+    def _discardStaged(self, staged: list):
+        '''Drops the linkers generated for the staged links, which were never applied.'''
+        for operation, *args in staged:
+            if operation == 'apply':
+                linkerName, targetClass, _ = args
+                ownedNames = self._ownedNames.get(targetClass)
+                linker = self.linkers.get(linkerName)
+                if ownedNames is not None and linkerName in ownedNames and linker is not None and next(iter(linker.links.keys()), None) is None:
+                    ownedNames.discard(linkerName)
+                    del self.linkers[linkerName]
+
+    def swap(self, targetClass: type, links: Iterable, unbindMissing: bool = True):
+        '''
+        Replaces the link map of targetClass at runtime, applying every link at once, see staging. Ex: once the upstream API renamed a key.
+        Links are PreparedLinks, which bind through the default manager, so swap is meant for the default manager.
+
+        Params
+        ------
+        targetClass:type is the class to be relinked
+        links:Iterable is the new PreparedLinks of the class
+        unbindMissing:bool whether to remove the links of the class which are not in the new links. Defaults to True
+        '''
+        with self.staging() as staged:
+            for link in links:
+                link.apply(targetClass)
+            if unbindMissing:
+                kept = {args[2] for operation, *args in staged if operation == 'apply' and args[1] is targetClass}
+                for targetVar in list(self.targets.get(targetClass, {})):
+                    if targetVar not in kept:
+                        self.unbind(targetClass, targetVar)
+
+    def fuse(self, targetClass: type):
+        '''
+        Fuses the chained links of targetClass, and keeps them fused as its links change. A link is chained when its sourceVar is linked on the same class,
+        Ex: login_time linked to online_time, itself linked to userData. Its attribute then reads the root source once and runs the converters of the chain in a row.
+        Semantics are kept, setters go through the links as before, and instances of subclasses are read link by link.
+
+        Params
+        ------
+        targetClass:type is the class whose chains are fused
+        '''
+        with self._lock:
+            self._fusedClasses.add(targetClass)
+            self._refuse(targetClass)
+
+    def unfuse(self, targetClass: type):
+        '''Puts the unfused properties back at the chained links of targetClass.'''
+        with self._lock:
+            self._fusedClasses.discard(targetClass)
+            self._refuse(targetClass)
+
+    def _fusing(self, targetClass: type) -> bool:
+        return self.fuseChains or targetClass in self._fusedClasses
+
+    def _refuse(self, targetClass: type):
+        '''Installs the fused property of every chained link of targetClass, or the linker's property if it is not chained (anymore) or fusing is off.'''
+        from .fusion import fuseLinkers, fusedChainOf
+        targets = self.targets.get(targetClass, {})
+        fusing = self._fusing(targetClass)
+        for targetVar, name in targets.items():
+            linker = self.linkers[name]
+            current = self._unwrap(targetClass.__dict__.get(targetVar))
+            chain = fusedChainOf(current)
+            if current is not linker.property and (chain is None or chain[-1] is not linker):
+                continue # Replaced by something else than this manager, left as is
+            chain, visited = [linker], {targetVar}
+            while fusing and chain[0].sourceVar in targets and chain[0].sourceVar not in visited:
+                visited.add(chain[0].sourceVar)
+                inner = self.linkers[targets[chain[0].sourceVar]]
+                innerCurrent = self._unwrap(targetClass.__dict__.get(chain[0].sourceVar))
+                if innerCurrent is not inner.property and fusedChainOf(innerCurrent) is None:
+                    break
+                chain.insert(0, inner)
+            if len(chain) > 1:
+                if fusedChainOf(current) != tuple(chain):
+                    self._install(targetClass, targetVar, fuseLinkers(targetClass, chain))
+            elif current is not linker.property:
+                self._install(targetClass, targetVar, linker.property)
+
+    def _serves(self, linker: Linker, descriptor) -> bool:
+        '''Whether descriptor, once unwrapped, is the property of linker or a fused property ending with it.'''
+        from .fusion import fusedChainOf
+        descriptor = self._unwrap(descriptor)
+        chain = fusedChainOf(descriptor)
+        return descriptor is linker.property or (chain is not None and chain[-1] is linker)
+
+    @staticmethod
+    def _unwrap(descriptor):
+        while hasattr(descriptor, 'descriptor'): # Ex: wrapped by instrumentation or an index
+            descriptor = descriptor.descriptor
+        return descriptor
+
+    def _install(self, targetClass: type, targetVar: str, descriptor):
+        '''Sets descriptor at targetVar of targetClass, inside the wrappers of the attribute if any.'''
+        holder, current = None, targetClass.__dict__.get(targetVar)
+        while hasattr(current, 'descriptor'):
+            holder, current = current, current.descriptor
+        if holder is None:
+            setattr(targetClass, targetVar, descriptor)
+        else:
+            holder.descriptor = descriptor
+
+    @staticmethod
+    def _wrap(targetClass: type, targetVar: str, wrap: Callable):
+        '''Wraps the descriptor at targetVar of targetClass, along with its wrappers, in wrap(descriptor). Returns the wrapper.'''
+        wrapper = wrap(targetClass.__dict__.get(targetVar))
+        setattr(targetClass, targetVar, wrapper)
+        return wrapper
+
+    @staticmethod
+    def _findWrapper(targetClass: type, targetVar: str, match: Callable):
+        '''Returns the wrapper at targetVar of targetClass for which match(wrapper) is true, wherever it is in the wrappers. None if there is none.'''
+        descriptor = targetClass.__dict__.get(targetVar)
+        while hasattr(descriptor, 'descriptor'):
+            if match(descriptor):
+                return descriptor
+            descriptor = descriptor.descriptor
+        return None
+
+    @staticmethod
+    def _removeWrapper(targetClass: type, targetVar: str, wrapper) -> bool:
+        '''Removes wrapper from the wrappers at targetVar of targetClass, wherever it is in them. Returns whether it was found.'''
+        holder, current = None, targetClass.__dict__.get(targetVar)
+        while current is not wrapper:
+            if not hasattr(current, 'descriptor'):
+                return False
+            holder, current = current, current.descriptor
+        if holder is None:
+            setattr(targetClass, targetVar, wrapper.descriptor)
+        else:
+            holder.descriptor = wrapper.descriptor
+        return True
+
+    @contextmanager
+    def writing(self, instance):
+        '''
+        Groups the writes to the sources of instance, so snapshots never see a part of them. Writers of the same instance are serialized, readers are never blocked.
+        Ex: with manager.writing(user): user.name, user.status = 'Foo', 'online'
+
+        Params
+        ------
+        instance:object is the written instance, it must support weak references
+        '''
+        lock = self._writeLocks.get(instance)
+        if lock is None:
+            lock = self._writeLocks.setdefault(instance, threading.RLock()) # Atomic, concurrent writers get the same lock
+        with lock:
+            sequence = self._sequences.get(instance, 0)
+            if sequence % 2: # Nested within a write of the same instance
+                yield instance
+                return
+            self._sequences[instance] = sequence + 1 # Odd, snapshots taken meanwhile are retried
+            try:
+                yield instance
+            finally:
+                self._sequences[instance] = sequence + 2
+
+    def _sequenceOf(self, instance) -> int:
+        try:
+            return self._sequences.get(instance, 0)
+        except TypeError: # Not weak referenceable, so it can't be written through writing either
+            return 0
+
+    def snapshot(self, instance, targetVars: Iterable[str] = None) -> Dict[str, Any]:
+        '''
+        Returns the values of the linked attributes of instance from a single version of their sources, in the form of {targetVar: value}.
+        Every source is read once and dict, list and bytearray sources are copied before the converters run, so a source replaced or mutated meanwhile
+        can not mix two versions. Links whose sourceVar is another link of the class are resolved from the snapshot of that link.
+        No lock is taken once the links of the class were looked up, a snapshot overlapping a write made within writing(instance), or a change of the links, is retried instead.
+
+        Params
+        ------
+        instance:object is the linked instance
+        targetVars:Iterable is the linked attributes to read, every linked attribute of the instance's class if None
+        '''
+        version, linkers = None, None
+        while True:
+            if version != self.version:
+                version = self.version
+                linkers = self._linkerTable(type(instance), version)
+                wanted = list(linkers if targetVars is None else targetVars)
+            sequence = self._sequenceOf(instance)
+            if sequence % 2:
+                time.sleep(0) # A write is in progress, let the writer finish
+                continue
+            sources = {}
+            values = {targetVar: self._snapshotValue(instance, targetVar, linkers, sources) for targetVar in wanted}
+            if self._sequenceOf(instance) == sequence and self.version == version:
+                return values
+
+    def _linkerTable(self, targetClass: type, version: int) -> Dict[str, Linker]:
+        '''Returns linkersOf targetClass, cached until the links change, so snapshots only take the lock of the registries after a change of the links.'''
+        cached = self._linkerTables.get(targetClass)
+        if cached is None or cached[0] != version:
+            cached = self._linkerTables[targetClass] = (version, self.linkersOf(targetClass))
+        return cached[1]
+
+    @staticmethod
+    def _snapshotValue(instance, targetVar: str, linkers: Dict[str, Linker], sources: Dict[str, Any]):
+        '''Resolves targetVar from the captured sources, capturing its source first if needed.'''
+        linker = linkers[targetVar]
+        sourceVar = linker.sourceVar
+        if sourceVar not in sources:
+            if sourceVar in linkers and sourceVar != targetVar: # Chained link
+                source = LinkManager._snapshotValue(instance, sourceVar, linkers, sources)
+            else:
+                source = getattr(instance, sourceVar)
+            sources[sourceVar] = source.copy() if isinstance(source, (dict, list, bytearray)) else source
+        return linker.getterConverter(sources[sourceVar])
+
+    def enableChangeTracking(self):
+        '''Enables change tracking for the links of this manager, returns its ChangeTracker.'''
+        if self.changeTracker is None:
+            from .changeTracker import ChangeTracker
+            self.changeTracker = ChangeTracker(self)
+        return self.changeTracker
+
+    def enableInstrumentation(self):
+        '''
+        Enables access instrumentation for the links of this manager, returns its Instrumentation.
+        Instrumentation wraps the linked attributes while enabled, and puts the original descriptors back once disabled.
+        '''
+        if self.instrumentation is None:
+            from .instrumentation import Instrumentation
+            self.instrumentation = Instrumentation(self)
+        self.instrumentation.enable()
+        return self.instrumentation
+
+    def disableInstrumentation(self):
+        '''Disables access instrumentation, the recorded stats are kept for reports.'''
+        if self.instrumentation is not None:
+            self.instrumentation.disable()
+
+    def report(self, top: int = 10):
+        '''
+        Returns the top instrumented attributes by access count and by total time, in the form of {'byCount': [ReportEntry,...], 'byTime': [ReportEntry,...]}.
+
+        Params
+        ------
+        top:int is the amount of entries in each list
+        '''
+        if self.instrumentation is None:
+            return {'byCount': [], 'byTime': []}
+        return self.instrumentation.report(top)
+
+    def createLinker(self, name: str, sourceVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = '', accessSpec: tuple = None, overwrite: bool = False, doSetup: bool = True, setupOptions: Dict[str, Any] = {}):
         '''
         Creates a linker object with given arguments, and put it into a hashmap on the LinkManager linkers attribute, then call its setup method if doSetup is True.
 
@@ -140,17 +512,20 @@ class LinkManager:
         setterConverter:Callable is the function that gets called to process a replacement before being set to the sourceVar
         setterOverrider:Callable is the function that gets called to do the setter process
         doc:str is the documentation string (docstring) for the property
+        accessSpec:tuple is an optional description of what the converters do, see Linker
         overwrite:bool whether to overwrite existing entries if found with the same name on the hashmap
         doSetup:bool whether to call the setup method of the linker after its creation
         setupOptions:dict extra setup options for the linker.setup method in the form of a dictionary
         '''
-        if not overwrite and self.linkers.get(name) is not None:
-            raise LinkerExists("A Linker with name '{}' already exists in this linker manager. To overwrite it, please set overwrite=True.".format(name))
-        self.linkers[name] = self.linkerClass(sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc)
+        linker = self.linkerClass(sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc, accessSpec=accessSpec)
         if doSetup:
             setupOptions = DictUpdater(self.linkerSetupOptions, setupOptions)
-            self.linkers[name].setup(**setupOptions)
-        return self.linkers[name] # if they wanted to use it through call chaining, they can. Ex: AttrLinkManager().createLinker(...).apply(...)
+            linker.setup(**setupOptions)
+        with self._lock:
+            if not overwrite and self.linkers.get(name) is not None:
+                raise LinkerExists("A Linker with name '{}' already exists in this linker manager. To overwrite it, please set overwrite=True.".format(name))
+            self.linkers[name] = linker
+        return linker # if they wanted to use it through call chaining, they can. Ex: AttrLinkManager().createLinker(...).apply(...)
 
     def prepareLinkers(self, setupOptions: Dict[str, Any] = {}):
         '''
@@ -162,7 +537,9 @@ class LinkManager:
         '''
         # Setup linkers
         setupOptions = DictUpdater(self.linkerSetupOptions, setupOptions)
-        [linker.setup(**setupOptions) for linker in self.linkers]
+        with self._lock:
+            linkers = list(self.linkers.values())
+        [linker.setup(**setupOptions) for linker in linkers]
 
     def applyLinker(self, linkerName: str, targetClass: type, targetVar: str):
         '''
@@ -174,14 +551,129 @@ class LinkManager:
         targetClass:type is the class targeted to be linked with
         targetVar:str is the class's instance attribute name to be linked at
         '''
-        try:
-            self.linkers[linkerName].apply(targetClass, targetVar)
-            if self.autoLinkWithManager:
-                self.links[targetClass] = (targetVar, self.linkers[linkerName])
-        except KeyError as exc:
-            raise LinkerNotFound('Linker {} is not found in the manager. Make sure you enter the correct name, or create one if it does not exists.'.format(linkerName)) from exc
+        with self._lock:
+            if linkerName not in self.linkers:
+                raise LinkerNotFound('Linker {} is not found in the manager. Make sure you enter the correct name, or create one if it does not exists.'.format(linkerName))
+            if self._staged is not None:
+                self._staged.append(('apply', linkerName, targetClass, targetVar))
+            else:
+                self._applyLinker(linkerName, targetClass, targetVar)
+
+    def _applyLinker(self, linkerName: str, targetClass: type, targetVar: str):
+        linker = self.linkers[linkerName]
+        previousName = self.targets.get(targetClass, {}).get(targetVar)
+        wrapped = targetClass.__dict__.get(targetVar)
+        linker.apply(targetClass, targetVar)
+        if hasattr(wrapped, 'descriptor') and previousName is not None and self._serves(self.linkers[previousName], wrapped):
+            setattr(targetClass, targetVar, wrapped) # Wrappers of the replaced link (Ex: an index) are kept around the new property
+            self._install(targetClass, targetVar, linker.property)
+        if self.autoLinkWithManager:
+            self.links.setdefault(targetClass, {})[targetVar] = linker
+        self.version += 1
+        self.classVersions[targetClass] = self.classVersions.get(targetClass, 0) + 1
+        targets = self.targets.setdefault(targetClass, {})
+        targets[targetVar] = linkerName
+        if previousName is not None and previousName != linkerName:
+            self._forgetSource(targetClass, self.linkers[previousName].sourceVar, targetVar)
+            self._releaseLinker(previousName, targetClass, targetVar)
+        self.sources.setdefault(targetClass, {}).setdefault(linker.sourceVar, set()).add(targetVar)
+        if self._fusing(targetClass) and (linker.sourceVar in targets or targetVar in self.sources[targetClass]):
+            self._refuse(targetClass)
+        if self.instrumentation is not None and self.instrumentation.enabled:
+            self.instrumentation.instrument(targetClass, targetVar)
+
+    def _forgetSource(self, targetClass: type, sourceVar: str, targetVar: str):
+        sources = self.sources.get(targetClass, {})
+        targetVars = sources.get(sourceVar, set())
+        targetVars.discard(targetVar)
+        if not targetVars:
+            sources.pop(sourceVar, None)
+            if not sources:
+                self.sources.pop(targetClass, None)
+
+    def _releaseLinker(self, linkerName: str, targetClass: type, targetVar: str):
+        '''Drops the record of the linker at targetVar of targetClass, then removes the linker itself if it was generated by bind and is no longer applied anywhere.'''
+        linker = self.linkers.get(linkerName)
+        if linker is None:
+            return
+        linker.unapply(targetClass, targetVar)
+        ownedNames = self._ownedNames.get(targetClass)
+        if ownedNames is not None and linkerName in ownedNames and next(iter(linker.links.keys()), None) is None:
+            ownedNames.discard(linkerName)
+            del self.linkers[linkerName]
+
+    @staticmethod
+    def _purgeOwned(managerRef: weakref.ref, ownedNames: set):
+        '''Called when a linked class is garbage collected, removes the linkers generated for it which are no longer applied anywhere.'''
+        manager = managerRef()
+        if manager is None:
+            return
+        with manager._lock:
+            for name in ownedNames:
+                linker = manager.linkers.get(name)
+                if linker is not None and next(iter(linker.links.keys()), None) is None:
+                    del manager.linkers[name]
+            ownedNames.clear()
+
+    def unbind(self, targetClass: type, targetVar: str):
+        '''
+        Removes the link at targetVar of targetClass, deleting its property and the bookkeeping of the manager. Linkers generated by bind are removed once they are no longer applied.
 
-    def bind(self, targetClass: type, sourceVar: str, targetVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = '', setupOptions: Dict[str, Any] = {}, name: str = None, orphan: bool = False, **kw):
+        Params
+        ------
+        targetClass:type is the class to be unlinked
+        targetVar:str is the class's instance attribute name to be unlinked
+        '''
+        with self._lock:
+            if self._staged is not None:
+                staged = any(entry[0] == 'apply' and entry[2] is targetClass and entry[3] == targetVar for entry in self._staged)
+                if not staged and targetVar not in self.targets.get(targetClass, {}):
+                    raise LinkerNotFound("No linker of this manager is applied to {}.{}".format(targetClass.__name__, targetVar))
+                self._staged.append(('unbind', targetClass, targetVar))
+                return
+            self._unbind(targetClass, targetVar)
+        if self.changeTracker is not None:
+            self.changeTracker.forget(targetClass)
+
+    def _unbind(self, targetClass: type, targetVar: str):
+        targets = self.targets.get(targetClass, {})
+        if targetVar not in targets:
+            raise LinkerNotFound("No linker of this manager is applied to {}.{}".format(targetClass.__name__, targetVar))
+        linkerName = targets.pop(targetVar)
+        self.version += 1
+        self.classVersions[targetClass] = self.classVersions.get(targetClass, 0) + 1
+        if not targets:
+            self.targets.pop(targetClass, None)
+        links = self.links.get(targetClass, {})
+        links.pop(targetVar, None)
+        if not links:
+            self.links.pop(targetClass, None)
+        linker = self.linkers.get(linkerName)
+        if linker is not None:
+            self._forgetSource(targetClass, linker.sourceVar, targetVar)
+        if self.instrumentation is not None:
+            self.instrumentation.restore(targetClass, targetVar)
+        if linker is not None and targetClass.__dict__.get(targetVar) is not linker.property and self._serves(linker, targetClass.__dict__.get(targetVar)):
+            setattr(targetClass, targetVar, linker.property) # Fused or wrapped (Ex: by an index), so the linker removes it along with its wrappers
+        self._releaseLinker(linkerName, targetClass, targetVar)
+        if self._fusing(targetClass) and targetVar in self.sources.get(targetClass, {}):
+            self._refuse(targetClass) # Links reading targetVar are not chained anymore
+
+    def unlinkClass(self, targetClass: type):
+        '''
+        Removes every link of this manager applied to targetClass. Links applied to its bases are left as is.
+
+        Params
+        ------
+        targetClass:type is the class to be unlinked
+        '''
+        with self._lock:
+            for targetVar in list(self.targets.get(targetClass, {})):
+                self.unbind(targetClass, targetVar)
+            if self._staged is None:
+                self._ownedNames.pop(targetClass, None)
+
+    def bind(self, targetClass: type, sourceVar: str, targetVar: str, getterConverter: callable = DefaultLambda, setterConverter: callable = DefaultLambda, setterOverrider: callable = None, doc: str = '', accessSpec: tuple = None, setupOptions: Dict[str, Any] = {}, name: str = None, orphan: bool = False, **kw):
         '''
         Creates linker and apply it to the targetClass, then store it with generated name or given name, or orphan it.
 
@@ -194,6 +686,7 @@ class LinkManager:
         setterConverter:Callable is the function that gets called to process a replacement before being set to the sourceVar
         setterOverrider:Callable is the function that gets called to do the setter process
         doc:str is the documentation string (docstring) for the property
+        accessSpec:tuple is an optional description of what the converters do, see Linker
         setupOptions:dict extra setup options for the linker.setup method in the form of a dictionary
         name:str the name to be paired with the linker in the Manager's hashmap
         orphan:bool whether to orphan the linker after linking. Meaning leaving no bindings between the linker and manager. Defaults to False.
@@ -204,16 +697,32 @@ class LinkManager:
         setupOptions = DictUpdater(self.linkerSetupOptions, setupOptions)
         # print(setupOptions) # DEBUG
         if orphan:
-            linker = self.linkerClass(sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc)
+            linker = self.linkerClass(sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc, accessSpec=accessSpec)
             linker.setup(**setupOptions)
             linker.apply(targetClass, targetVar)
             # del linker
             return linker
         
+        generated = not name
         # Generate a name if not given, though not nice looking, it should not be possible for any duplicates under normal usage, 
         # where each targetVar for each class is used once only.
         name = str(name or '{}-class:{};source:{};target:{}'.format('%s(%s)' % (self.linkerClass.__name__, id(self.linkerClass)), 
                                                                     '%s(%s)' % (targetClass.__name__, id(targetClass)), 
                                                                     sourceVar, targetVar))
-        self.createLinker(name, sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc, setupOptions=setupOptions, **kw)
-        self.applyLinker(name, targetClass, targetVar)
+        with self._lock: # Creating and applying as one step, so concurrent binds never see the linker unapplied
+            if generated and name in self.linkers: # Rebinding the same link, Ex: to another key, it replaces the current linker once applied
+                base, count = name, 2
+                while name in self.linkers:
+                    name, count = '{}#{}'.format(base, count), count + 1
+            self.createLinker(name, sourceVar, getterConverter=getterConverter, setterConverter=setterConverter, setterOverrider=setterOverrider, doc=doc, accessSpec=accessSpec, setupOptions=setupOptions, **kw)
+            if generated:
+                self._own(targetClass, name)
+            self.applyLinker(name, targetClass, targetVar)
+
+    def _own(self, targetClass: type, linkerName: str):
+        '''Marks the linker as generated for targetClass, so it gets removed along with the class.'''
+        ownedNames = self._ownedNames.get(targetClass)
+        if ownedNames is None:
+            ownedNames = self._ownedNames[targetClass] = set()
+            weakref.finalize(targetClass, LinkManager._purgeOwned, weakref.ref(self), ownedNames).atexit = False
+        ownedNames.add(linkerName)
@@ -0,0 +1,160 @@
+import copy
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+
+from typing import Callable, Iterable
+
+
+Change = namedtuple('Change', ['instance', 'targetVar', 'old', 'new'])
+
+_UNREADABLE = object() # Snapshot value of linked attributes which could not be read, Ex: linkList on an empty list
+_COPIED = (list, dict, set, bytearray) # Mutable values snapshotted as deep copies, so their in-place changes are detected
+
+
+class ChangeTracker:
+    '''
+    Opt-in change tracking for linked instances, get one with LinkManager.enableChangeTracking().
+    Tracked instances have their linked attributes snapshotted, after a refresh of their sources, ChangeTracker.refresh compares them with the snapshot,
+    records which targetVars changed per instance, and notifies the subscribers once per refresh with every change of their class and attribute.
+    Lists, dictionaries, sets and bytearrays are snapshotted as deep copies, so changing them in place (Ex: user.sent_messages.append(...)) is detected.
+    Other mutable objects are snapshotted by reference and compared with ==, so only replacing them is detected.
+    Tracked instances must be weak referenceable.
+    '''
+
+    __slots__ = ['manager', 'snapshots', 'changes', 'subscribers', '_fields', '_batchDepth']
+
+    def __init__(self, manager):
+        '''
+        Params
+        ------
+        manager:LinkManager is the manager whose links are tracked
+        '''
+        self.manager = manager
+        self.snapshots = weakref.WeakKeyDictionary() # Ex: {instance: {targetVar: value,...},...}
+        self.changes = weakref.WeakKeyDictionary() # targetVars changed on the last refresh of an instance, Ex: {instance: frozenset({targetVar,...}),...}
+        self.subscribers = weakref.WeakKeyDictionary() # Ex: {targetClass: {targetVar: [callback,...],...},...}, targetVar None subscribes to every attribute
+        self._fields = weakref.WeakKeyDictionary() # Cached linked targetVars per class, Ex: {Class1: (managerVersion, targetVars),...}
+        self._batchDepth = 0
+
+    def __repr__(self):
+        return "<{} Tracked={} Subscriptions={}>".format(self.__class__.__name__, len(self.snapshots), sum(len(subscribed) for subscribed in self.subscribers.values()))
+
+    def fieldsOf(self, targetClass: type):
+        '''Returns the linked targetVars of given class, read again once the manager's links changed.'''
+        cached = self._fields.get(targetClass)
+        version = self.manager.version
+        if cached is None or cached[0] != version:
+            cached = self._fields[targetClass] = (version, tuple(self.manager.linkersOf(targetClass)))
+        return cached[1]
+
+    def forget(self, targetClass: type = None):
+        '''Clears the cached linked targetVars of given class, or of every class if None.'''
+        if targetClass is None:
+            self._fields.clear()
+        else:
+            self._fields.pop(targetClass, None)
+
+    def _read(self, instance):
+        values = {}
+        for targetVar in self.fieldsOf(type(instance)):
+            try:
+                values[targetVar] = getattr(instance, targetVar)
+            except (LookupError, AttributeError):
+                values[targetVar] = _UNREADABLE
+        return values
+
+    @staticmethod
+    def _frozen(value):
+        '''Returns the value to keep in a snapshot, a deep copy of a mutable value so its in-place changes are detected.'''
+        if isinstance(value, _COPIED):
+            try:
+                return copy.deepcopy(value)
+            except Exception: # Ex: holds a lock, compared by reference then
+                pass
+        return value
+
+    def track(self, instance):
+        '''Starts tracking given instance, taking a snapshot of its linked attributes.'''
+        self.snapshots[instance] = {targetVar: self._frozen(value) for targetVar, value in self._read(instance).items()}
+        self.changes[instance] = frozenset()
+
+    def untrack(self, instance):
+        '''Stops tracking given instance.'''
+        self.snapshots.pop(instance, None)
+        self.changes.pop(instance, None)
+
+    def changed(self, instance) -> frozenset:
+        '''Returns the targetVars of given instance which changed on its last refresh.'''
+        return self.changes.get(instance, frozenset())
+
+    def subscribe(self, targetClass: type, targetVar: str, callback: Callable):
+        '''
+        Subscribes callback to the changes of targetVar on instances of targetClass (and its subclasses).
+        The callback is called once per refresh, with a list of Change(instance, targetVar, old, new). targetVar None subscribes to every linked attribute.
+        '''
+        self.subscribers.setdefault(targetClass, {}).setdefault(targetVar, []).append(callback)
+
+    def unsubscribe(self, targetClass: type, targetVar: str, callback: Callable):
+        subscribed = self.subscribers.get(targetClass, {})
+        callbacks = subscribed.get(targetVar, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            subscribed.pop(targetVar, None)
+            if not subscribed:
+                self.subscribers.pop(targetClass, None)
+
+    def refresh(self, instances: Iterable = None):
+        '''
+        Compares the linked attributes of given tracked instances (every tracked instance if None) with their snapshot,
+        then notifies the subscribers with the changes. Returns the list of changes.
+        '''
+        if instances is None:
+            instances = list(self.snapshots.keys())
+        found = []
+        for instance in instances:
+            snapshot = self.snapshots.get(instance)
+            if snapshot is None:
+                continue
+            current = self._read(instance)
+            changedVars = [targetVar for targetVar, value in current.items() if snapshot.get(targetVar, _UNREADABLE) != value]
+            self.snapshots[instance] = {targetVar: snapshot[targetVar] if targetVar in snapshot and targetVar not in changedVars else self._frozen(value)
+                                        for targetVar, value in current.items()} # Only changed values are copied again
+            self.changes[instance] = frozenset(changedVars)
+            found.extend(Change(instance, targetVar, snapshot.get(targetVar, _UNREADABLE), current[targetVar]) for targetVar in changedVars)
+        self.notify(found)
+        return found
+
+    def notify(self, changes: list):
+        '''Dispatches changes to the subscribers, every subscriber is called at most once.'''
+        if not changes or not self.subscribers:
+            return
+        grouped = {}
+        for change in changes:
+            for targetClass in type(change.instance).__mro__:
+                subscribed = self.subscribers.get(targetClass)
+                if subscribed is None:
+                    continue
+                for targetVar in (change.targetVar, None):
+                    if targetVar in subscribed:
+                        grouped.setdefault((targetClass, targetVar), []).append(change)
+        for (targetClass, targetVar), keyChanges in grouped.items():
+            for callback in list(self.subscribers.get(targetClass, {}).get(targetVar, [])):
+                callback(keyChanges)
+
+    @contextmanager
+    def batch(self, instances: Iterable = None):
+        '''
+        Context manager for a refresh, ChangeTracker.refresh is called with given instances on exit of the outermost batch.
+        Example:
+        with tracker.batch():
+            for user in users: user.fetchData()
+        '''
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+        if self._batchDepth == 0:
+            self.refresh(instances)
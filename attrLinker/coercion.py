@@ -0,0 +1,140 @@
+import datetime
+import enum
+
+from typing import Any, Callable
+
+from .exceptions import CoercionError
+
+
+_TRUE = {'true', '1', 'yes', 'on', 't', 'y'}
+_FALSE = {'false', '0', 'no', 'off', 'f', 'n', ''}
+
+
+def _parseBool(raw) -> bool:
+    if isinstance(raw, (int, float)):
+        return bool(raw)
+    text = raw.strip().lower() if isinstance(raw, str) else raw
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError("Invalid boolean {!r}".format(raw))
+
+
+def _parseDatetime(raw) -> datetime.datetime:
+    if isinstance(raw, (int, float)): # Unix timestamp
+        return datetime.datetime.fromtimestamp(raw, datetime.timezone.utc)
+    if raw.endswith('Z'): # Not supported by fromisoformat before Python 3.11
+        raw = raw[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(raw)
+
+
+def _enumParser(enumClass: type) -> Callable[[Any], enum.Enum]:
+    def parse(raw):
+        try:
+            return enumClass(raw)
+        except ValueError:
+            return enumClass[raw] # By member name
+    return parse
+
+
+class Coercer:
+    '''
+    Typed conversion of a raw source value, Ex: '42' to 42. Values already of the target type, and None, are returned as is. Get one with coercerOf.
+    With memoize=True, parsed values are memoized by the raw value, so repeated reads of the same string skip parsing, and the last parsed string is also
+    checked by identity first. Memoized values are shared by every instance reading the same string, so only coercers returning immutable values
+    should memoize, which the ones of coercerOf for built-in types do. Ex: a json.loads coercer must not, instances would share and mutate the same dict.
+    '''
+
+    __slots__ = ['targetType', 'parse', 'serialize', 'maxSize', 'cache', '_last']
+
+    def __init__(self, targetType: type, parse: Callable[[Any], Any], serialize: Callable[[Any], Any] = None, maxSize: int = 4096, memoize: bool = False):
+        '''
+        Params
+        ------
+        targetType:type is the type of the coerced values, None if not known (Ex: a callable)
+        parse:Callable converts a raw value to the target type
+        serialize:Callable converts a value back to its raw form (the wire format) for setters, None to set values as is
+        maxSize:int is the amount of parsed strings kept, the memo is cleared once it is reached
+        memoize:bool whether to memoize the parsed strings, only for parse functions returning immutable values. Defaults to False
+        '''
+        self.targetType = targetType
+        self.parse = parse
+        self.serialize = serialize
+        self.maxSize = maxSize
+        self.cache = {} if memoize else None # Ex: {'42': 42,...}
+        self._last = (None, None) # Last parsed string and its value, as one tuple so threads never see them mismatched
+
+    def __repr__(self):
+        return "<{} Type={} Cached={}>".format(self.__class__.__name__, getattr(self.targetType, '__name__', self.parse), None if self.cache is None else len(self.cache))
+
+    def __call__(self, raw):
+        if raw is None or (self.targetType is not None and type(raw) is self.targetType):
+            return raw
+        if type(raw) is not str or self.cache is None:
+            return self.parse(raw)
+        last = self._last # Only strings are memoized, they are immutable and are the payloads which are costly to parse
+        if raw is last[0]:
+            return last[1]
+        value = self.cache.get(raw, self)
+        if value is self:
+            if len(self.cache) >= self.maxSize:
+                self.cache.clear()
+            value = self.cache[raw] = self.parse(raw)
+        self._last = (raw, value)
+        return value
+
+    def dump(self, value):
+        '''Returns value in its raw form for the source.'''
+        if self.serialize is None or value is None:
+            return value
+        return self.serialize(value)
+
+
+def coercerOf(coerce) -> Coercer:
+    '''
+    Returns the Coercer for given coerce option of a preset.
+
+    Params
+    ------
+    coerce:int, float, bool, str, datetime.datetime, datetime.date, an Enum class, a Coercer, a (parse, serialize) tuple, or a callable parsing the raw value,
+    whose values are set as is. Only the built-in types are memoized, pass a Coercer with memoize=True to memoize a callable returning immutable values
+    '''
+    if isinstance(coerce, Coercer):
+        return coerce
+    if isinstance(coerce, tuple):
+        return Coercer(None, *coerce)
+    if coerce is bool:
+        return Coercer(bool, _parseBool, lambda value: 'true' if value else 'false', memoize=True)
+    if coerce in (int, float, str):
+        return Coercer(coerce, coerce, str, memoize=True)
+    if coerce is datetime.datetime:
+        return Coercer(coerce, _parseDatetime, datetime.datetime.isoformat, memoize=True)
+    if coerce is datetime.date:
+        return Coercer(coerce, datetime.date.fromisoformat, datetime.date.isoformat, memoize=True)
+    if isinstance(coerce, type) and issubclass(coerce, enum.Enum):
+        return Coercer(coerce, _enumParser(coerce), lambda member: member.value, memoize=True)
+    if callable(coerce):
+        return Coercer(None, coerce)
+    raise TypeError("Can not coerce to {!r}.".format(coerce))
+
+
+def coercing(coercer: Coercer, getterConverter: Callable, describe: Callable[[], tuple]) -> Callable:
+    '''
+    Returns getterConverter followed by the coercer, raising CoercionError instead of the errors of parsing.
+
+    Params
+    ------
+    coercer:Coercer is the coercion of the values read by getterConverter
+    getterConverter:Callable reads the raw value from the source
+    describe:Callable returns the (linker, targetVar) to report in CoercionError
+    '''
+    def convert(source):
+        raw = getterConverter(source)
+        try:
+            return coercer(raw)
+        except (ValueError, TypeError, KeyError, OverflowError) as exc:
+            linker, targetVar = describe()
+            raise CoercionError("Could not coerce {!r} to {} for linked attribute '{}'.".format(raw, getattr(coercer.targetType, '__name__', 'the target type'), targetVar),
+                                linker=linker, targetVar=targetVar, value=raw) from exc
+    return convert
@@ -0,0 +1,144 @@
+from collections import namedtuple
+
+from typing import Any, Callable, Dict, Iterable
+
+from .changeTracker import ChangeTracker
+from .index import indexesOf
+from .derived import derivedOf
+
+
+RefreshResult = namedtuple('RefreshResult', ['added', 'removed', 'changed'])
+
+
+def updateSource(source: dict, payload: dict) -> bool:
+    '''
+    Updates the source dictionary in place to match the payload, only touching the keys whose value changed.
+    Returns whether anything was changed.
+    '''
+    if source == payload:
+        return False
+    for key, value in payload.items():
+        if key not in source or source[key] != value:
+            source[key] = value
+    if len(source) != len(payload):
+        for key in [key for key in source if key not in payload]:
+            del source[key]
+    return True
+
+
+class LinkedCollection:
+    '''
+    Keyed collection of linked instances, where each instance's source is a dictionary from a server response.
+    LinkedCollection.refresh creates, updates and retires the instances in a single pass over the payloads.
+    If the linked class declares __INDEXES__, the instances of the collection are kept in its indexes.
+    Derived attributes of the changed instances are invalidated on refresh, see linkDerived.
+    '''
+
+    __slots__ = ['linkedClass', 'sourceVar', 'keyField', 'factory', 'onRetire', 'tracker', 'indexes', 'derived', 'instances']
+
+    def __init__(self, linkedClass: type, sourceVar: str, keyField: str, factory: Callable[[dict], Any] = None, onRetire: Callable[[Any], Any] = None, tracker: ChangeTracker = None):
+        '''
+        Params
+        ------
+        linkedClass:type is the linked class of the instances in the collection
+        sourceVar:str is the source attribute name of an instance, which holds the payload dictionary
+        keyField:str is the key in the payload dictionaries which identifies an instance
+        factory:Callable is called with a payload to create a new instance. If None, linkedClass is called without arguments, then the payload is set to its sourceVar.
+        onRetire:Callable is called with every instance which is removed from the collection on refresh
+        tracker:ChangeTracker if given, instances are tracked while in the collection, and only the changed instances are compared on refresh
+        '''
+        self.linkedClass = linkedClass
+        self.sourceVar = sourceVar
+        self.keyField = keyField
+        self.factory = factory
+        self.onRetire = onRetire
+        self.tracker = tracker
+        self.indexes = indexesOf(linkedClass)
+        self.derived = derivedOf(linkedClass)
+        self.instances = {} # Ex: {key1: instance1, key2: instance2,...}
+
+    def __repr__(self):
+        return "<{} Class={} Key={} Count={}>".format(self.__class__.__name__, self.linkedClass.__name__, self.keyField, len(self.instances))
+
+    def __len__(self):
+        return len(self.instances)
+
+    def __iter__(self):
+        return iter(self.instances.values())
+
+    def __contains__(self, key):
+        return key in self.instances
+
+    def __getitem__(self, key):
+        return self.instances[key]
+
+    def get(self, key, default=None):
+        return self.instances.get(key, default)
+
+    def keys(self):
+        return self.instances.keys()
+
+    def createInstance(self, payload: dict):
+        '''Creates a new instance with the payload as its source. The payload is used as is, without copying.'''
+        if self.factory is not None:
+            instance = self.factory(payload)
+        else:
+            instance = self.linkedClass()
+            setattr(instance, self.sourceVar, payload)
+        if self.tracker is not None:
+            self.tracker.track(instance)
+        if self.indexes is not None:
+            self.indexes.add(instance)
+        return instance
+
+    def refresh(self, payloads: Iterable[Dict[str, Any]], partial: bool = False) -> RefreshResult:
+        '''
+        Refreshes the collection with given payloads in one pass.
+        New keys get a new instance, which uses the payload as its source. Existing instances keep their source dictionary, only updating the keys whose value changed.
+        Instances whose key is not found in the payloads are retired, unless partial is True.
+
+        Params
+        ------
+        payloads:Iterable of dictionaries, each one containing the keyField
+        partial:bool whether the payloads only contain a part of the collection, which disables retiring missing instances. Defaults to False
+        '''
+        instances = self.instances
+        sourceVar, keyField = self.sourceVar, self.keyField
+        getInstance = instances.get
+        added = 0
+        changed = []
+        seen = set()
+        markSeen = seen.add
+        for payload in payloads:
+            key = payload[keyField]
+            markSeen(key)
+            instance = getInstance(key)
+            if instance is None:
+                instances[key] = self.createInstance(payload)
+                added += 1
+            elif updateSource(getattr(instance, sourceVar), payload):
+                changed.append(instance)
+
+        removed = 0
+        if not partial and len(seen) != len(instances):
+            for key in [key for key in instances if key not in seen]:
+                removed += 1
+                self.retire(key)
+        if self.derived is not None: # Before anything reads the changed instances
+            self.derived.invalidateMany(changed)
+        if self.tracker is not None:
+            self.tracker.refresh(changed)
+        if self.indexes is not None:
+            self.indexes.updateMany(changed)
+        return RefreshResult(added, removed, len(changed))
+
+    def retire(self, key):
+        '''Removes the instance with given key from the collection, calling onRetire with it if set.'''
+        instance = self.instances.pop(key)
+        if self.tracker is not None:
+            self.tracker.untrack(instance)
+        if self.indexes is not None:
+            self.indexes.remove(instance)
+        if self.onRetire is not None:
+            self.onRetire(instance)
+        return instance
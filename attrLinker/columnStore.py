@@ -0,0 +1,137 @@
+from array import array
+
+from typing import Any, Callable, Dict, Iterable
+
+try:
+    import numpy
+except ImportError: # NumPy is optional, only needed for ColumnStore(useNumpy=True)
+    numpy = None
+
+
+class ColumnStore:
+    '''
+    Columnar storage shared by many linked instances, where every instance owns a row and holds its row index as its source.
+    Each column is an array.array of given typecode (a list for typecode None), or a field of a NumPy structured array if useNumpy is True.
+    Per-row reads and writes are done by the linkers, whole-column reads and writes are done directly on the store.
+    Whole-column operations (add, apply) are only vectorized with useNumpy=True, array.array columns are processed value by value in Python.
+
+    Example:
+    STORE = ColumnStore({'onlineTime': 'd', 'status': None})
+    STORE.add('onlineTime', 10) # Increments onlineTime of every row
+    '''
+
+    __slots__ = ['layout', 'useNumpy', 'columns', 'data', 'capacity', 'rows', '_freeRows']
+
+    def __init__(self, layout: Dict[str, str], capacity: int = 1024, useNumpy: bool = False):
+        '''
+        Params
+        ------
+        layout:dict is the mapping of column name to array typecode, Ex: {'onlineTime': 'd', 'id': 'q', 'name': None}. Typecode None makes an object column.
+        capacity:int is the initial amount of rows, the store grows by itself when it runs out of rows.
+        useNumpy:bool whether to store the columns in a NumPy structured array instead of array.array
+        '''
+        if useNumpy and numpy is None:
+            raise ImportError("ColumnStore(useNumpy=True) requires numpy to be installed.")
+        self.layout = dict(layout)
+        self.useNumpy = useNumpy
+        self.columns = {} # Ex: {'onlineTime': array('d', [...]),...}, updated in place to the current storage of each column when the store grows
+        self.data = None # The NumPy structured array, if useNumpy is True
+        self.capacity = 0
+        self.rows = 0 # Rows handed out so far, including released rows which have not been reused yet, whole-column operations span them
+        self._freeRows = []
+        self._grow(max(capacity, 1))
+
+    def __repr__(self):
+        return "<{} Columns={} Rows={} Capacity={}>".format(self.__class__.__name__, list(self.layout), self.size, self.capacity)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def size(self) -> int:
+        '''Amount of live rows, released rows excluded.'''
+        return self.rows - len(self._freeRows)
+
+    def _grow(self, capacity: int):
+        '''Grows every column up to given capacity.'''
+        extra = capacity - self.capacity
+        if self.useNumpy:
+            dtype = [(name, typecode or 'O') for name, typecode in self.layout.items()]
+            data = numpy.zeros(capacity, dtype=dtype)
+            if self.data is not None:
+                data[:self.capacity] = self.data
+            self.data = data
+            self.columns.update((name, data[name]) for name in self.layout)
+        else:
+            for name, typecode in self.layout.items():
+                column = self.columns.get(name)
+                if typecode is None:
+                    self.columns[name] = (column or []) + [None] * extra
+                elif column is None:
+                    self.columns[name] = array(typecode, bytes(array(typecode).itemsize * extra))
+                else:
+                    column.extend(array(typecode, bytes(column.itemsize * extra)))
+        self.capacity = capacity
+
+    def _reset(self, row: int):
+        '''Resets the values of given row.'''
+        for name, typecode in self.layout.items():
+            self.columns[name][row] = None if typecode is None else 0
+
+    def allocate(self, **values) -> int:
+        '''
+        Allocates a row and returns its index, reusing released rows first.
+        Keyword arguments passed are set as the initial values of the row, Ex: store.allocate(onlineTime=0, status='idle')
+        '''
+        if self._freeRows:
+            row = self._freeRows.pop()
+        else:
+            if self.rows == self.capacity:
+                self._grow(self.capacity * 2)
+            row = self.rows
+            self.rows += 1
+        for name, value in values.items():
+            self.columns[name][row] = value
+        return row
+
+    def release(self, row: int):
+        '''Releases given row to be reused by the next allocation.'''
+        self._reset(row)
+        self._freeRows.append(row)
+
+    def get(self, row: int, column: str):
+        return self.columns[column][row]
+
+    def set(self, row: int, column: str, value: Any):
+        self.columns[column][row] = value
+
+    def values(self, column: str):
+        '''Returns the whole column, of the first ColumnStore.rows rows, released rows included. A view for NumPy columns, a copy otherwise.'''
+        return self.columns[column][:self.rows]
+
+    def setValues(self, column: str, values: Iterable):
+        '''Sets the whole column, of the first ColumnStore.rows rows, to given values, which must be of the same length.'''
+        if not self.useNumpy:
+            values = list(values) if self.layout[column] is None else array(self.layout[column], values)
+        if len(values) != self.rows:
+            raise ValueError("Expected {} values for column '{}', got {}.".format(self.rows, column, len(values)))
+        self.columns[column][:self.rows] = values
+
+    def apply(self, column: str, func: Callable):
+        '''
+        Replaces every value of the column with func(value). For NumPy columns, func is called once with the whole column instead.
+        Without NumPy this is not vectorized, func is called per value, in a single map over the column which is then assigned back as one slice.
+        '''
+        if self.useNumpy:
+            self.columns[column][:self.rows] = func(self.columns[column][:self.rows])
+            return
+        values = map(func, self.columns[column][:self.rows])
+        typecode = self.layout[column]
+        self.columns[column][:self.rows] = list(values) if typecode is None else array(typecode, values)
+
+    def add(self, column: str, delta: Any):
+        '''Adds delta to every value of the column. Vectorized for NumPy columns, see apply otherwise.'''
+        if self.useNumpy:
+            self.columns[column][:self.rows] += delta
+        else:
+            self.apply(column, lambda value: value + delta)
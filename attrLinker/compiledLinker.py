@@ -0,0 +1,250 @@
+from .attrLinker import Linker
+from .textTemplate import CompiledTemplate
+from .columnStore import ColumnStore
+from .pathResolver import PathResolver
+from .recordLayout import RecordLayout
+from .sequences import replaced
+
+
+class LinkDescriptor:
+    '''
+    Slotted data descriptor used by CompiledLinker in place of property + closures.
+    Reads go straight from the descriptor to the converter, without looking up the converters on the linker on every access.
+    '''
+
+    __slots__ = ['linker', 'sourceVar', 'getterConverter', 'setterConverter', 'setterOverrider', 'enableSetter', 'doc']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True):
+        '''
+        Params
+        ------
+        linker:Linker is the linker which owns the descriptor, its converters are captured on creation.
+        enableSetter:bool whether to enable setter for the descriptor or not.
+        '''
+        self.linker = linker
+        self.sourceVar = linker.sourceVar
+        self.getterConverter = linker.getterConverter
+        self.setterConverter = linker.setterConverter
+        self.setterOverrider = linker.setterOverrider
+        self.enableSetter = enableSetter
+        self.doc = linker.doc
+
+    def __repr__(self):
+        return "<{} SourceVar={} Setter={}>".format(self.__class__.__name__, self.sourceVar, self.enableSetter)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.getterConverter(getattr(instance, self.sourceVar))
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        if self.setterOverrider is None:
+            setattr(instance, self.sourceVar, self.setterConverter(instance, replacement))
+        else:
+            self.setterOverrider(instance, self.sourceVar, replacement)
+
+    def __delete__(self, instance):
+        raise AttributeError("can't delete attribute")
+
+
+class DictItemDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkDictionary, accessSpec=('item', key, default, copyOnWrite)'''
+
+    __slots__ = ['key', 'default', 'copyOnWrite']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, key=None, default=None, copyOnWrite: bool = False):
+        super().__init__(linker, enableSetter)
+        self.key = key
+        self.default = default
+        self.copyOnWrite = copyOnWrite
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.sourceVar).get(self.key, self.default)
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        if not self.copyOnWrite:
+            getattr(instance, self.sourceVar)[self.key] = replacement
+            return
+        source = getattr(instance, self.sourceVar).copy()
+        source[self.key] = replacement
+        setattr(instance, self.sourceVar, source)
+
+
+class IndexDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkList, accessSpec=('index', index)'''
+
+    __slots__ = ['index']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, index: int = 0):
+        super().__init__(linker, enableSetter)
+        self.index = index
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self.sourceVar)[self.index]
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        source = getattr(instance, self.sourceVar)
+        try:
+            source[self.index] = replacement
+        except TypeError: # Immutable sequence, Ex: a tuple
+            setattr(instance, self.sourceVar, replaced(source, self.index, replacement))
+
+
+class AttributeDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkObject, accessSpec=('attribute', attributeName)'''
+
+    __slots__ = ['attribute']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, attribute: str = None):
+        super().__init__(linker, enableSetter)
+        self.attribute = attribute
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(getattr(instance, self.sourceVar), self.attribute)
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        setattr(getattr(instance, self.sourceVar), self.attribute, replacement)
+
+
+class TemplateDescriptor(LinkDescriptor):
+    '''Specialized descriptor for formattedTextFromDict, accessSpec=('template', compiledTemplate)'''
+
+    __slots__ = ['template']
+
+    def __init__(self, linker: Linker, enableSetter: bool = False, template: CompiledTemplate = None):
+        super().__init__(linker, enableSetter)
+        self.template = template
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.template.render(getattr(instance, self.sourceVar))
+
+
+class ColumnDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkColumn, accessSpec=('column', store, column)'''
+
+    __slots__ = ['columns', 'column']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, store: ColumnStore = None, column: str = None):
+        super().__init__(linker, enableSetter)
+        self.columns = store.columns
+        self.column = column
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.columns[self.column][getattr(instance, self.sourceVar)]
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        self.columns[self.column][getattr(instance, self.sourceVar)] = replacement
+
+
+class PathDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkPath, accessSpec=('path', pathResolver, default)'''
+
+    __slots__ = ['resolver', 'resolve', 'default']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, resolver: PathResolver = None, default=None):
+        super().__init__(linker, enableSetter)
+        self.resolver = resolver
+        self.resolve = resolver.get
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.resolve(getattr(instance, self.sourceVar), self.default)
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        self.resolver.set(getattr(instance, self.sourceVar), replacement)
+
+
+class SharedRecordDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkSharedRecord, accessSpec=('sharedRecord', layout, field)'''
+
+    __slots__ = ['read', 'field']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, layout: RecordLayout = None, field: str = None):
+        super().__init__(linker, enableSetter)
+        self.read = layout.reader(field)
+        self.field = field
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        record = getattr(instance, self.sourceVar)
+        return self.read(record.buffer, record.offset)
+
+    def __set__(self, instance, replacement):
+        if not self.enableSetter:
+            raise AttributeError("can't set attribute")
+        getattr(instance, self.sourceVar).update(**{self.field: replacement})
+
+
+class StructDescriptor(LinkDescriptor):
+    '''Specialized descriptor for linkStruct, accessSpec=('struct', layout, field)'''
+
+    __slots__ = ['read']
+
+    def __init__(self, linker: Linker, enableSetter: bool = True, layout: RecordLayout = None, field: str = None):
+        super().__init__(linker, enableSetter)
+        self.read = layout.reader(field)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.read(getattr(instance, self.sourceVar), 0)
+
+
+# Maps accessSpec kinds to their specialized descriptor, anything not found here falls back to LinkDescriptor.
+DESCRIPTORS = {'item': DictItemDescriptor, 'index': IndexDescriptor, 'attribute': AttributeDescriptor, 'template': TemplateDescriptor, 'column': ColumnDescriptor, 'path': PathDescriptor, 'sharedRecord': SharedRecordDescriptor, 'struct': StructDescriptor}
+
+
+class CompiledLinker(Linker):
+    '''
+    Linker which compiles its link into a slotted descriptor, specialized on the linker's accessSpec when possible.
+    Opt in with LinkManager.changeLinkerClass(CompiledLinker).
+
+    Note that the converters are captured when setup is called, changing them on the linker afterwards requires calling setup again.
+    '''
+
+    __slots__ = []
+
+    @property
+    def ready(self):
+        '''Whether the linker has been set up or not.'''
+        return isinstance(self.property, LinkDescriptor)
+
+    def setup(self, enableSetter: bool = True):
+        '''
+        Sets up the linker's descriptor. This method needs to be called before applying.
+
+        Params
+        ------
+        enableSetter:bool whether to enable setter for the descriptor or not. Defaults to True(full access link)
+        '''
+        kind, *specArgs = self.accessSpec or (None,)
+        if kind in DESCRIPTORS:
+            self.property = DESCRIPTORS[kind](self, enableSetter, *specArgs)
+        else: # Read through the converters
+            self.property = LinkDescriptor(self, enableSetter)
+        return self
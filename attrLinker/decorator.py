@@ -1,7 +1,162 @@
+import itertools
+import threading
+import weakref
 
-def LinkedClass(cls):
+from typing import Iterable
+
+from .attrLinker import LinkManager
+from .exceptions import LinkerException
+from .index import indexesOf
+
+
+_PENDING_LINKS = weakref.WeakKeyDictionary() # Links of lazy linked classes which are not applied yet, Ex: {Class1: [PreparedLink,...],...}
+_MATERIALIZE_LOCKS = weakref.WeakKeyDictionary() # Serializes applying the pending links per class, Ex: {Class1: RLock,...}
+_MATERIALIZING = weakref.WeakSet() # Classes whose pending links are being applied, by the thread holding their lock
+
+
+class LazyLink:
+    '''Placeholder installed at the target variables of a lazy LinkedClass, which applies the pending links of the class on first access.'''
+
+    __slots__ = ['targetClass', 'targetVar']
+
+    def __init__(self, targetClass: type, targetVar: str):
+        self.targetClass = targetClass
+        self.targetVar = targetVar
+
+    def __repr__(self):
+        return "<{} {}.{}>".format(self.__class__.__name__, self.targetClass.__name__, self.targetVar)
+
+    def _materialize(self):
+        materializeLinks(self.targetClass)
+        descriptor = self.targetClass.__dict__.get(self.targetVar)
+        if descriptor is None or isinstance(descriptor, LazyLink):
+            raise LinkerException("Lazy link {}.{} was not applied by the links of the class.".format(self.targetClass.__name__, self.targetVar))
+        return descriptor
+
+    def __get__(self, instance, owner=None):
+        return self._materialize().__get__(instance, owner)
+
+    def __set__(self, instance, replacement):
+        self._materialize().__set__(instance, replacement)
+
+    def __delete__(self, instance):
+        self._materialize().__delete__(instance)
+
+
+def materializeLinks(cls: type):
+    '''
+    Applies the pending links of a lazy LinkedClass and of its bases. Does nothing for classes without pending links.
+    Threads materializing the same class wait for the first one. If a link fails to apply, the links left are kept pending and the error is raised.
+    '''
+    for klass in reversed(cls.__mro__):
+        if klass not in _PENDING_LINKS:
+            continue
+        with _MATERIALIZE_LOCKS[klass]:
+            if klass in _MATERIALIZING: # Looked up again while its links are applied, by the same thread
+                continue
+            links = _PENDING_LINKS.get(klass)
+            if not links: # Applied by another thread meanwhile
+                continue
+            _MATERIALIZING.add(klass)
+            try:
+                for idx, link in enumerate(links):
+                    try:
+                        link.apply(klass)
+                    except Exception:
+                        _PENDING_LINKS[klass] = links[idx:]
+                        raise
+                del _PENDING_LINKS[klass]
+            finally:
+                _MATERIALIZING.discard(klass)
+            for targetVar, value in list(klass.__dict__.items()):
+                if isinstance(value, LazyLink) and value.targetClass is klass: # Leftovers, if a link did not apply at every predicted target
+                    delattr(klass, targetVar)
+    return cls
+
+
+def _slotNames(cls: type) -> set:
+    '''Returns the names of the slots of cls and its bases, including __dict__ and __weakref__ if instances have them.'''
+    names = set()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        names.update([slots] if isinstance(slots, str) else slots)
+        if klass is not object and '__slots__' not in klass.__dict__:
+            names.update(['__dict__', '__weakref__'])
+    return names
+
+
+def slottedClass(cls: type, extraSlots: Iterable[str] = ()) -> type:
+    '''
+    Recreates cls with __slots__ holding the source variables of its __LINKS__ and extraSlots, instead of a __dict__ per instance.
+    Sources which are linked attributes themselves (chained links) need no slot. __weakref__ is added, as change tracking and snapshots
+    keep weak references to instances. Instances only lose their __dict__ if every base of cls has __slots__ too.
+
+    Params
+    ------
+    cls:type is the class to be recreated, its links must not be applied yet
+    extraSlots:Iterable is the names of the other instance attributes
+    '''
+    links = cls.__LINKS__ or []
+    targetVars = set()
+    for link in links:
+        targetVars.update(link.targetVars() or ())
+    inherited = set().union(*map(_slotNames, cls.__bases__))
+    declared = cls.__dict__.get('__slots__', ())
+    declared = [declared] if isinstance(declared, str) else list(declared)
+    slots = []
+    for name in itertools.chain(declared, [link.sourceVar for link in links if isinstance(link.sourceVar, str)], extraSlots, ['__weakref__']):
+        if name not in targetVars and name not in inherited and name not in slots:
+            slots.append(name)
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in ('__dict__', '__weakref__') and key not in declared}
+    namespace['__slots__'] = tuple(slots)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    for value in namespace.values(): # Methods using super() or __class__ refer to the original class through their __class__ cell
+        for func in (value, getattr(value, '__func__', None), getattr(value, 'fget', None), getattr(value, 'fset', None)):
+            for cell in getattr(func, '__closure__', None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted
+                except ValueError: # Empty cell
+                    pass
+    return slotted
+
+
+def LinkedClass(cls: type = None, lazy: bool = False, fuse: bool = False, slots: bool = False, extraSlots: Iterable[str] = ()):
+    '''
+    Class decorator which applies the links in the class' __LINKS__. Use as @LinkedClass, or @LinkedClass(lazy=True, fuse=True).
+    Indexes in the class' __INDEXES__ are registered as the class' IndexSet, see indexesOf.
+
+    Params
+    ------
+    cls:type is the class to be linked
+    lazy:bool whether to postpone applying the links until one of the linked attributes is first accessed, or the class' linkers are looked up.
+    Placeholders are installed at the target variables meanwhile. Defaults to False
+    fuse:bool whether to fuse the chained links of the class, so a link reading another linked attribute of the class reads its root source directly,
+    see LinkManager.fuse. Defaults to False
+    slots:bool whether to return a copy of the class with __slots__ for the source variables of the links and extraSlots, instead of a __dict__ per instance,
+    see slottedClass. Defaults to False
+    extraSlots:Iterable is the names of the other instance attributes, when slots is True
+    '''
+    if cls is None:
+        return lambda cls: LinkedClass(cls, lazy=lazy, fuse=fuse, slots=slots, extraSlots=extraSlots)
+    if slots:
+        cls = slottedClass(cls, extraSlots)
+    if cls.__dict__.get('__INDEXES__'):
+        indexesOf(cls)
     if cls.__LINKS__ is None:
         return cls
+    if fuse:
+        LinkManager._getDefault().fuse(cls) # Before the links are applied, which then get fused as they are applied
+    if lazy:
+        targets = [link.targetVars() for link in cls.__LINKS__]
+        if None not in targets: # Otherwise the links could not be predicted, fall back to applying them now
+            _MATERIALIZE_LOCKS[cls] = threading.RLock()
+            _PENDING_LINKS[cls] = list(cls.__LINKS__)
+            for targetVars in targets:
+                for targetVar in targetVars:
+                    setattr(cls, targetVar, LazyLink(cls, targetVar))
+            return cls
     for link in cls.__LINKS__:
         link.apply(cls)
     return cls
@@ -0,0 +1,232 @@
+import weakref
+
+from typing import Callable, Iterable, List
+
+from .attrLinker import LinkManager
+from .exceptions import DependencyCycle
+
+
+class DerivedAttribute:
+    '''
+    Descriptor of a derived attribute, computed from other attributes of the instance and cached per instance until one of them changes.
+    Installed by linkDerived, see DependencyGraph.
+    '''
+
+    __slots__ = ['graph', 'targetVar', 'compute', 'dependsOn', 'doc']
+
+    def __init__(self, graph: 'DependencyGraph', targetVar: str, compute: Callable, dependsOn: List[str], doc: str = ''):
+        self.graph = graph
+        self.targetVar = targetVar
+        self.compute = compute
+        self.dependsOn = dependsOn
+        self.doc = doc or "Derived from: {}".format(', '.join(dependsOn))
+
+    def __repr__(self):
+        return "<{} {} DependsOn={}>".format(self.__class__.__name__, self.targetVar, self.dependsOn)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        graph = self.graph
+        if graph.version != graph.manager.version: # Links of some class changed, maybe of this one
+            graph.sync()
+        cache = graph.cache.get(instance)
+        if cache is None:
+            cache = graph.cache[instance] = {}
+        entry = cache.get(self.targetVar)
+        if entry is not None:
+            roots, value = entry
+            for name, root in zip(graph.rootsOf(self.targetVar), roots):
+                if getattr(instance, name) is not root: # Source swapped
+                    break
+            else:
+                return value
+        roots = tuple(getattr(instance, name) for name in graph.rootsOf(self.targetVar))
+        value = self.compute(*[getattr(instance, dependency) for dependency in self.dependsOn])
+        cache[self.targetVar] = (roots, value)
+        return value
+
+    def __set__(self, instance, replacement):
+        raise AttributeError("Derived attribute '{}' can not be set.".format(self.targetVar))
+
+    def __delete__(self, instance):
+        raise AttributeError("Derived attribute '{}' can not be deleted.".format(self.targetVar))
+
+
+class InvalidatingDescriptor:
+    '''Wraps the descriptor of a linked attribute that derived attributes depend on, invalidating them on the instance after every set through it.'''
+
+    __slots__ = ['descriptor', 'graph', 'targetVar']
+
+    def __init__(self, descriptor, graph: 'DependencyGraph', targetVar: str):
+        self.descriptor = descriptor
+        self.graph = graph
+        self.targetVar = targetVar
+
+    def __get__(self, instance, owner=None):
+        return self.descriptor.__get__(instance, owner)
+
+    def __set__(self, instance, replacement):
+        self.descriptor.__set__(instance, replacement)
+        self.graph.invalidate(instance, self.targetVar)
+
+    def __delete__(self, instance):
+        self.descriptor.__delete__(instance)
+
+
+class DependencyGraph:
+    '''
+    The derived attributes of a class and what they depend on, get it with derivedOf(cls).
+    A derived value is cached per instance, and recomputed once a dependency is set through its linked setter, or a root source of it is replaced
+    (Ex: instance.userData = payload). Sources mutated in place otherwise require calling invalidate, which LinkedCollection.refresh does for the changed instances.
+    Declaring a derived attribute which depends on itself, directly or through others, raises DependencyCycle.
+    '''
+
+    __slots__ = ['targetClass', 'manager', 'derived', 'dependents', 'cache', 'version', 'classVersion', '_roots', '__weakref__']
+
+    def __init__(self, targetClass: type, manager: LinkManager = None):
+        self.targetClass = weakref.ref(targetClass)
+        self.manager = manager or LinkManager._getDefault()
+        self.derived = {} # Ex: {targetVar: DerivedAttribute,...}
+        self.dependents = {} # Derived attributes depending on an attribute, directly or not, Ex: {'onlineTime': {'ratio', 'isActive'},...}
+        self.cache = weakref.WeakKeyDictionary() # Ex: {instance: {targetVar: (roots, value),...},...}
+        self.version = None # Version of the manager last checked, see sync
+        self.classVersion = None # Version of the links of the class the roots and hooks were resolved at
+        self._roots = {} # Instance attributes holding the sources of a derived attribute, Ex: {'ratio': ('userData',),...}
+
+    def __repr__(self):
+        targetClass = self.targetClass()
+        return "<{} Class={} Derived={}>".format(self.__class__.__name__, targetClass and targetClass.__name__, list(self.derived))
+
+    def add(self, targetVar: str, compute: Callable, dependsOn: Iterable[str], doc: str = '') -> DerivedAttribute:
+        '''Declares the derived attribute targetVar and installs its descriptor on the class. Raises DependencyCycle if it would depend on itself.'''
+        dependsOn = list(dependsOn)
+        path = self._pathTo(targetVar, dependsOn)
+        if path is not None:
+            raise DependencyCycle("Derived attribute {}.{} depends on itself: {}".format(self.targetClass().__name__, targetVar, ' -> '.join([targetVar] + path)))
+        attribute = self.derived[targetVar] = DerivedAttribute(self, targetVar, compute, dependsOn, doc)
+        setattr(self.targetClass(), targetVar, attribute)
+        self.reset() # Rebuilds the dependents
+        return attribute
+
+    def _pathTo(self, targetVar: str, dependsOn: List[str], visited: set = None):
+        '''Returns the chain of dependencies leading back to targetVar, None if there is none.'''
+        visited = set() if visited is None else visited
+        for dependency in dependsOn:
+            if dependency == targetVar:
+                return [dependency]
+            if dependency in self.derived and dependency not in visited:
+                visited.add(dependency)
+                path = self._pathTo(targetVar, self.derived[dependency].dependsOn, visited)
+                if path is not None:
+                    return [dependency] + path
+        return None
+
+    def _rebuildDependents(self):
+        self.dependents = {}
+        for targetVar in self.derived:
+            stack, seen = [targetVar], set()
+            while stack:
+                for dependency in self.derived[stack.pop()].dependsOn:
+                    self.dependents.setdefault(dependency, set()).add(targetVar)
+                    if dependency in self.derived and dependency not in seen:
+                        seen.add(dependency)
+                        stack.append(dependency)
+
+    def rootsOf(self, targetVar: str) -> tuple:
+        '''Returns the instance attributes holding the sources targetVar is derived from, following links and other derived attributes.'''
+        roots = self._roots.get(targetVar)
+        if roots is None:
+            roots = self._roots[targetVar] = tuple(dict.fromkeys(self._resolveRoots(targetVar, set())))
+        return roots
+
+    def _resolveRoots(self, name: str, visited: set) -> List[str]:
+        if name in visited:
+            return []
+        visited.add(name)
+        if name in self.derived:
+            return [root for dependency in self.derived[name].dependsOn for root in self._resolveRoots(dependency, visited)]
+        linker = self.manager.linkerAt(self.targetClass(), name)
+        if linker is not None:
+            return self._resolveRoots(linker.sourceVar, visited)
+        return [name]
+
+    def sync(self):
+        '''Resets the graph if the links of its class or of its bases changed since it was last reset, links of unrelated classes keep the cached values.'''
+        version = self.manager.version
+        if self.manager.versionOf(self.targetClass()) != self.classVersion:
+            self.reset()
+        else:
+            self.version = version
+
+    def reset(self):
+        '''
+        Drops every cached value and resolves the roots again, wrapping the linked attributes derived attributes depend on.
+        Links between a dependency and its roots are wrapped too, Ex: online_time for a dependency on login_time, which reads online_time.
+        Attributes linked on a base are wrapped on the base, instances of the base have no cached values to invalidate.
+        '''
+        from .decorator import materializeLinks
+        targetClass = self.targetClass()
+        materializeLinks(targetClass)
+        self.cache.clear()
+        self._roots.clear()
+        self.version = self.manager.version
+        self.classVersion = self.manager.versionOf(targetClass)
+        self._rebuildDependents()
+        for dependency in [name for name in self.dependents if name not in self.derived]:
+            name, visited = dependency, set()
+            while name not in visited:
+                visited.add(name)
+                if name != dependency:
+                    self.dependents.setdefault(name, set()).update(self.dependents[dependency])
+                self._hook(targetClass, name)
+                linker = self.manager.linkerAt(targetClass, name)
+                if linker is None:
+                    break
+                name = linker.sourceVar
+
+    def _hook(self, targetClass: type, targetVar: str):
+        '''Wraps the settable descriptor serving targetVar on targetClass, where it is found in the MRO, unless it is already wrapped.'''
+        for klass in targetClass.__mro__:
+            descriptor = klass.__dict__.get(targetVar)
+            if descriptor is not None:
+                if hasattr(descriptor, '__set__') and self._invalidatorAt(klass, targetVar) is None:
+                    LinkManager._wrap(klass, targetVar, lambda descriptor: InvalidatingDescriptor(descriptor, self, targetVar))
+                return
+
+    def _invalidatorAt(self, targetClass: type, targetVar: str) -> InvalidatingDescriptor:
+        return LinkManager._findWrapper(targetClass, targetVar, lambda wrapper: isinstance(wrapper, InvalidatingDescriptor) and wrapper.graph is self)
+
+    def invalidate(self, instance, changed: str = None):
+        '''Drops the cached derived values of instance, every one of them, or the ones depending on the changed attribute.'''
+        cache = self.cache.get(instance)
+        if not cache:
+            return
+        if changed is None:
+            cache.clear()
+        else:
+            for targetVar in self.dependents.get(changed, ()):
+                cache.pop(targetVar, None)
+
+    def invalidateMany(self, instances: Iterable):
+        '''Drops every cached derived value of the instances, Ex: after their sources were refreshed in place.'''
+        cache = self.cache
+        for instance in instances:
+            cache.pop(instance, None)
+
+
+_GRAPHS = weakref.WeakKeyDictionary() # Ex: {Class1: DependencyGraph,...}
+
+
+def derivedOf(targetClass: type, create: bool = False) -> DependencyGraph:
+    '''Returns the DependencyGraph of targetClass or of its closest base with derived attributes, None if there is none. With create=True, returns the own graph of targetClass, creating it if needed.'''
+    if create:
+        graph = _GRAPHS.get(targetClass)
+        if graph is None:
+            graph = _GRAPHS[targetClass] = DependencyGraph(targetClass)
+        return graph
+    for klass in targetClass.__mro__:
+        graph = _GRAPHS.get(klass)
+        if graph is not None:
+            return graph
+    return None
@@ -15,6 +15,18 @@ class LinkerNotReady(LinkerException):
     '''Linker is not ready'''
     pass
 
+class CoercionError(LinkerException):
+    '''Value of a linked attribute could not be coerced to its type'''
+    def __init__(self, message: str, linker=None, targetVar: str = None, value=None):
+        super().__init__(message)
+        self.linker = linker
+        self.targetVar = targetVar
+        self.value = value
+
+class DependencyCycle(LinkerException):
+    '''Derived attribute depends on itself'''
+    pass
+
 class LinkerExists(ManagerException):
     '''Linker is found in the manager's hashmap of linkers'''
     pass
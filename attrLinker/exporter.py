@@ -0,0 +1,118 @@
+import weakref
+from collections import namedtuple
+
+from typing import Any, Dict, Iterable, List
+
+from .attrLinker import LinkManager
+
+try:
+    import numpy
+except ImportError: # NumPy is optional, only needed for Exporter.columns(asNumpy=True)
+    numpy = None
+
+
+class Exporter:
+    '''
+    Generated exporter of the linked attributes of a class, which resolves every linked attribute of an instance in a single function call.
+    Every source attribute is read once per instance, and links with an accessSpec are inlined instead of going through their property.
+    The fields come from the links the manager recorded for the class. Get a cached one with getExporter(targetClass).
+    '''
+
+    __slots__ = ['targetClass', 'manager', 'fields', 'version', 'Row', 'toTuple', 'toDict', 'toNamedTuple']
+
+    def __init__(self, targetClass: type, fields: List[str] = None, manager: LinkManager = None):
+        '''
+        Params
+        ------
+        targetClass:type is the linked class to export
+        fields:list is the targetVars to export, in order. If None, every linked attribute of the class.
+        manager:LinkManager is the manager which linked the class, the default manager if None.
+        '''
+        self.targetClass = targetClass
+        self.manager = manager or LinkManager._getDefault()
+        self.build(fields)
+
+    def __repr__(self):
+        return "<{} Class={} Fields={}>".format(self.__class__.__name__, self.targetClass.__name__, self.fields)
+
+    def build(self, fields: List[str] = None):
+        '''(Re)generates the export functions, Ex: after the links of the class changed.'''
+        linkers = self.manager.linkersOf(self.targetClass)
+        self.version = self.manager.version
+        self.fields = tuple(linkers if fields is None else fields)
+        self.Row = namedtuple(self.targetClass.__name__ + 'Row', self.fields, rename=True)
+
+        namespace, sourceNames, expressions = {'Row': self.Row}, {}, []
+        for idx, field in enumerate(self.fields):
+            linker = linkers[field]
+            if linker.sourceVar not in sourceNames:
+                sourceNames[linker.sourceVar] = 's%d' % len(sourceNames)
+                namespace['n' + sourceNames[linker.sourceVar]] = linker.sourceVar
+            expressions.append(self._expression(idx, linker, sourceNames[linker.sourceVar], namespace))
+
+        header = 'def export(instance):\n' + ''.join('    {0} = getattr(instance, n{0})\n'.format(source) for source in sourceNames.values())
+        body = ', '.join(expressions)
+        sources = {'toTuple': header + '    return ({}{})\n'.format(body, ',' if len(expressions) == 1 else ''),
+                   'toDict': header + '    return {{{}}}\n'.format(', '.join('{!r}: {}'.format(field, expression) for field, expression in zip(self.fields, expressions))),
+                   'toNamedTuple': header + '    return Row({})\n'.format(body)}
+        for name, source in sources.items():
+            exec(compile(source, '<Exporter {}.{}>'.format(self.targetClass.__name__, name), 'exec'), namespace)
+            setattr(self, name, namespace['export'])
+        return self
+
+    @staticmethod
+    def _expression(idx: int, linker, source: str, namespace: Dict[str, Any]) -> str:
+        '''Returns the expression reading the field from its source variable, inlining the accessSpec when known.'''
+        kind, *specArgs = linker.accessSpec or (None,)
+        if kind == 'item':
+            namespace['k%d' % idx], namespace['d%d' % idx] = specArgs[0], specArgs[1]
+            return '{}.get(k{i}, d{i})'.format(source, i=idx)
+        if kind == 'index':
+            namespace['k%d' % idx] = specArgs[0]
+            return '{}[k{}]'.format(source, idx)
+        if kind == 'attribute':
+            namespace['k%d' % idx] = specArgs[0]
+            return 'getattr({}, k{})'.format(source, idx)
+        if kind == 'path':
+            namespace['r%d' % idx], namespace['d%d' % idx] = specArgs[0].get, specArgs[1]
+            return 'r{i}({}, d{i})'.format(source, i=idx)
+        if kind == 'struct':
+            namespace['r%d' % idx] = specArgs[0].reader(specArgs[1])
+            return 'r{}({}, 0)'.format(idx, source)
+        if kind == 'column':
+            namespace['c%d' % idx], namespace['k%d' % idx] = specArgs[0].columns, specArgs[1]
+            return 'c{i}[k{i}][{}]'.format(source, i=idx)
+        namespace['g%d' % idx] = linker.getterConverter
+        return 'g{}({})'.format(idx, source)
+
+    def columns(self, instances: Iterable, asNumpy: bool = False) -> Dict[str, Any]:
+        '''
+        Exports many instances at once, returns the values per field in the form of {field: [value,...],...}.
+
+        Params
+        ------
+        instances:Iterable of instances of the class
+        asNumpy:bool whether to return NumPy arrays instead of lists
+        '''
+        rows = list(map(self.toTuple, instances))
+        columns = zip(*rows) if rows else [()] * len(self.fields)
+        if asNumpy:
+            if numpy is None:
+                raise ImportError("Exporter.columns(asNumpy=True) requires numpy to be installed.")
+            return {field: numpy.array(column) for field, column in zip(self.fields, columns)}
+        return {field: list(column) for field, column in zip(self.fields, columns)}
+
+
+_EXPORTERS = weakref.WeakKeyDictionary() # Ex: {Class1: {manager: Exporter,...},...}
+
+
+def getExporter(targetClass: type, manager: LinkManager = None) -> Exporter:
+    '''Returns the cached Exporter of every linked attribute of targetClass, rebuilding it if the manager's links changed since.'''
+    manager = manager or LinkManager._getDefault()
+    exporters = _EXPORTERS.setdefault(targetClass, weakref.WeakKeyDictionary())
+    exporter = exporters.get(manager)
+    if exporter is None:
+        exporter = exporters[manager] = Exporter(targetClass, manager=manager)
+    elif exporter.version != manager.version:
+        exporter.build()
+    return exporter
@@ -0,0 +1,36 @@
+from typing import List
+
+
+def fusedChainOf(descriptor) -> tuple:
+    '''Returns the linkers fused by given descriptor, from the root link to the outer one. None if it is not a fused property.'''
+    return getattr(getattr(descriptor, 'fget', None), 'fusedChain', None)
+
+
+def fuseLinkers(targetClass: type, chain: List) -> property:
+    '''
+    Creates the fused property of a chain of links, where each link reads the linked attribute of the previous one on targetClass.
+    Ex: login_time reads online_time, which reads userData. The getter reads the root source once and runs every converter in a row,
+    instead of going through the property of every link. The setter is the outer link's, so writes go through the links as before.
+    Instances of subclasses, which may link the intermediate attributes otherwise, are read through the outer link as is.
+
+    Params
+    ------
+    targetClass:type is the class the links are applied to
+    chain:list is the linkers of the chain, from the root link, reading an instance variable, to the outer link
+    '''
+    outer = chain[-1].property
+    namespace = {'targetClass': targetClass, 'rootVar': chain[0].sourceVar, 'outerGet': outer.__get__}
+    expression = 'linkedSelf.__getattribute__(rootVar)'
+    for idx, linker in enumerate(chain):
+        namespace['c%d' % idx] = linker.getterConverter
+        expression = 'c{}({})'.format(idx, expression)
+    source = ('def _fusedGetter(linkedSelf):\n'
+              '    if linkedSelf.__class__ is targetClass:\n'
+              '        return {}\n'
+              '    return outerGet(linkedSelf)\n').format(expression)
+    exec(compile(source, '<Fused {}>'.format(' -> '.join(linker.sourceVar for linker in chain)), 'exec'), namespace)
+    getter = namespace['_fusedGetter']
+    getter.linker = chain[-1]
+    getter.fusedChain = tuple(chain)
+    setter = outer.fset if isinstance(outer, property) else outer.__set__
+    return property(fget=getter, fset=setter, doc=chain[-1].doc)
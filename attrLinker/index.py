@@ -0,0 +1,305 @@
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+
+from typing import Iterable, List
+
+
+_UNINDEXED = object() # Value of instances whose attribute could not be read, they are left out of the index
+
+
+class Index(ABC):
+    '''
+    Base of the secondary indexes over a linked attribute. An index holds the instances added to it, keyed on their current value of targetVar.
+    Declare indexes in the __INDEXES__ of a LinkedClass, they are then kept up to date by the linked setters and by LinkedCollection.
+    '''
+
+    __slots__ = ['targetVar', 'name', 'values']
+
+    def __init__(self, targetVar: str, name: str = None):
+        '''
+        Params
+        ------
+        targetVar:str is the indexed linked attribute
+        name:str is the name of the index in the class' IndexSet, targetVar if None
+        '''
+        self.targetVar = targetVar
+        self.name = name or targetVar
+        self.values = {} # Indexed value of every instance, Ex: {id(instance): (instance, value),...}
+
+    def __repr__(self):
+        return "<{} TargetVar={} Count={}>".format(self.__class__.__name__, self.targetVar, len(self.values))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, instance):
+        return id(instance) in self.values
+
+    def _read(self, instance):
+        try:
+            return getattr(instance, self.targetVar)
+        except (LookupError, AttributeError, TypeError):
+            return _UNINDEXED
+
+    def add(self, instance):
+        '''Adds instance to the index, or re-indexes it if it is already in.'''
+        value = self._read(instance)
+        entry = self.values.get(id(instance))
+        if entry is not None:
+            if entry[1] == value and type(entry[1]) is type(value):
+                return
+            if entry[1] is not _UNINDEXED:
+                self._remove(instance, entry[1])
+        self.values[id(instance)] = (instance, value)
+        if value is not _UNINDEXED:
+            try:
+                self._insert(instance, value)
+            except Exception: # Ex: rejected by a unique index, or unhashable, the instance keeps its previous entry
+                if entry is None:
+                    del self.values[id(instance)]
+                else:
+                    self.values[id(instance)] = entry
+                    if entry[1] is not _UNINDEXED:
+                        self._insert(instance, entry[1])
+                raise
+
+    update = add
+
+    def remove(self, instance):
+        '''Removes instance from the index, if it is in.'''
+        entry = self.values.pop(id(instance), None)
+        if entry is not None and entry[1] is not _UNINDEXED:
+            self._remove(instance, entry[1])
+
+    @abstractmethod
+    def _remove(self, instance, value):
+        '''Removes instance, indexed at value, from the lookup structure of the index. Does nothing if it is not there.'''
+
+    @abstractmethod
+    def _insert(self, instance, value):
+        '''Adds instance at value to the lookup structure of the index.'''
+
+
+class HashIndex(Index):
+    '''
+    Hash index for equality lookups in O(1), Ex: all instances with status == 'online'. Indexed values must be hashable.
+    unique=True makes the index keep a single instance per value, adding another instance with the same value raises ValueError.
+    '''
+
+    __slots__ = ['unique', 'buckets']
+
+    def __init__(self, targetVar: str, name: str = None, unique: bool = False):
+        super().__init__(targetVar, name)
+        self.unique = unique
+        self.buckets = {} # Ex: {value: {id(instance1): instance1,...},...}, dictionaries keep the order of insertion
+
+    def _insert(self, instance, value):
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = {}
+        elif self.unique:
+            raise ValueError("Unique index '{}' already has an instance with value {!r}.".format(self.name, value))
+        bucket[id(instance)] = instance
+
+    def _remove(self, instance, value):
+        try:
+            bucket = self.buckets.get(value)
+        except TypeError: # Unhashable, so never inserted
+            return
+        if bucket is None or bucket.pop(id(instance), None) is None:
+            return
+        if not bucket:
+            del self.buckets[value]
+
+    def get(self, value) -> List:
+        '''Returns the instances with given value.'''
+        return list(self.buckets.get(value, {}).values())
+
+    def one(self, value, default=None):
+        '''Returns the first instance added with given value, default if none.'''
+        return next(iter(self.buckets.get(value, {}).values()), default)
+
+    def count(self, value) -> int:
+        return len(self.buckets.get(value, ()))
+
+    def keys(self):
+        return self.buckets.keys()
+
+
+class SortedIndex(Index):
+    '''Sorted index for range queries in O(log n), Ex: instances with 10 <= onlineTime < 20. Indexed values must be comparable with each other, None values are left out.'''
+
+    __slots__ = ['sortedValues', 'instances']
+
+    def __init__(self, targetVar: str, name: str = None):
+        super().__init__(targetVar, name)
+        self.sortedValues = [] # With their instances at the same position in instances
+        self.instances = []
+
+    def _read(self, instance):
+        value = super()._read(instance)
+        return _UNINDEXED if value is None else value # None is not comparable, Ex: the default of a missing dictionary key
+
+    def _insert(self, instance, value):
+        position = bisect_right(self.sortedValues, value)
+        self.sortedValues.insert(position, value)
+        self.instances.insert(position, instance)
+
+    def _remove(self, instance, value):
+        try:
+            position, stop = bisect_left(self.sortedValues, value), bisect_right(self.sortedValues, value)
+        except TypeError: # Not comparable, so never inserted
+            return
+        while position < stop and self.instances[position] is not instance:
+            position += 1
+        if position < stop:
+            del self.sortedValues[position]
+            del self.instances[position]
+
+    def range(self, low=None, high=None, includeLow: bool = True, includeHigh: bool = True) -> List:
+        '''Returns the instances with low <= value <= high in order of value, None leaves a side unbounded. Strictness is set by includeLow and includeHigh.'''
+        start = 0 if low is None else (bisect_left if includeLow else bisect_right)(self.sortedValues, low)
+        stop = len(self.sortedValues) if high is None else (bisect_right if includeHigh else bisect_left)(self.sortedValues, high)
+        return self.instances[start:stop]
+
+    def get(self, value) -> List:
+        '''Returns the instances with given value.'''
+        return self.range(value, value)
+
+    def first(self, count: int = 1) -> List:
+        '''Returns the count instances with the lowest values.'''
+        return self.instances[:count]
+
+    def last(self, count: int = 1) -> List:
+        '''Returns the count instances with the highest values, highest first.'''
+        return self.instances[:-count - 1:-1]
+
+
+class IndexedDescriptor:
+    '''
+    Wraps the descriptor of an indexed linked attribute, re-indexing the instance after every set through it.
+    A set rejected by an index (Ex: a duplicate value of a unique index) is rolled back, by setting the previous value again, then raised.
+    '''
+
+    __slots__ = ['descriptor', 'indexSet']
+
+    def __init__(self, descriptor, indexSet: 'IndexSet'):
+        self.descriptor = descriptor
+        self.indexSet = indexSet
+
+    def __get__(self, instance, owner=None):
+        return self.descriptor.__get__(instance, owner)
+
+    def __set__(self, instance, replacement):
+        indexSet = self.indexSet
+        if id(instance) not in indexSet.members:
+            self.descriptor.__set__(instance, replacement)
+            return
+        try:
+            previous = self.descriptor.__get__(instance, type(instance))
+        except (LookupError, AttributeError, TypeError): # Nothing to roll back to
+            previous = _UNINDEXED
+        self.descriptor.__set__(instance, replacement)
+        try:
+            indexSet.update(instance)
+        except Exception: # Ex: a unique index rejected the value, the write is rolled back
+            if previous is not _UNINDEXED:
+                self.descriptor.__set__(instance, previous)
+                indexSet.update(instance)
+            raise
+
+    def __delete__(self, instance):
+        self.descriptor.__delete__(instance)
+
+
+class IndexSet:
+    '''
+    The indexes of a LinkedClass, declared in its __INDEXES__. Get it with indexesOf(cls).
+    Instances are indexed once added, which LinkedCollection does for its instances. Writes through linked setters re-index the instance,
+    sources replaced or mutated directly require calling update.
+    '''
+
+    __slots__ = ['targetClass', 'indexes', 'members', '_hooked']
+
+    def __init__(self, targetClass: type, indexes: Iterable[Index]):
+        self.targetClass = weakref.ref(targetClass)
+        self.indexes = {index.name: index for index in indexes} # Ex: {'status': HashIndex,...}
+        self.members = set() # ids of the indexed instances
+        self._hooked = False
+
+    def __repr__(self):
+        targetClass = self.targetClass()
+        return "<{} Class={} Indexes={} Count={}>".format(self.__class__.__name__, targetClass and targetClass.__name__, list(self.indexes), len(self.members))
+
+    def __getitem__(self, name: str) -> Index:
+        return self.indexes[name]
+
+    def __len__(self):
+        return len(self.members)
+
+    def _hook(self):
+        '''
+        Wraps the descriptors of the indexed attributes, once the links of the class are applied. Attributes linked on a base are wrapped on the base,
+        where the manager keeps the wrapper around the link as it is swapped. Instances of the base are not members, so they are not re-indexed.
+        '''
+        from .attrLinker import LinkManager
+        from .decorator import materializeLinks
+        targetClass = self.targetClass()
+        materializeLinks(targetClass)
+        for targetVar in {index.targetVar for index in self.indexes.values()}:
+            for klass in targetClass.__mro__:
+                descriptor = klass.__dict__.get(targetVar)
+                if descriptor is not None:
+                    hooked = LinkManager._findWrapper(klass, targetVar, lambda wrapper: isinstance(wrapper, IndexedDescriptor) and wrapper.indexSet is self)
+                    if hooked is None and hasattr(descriptor, '__set__'):
+                        LinkManager._wrap(klass, targetVar, lambda descriptor: IndexedDescriptor(descriptor, self))
+                    break
+        self._hooked = True
+
+    def add(self, instance):
+        '''Adds instance to every index of the class.'''
+        if not self._hooked:
+            self._hook()
+        self.members.add(id(instance))
+        try:
+            for index in self.indexes.values():
+                index.add(instance)
+        except Exception: # Ex: a unique index rejected it, leave no partial entries behind
+            self.remove(instance)
+            raise
+
+    def update(self, instance):
+        '''Re-indexes instance, Ex: after its source was replaced.'''
+        for index in self.indexes.values():
+            index.add(instance)
+
+    def remove(self, instance):
+        '''Removes instance from every index of the class.'''
+        self.members.discard(id(instance))
+        for index in self.indexes.values():
+            index.remove(instance)
+
+    def addMany(self, instances: Iterable):
+        for instance in instances:
+            self.add(instance)
+
+    def updateMany(self, instances: Iterable):
+        for instance in instances:
+            self.update(instance)
+
+
+_INDEX_SETS = weakref.WeakKeyDictionary() # Ex: {Class1: IndexSet,...}
+
+
+def indexesOf(targetClass: type) -> IndexSet:
+    '''Returns the IndexSet declared by targetClass or its closest base with __INDEXES__, None if there is none.'''
+    for klass in targetClass.__mro__:
+        indexSet = _INDEX_SETS.get(klass)
+        if indexSet is not None:
+            return indexSet
+        indexes = klass.__dict__.get('__INDEXES__')
+        if indexes:
+            indexSet = _INDEX_SETS[klass] = IndexSet(klass, indexes)
+            return indexSet
+    return None
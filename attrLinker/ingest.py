@@ -0,0 +1,219 @@
+import codecs
+import itertools
+import json
+import re
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from .collection import LinkedCollection, RefreshResult
+
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = ' \t\r\n,'
+_STRUCTURE = re.compile(r'["{}\[\]]') # Characters which open or close a container or a string, outside of strings
+_STRING_END = re.compile(r'["\\]') # Characters which close a string or escape the next one, within strings
+
+
+def _chunks(stream, chunkSize: int, encoding: str) -> Iterator[str]:
+    '''Yields the text of a file-like object or an iterable of bytes/str chunks, decoding bytes incrementally.'''
+    if hasattr(stream, 'read'):
+        read = stream.read
+        stream = iter(lambda: read(chunkSize), read(0))
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in stream:
+        text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _ndjsonRecords(chunks: Iterator[str], first: str) -> Iterator[Any]:
+    pending = [] # Chunks of a line spanning chunks, only joined once its end arrives
+    for chunk in itertools.chain((first,), chunks):
+        pending.append(chunk)
+        if '\n' not in chunk:
+            continue
+        *lines, buffer = ''.join(pending).split('\n')
+        pending = [buffer]
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    buffer = ''.join(pending)
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+def _scanRecord(buffer: str, scan: list) -> bool:
+    '''
+    Resumes scanning a container or string record from where the last scan stopped, scan being [offset, depth, inString].
+    Returns whether the record is complete within buffer, so a record spanning chunks is decoded once, instead of again for every chunk.
+    '''
+    offset, depth, inString = scan
+    while True:
+        if inString:
+            match = _STRING_END.search(buffer, offset)
+            if match is None:
+                offset = len(buffer)
+                break
+            if match.group() == '\\':
+                if match.end() == len(buffer): # The escaped character is in the next chunk
+                    offset = match.start()
+                    break
+                offset = match.end() + 1
+                continue
+            inString, offset = False, match.end()
+            if depth == 0:
+                return True
+        else:
+            match = _STRUCTURE.search(buffer, offset)
+            if match is None:
+                offset = len(buffer)
+                break
+            char, offset = match.group(), match.end()
+            if char == '"':
+                inString = True
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return True
+    scan[:] = [offset, depth, inString]
+    return False
+
+
+def _arrayRecords(chunks: Iterator[str], buffer: str, chunkSize: int) -> Iterator[Any]:
+    position, exhausted = buffer.index('[') + 1, False
+    scan = None # Scan of the record at position, once it was found incomplete
+    while True:
+        while position < len(buffer) and buffer[position] in _SEPARATORS:
+            position += 1
+        if position < len(buffer):
+            if buffer[position] == ']':
+                return
+            delimited = buffer[position] in '{["' # Otherwise a number or a literal, which are short
+            if scan is None or exhausted or _scanRecord(buffer, scan):
+                try:
+                    record, end = _DECODER.raw_decode(buffer, position)
+                except json.JSONDecodeError as exc:
+                    if exhausted or scan is not None:
+                        raise ValueError("Invalid JSON record in the array.") from exc
+                    if delimited:
+                        scan = [position, 0, False]
+                        if _scanRecord(buffer, scan): # Complete, yet invalid
+                            raise ValueError("Invalid JSON record in the array.") from exc
+                else:
+                    if end < len(buffer) or exhausted or delimited: # A number ending with the buffer may go on in the next chunk
+                        yield record
+                        position, scan = end, None
+                        continue
+        elif exhausted:
+            raise ValueError("Unexpected end of the JSON array.")
+        if position > chunkSize: # Parsed records are dropped, keeping the buffer bounded by the largest record
+            buffer = buffer[position:]
+            if scan is not None:
+                scan[0] -= position
+            position = 0
+        chunk = next(chunks, None)
+        exhausted = chunk is None
+        buffer += chunk or ''
+
+
+def iterRecords(stream, format: str = 'auto', chunkSize: int = 65536, encoding: str = 'utf-8') -> Iterator[Any]:
+    '''
+    Parses the records of a JSON response incrementally, yielding them one at a time, so only the records being parsed are kept in memory.
+    Supports NDJSON (one record per line) and JSON arrays, which are parsed record by record with JSONDecoder.raw_decode.
+
+    Params
+    ------
+    stream:file-like object (binary or text) or Iterable of bytes/str chunks, Ex: an HTTP response body
+    format:str is 'ndjson', 'json' for an array of records, or 'auto' to pick by the first character of the stream
+    chunkSize:int is the amount read from file-like objects at once
+    encoding:str is the encoding of bytes chunks
+    '''
+    if format not in ('auto', 'ndjson', 'json'):
+        raise ValueError("Unknown format {!r}, expected 'auto', 'ndjson' or 'json'.".format(format))
+    chunks = _chunks(stream, chunkSize, encoding)
+    first = ''
+    for chunk in chunks:
+        first += chunk
+        if first.strip():
+            break
+    if not first.strip():
+        return
+    if format == 'auto':
+        format = 'json' if first.lstrip()[0] == '[' else 'ndjson'
+    if format == 'json':
+        if first.lstrip()[0] != '[':
+            raise ValueError("Expected a JSON array of records.")
+        yield from _arrayRecords(chunks, first, chunkSize)
+    else:
+        yield from _ndjsonRecords(chunks, first)
+
+
+def _batches(items: Iterable, batchSize: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batchSize:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ingest(linkedClass: type, stream, sourceVar: str, factory: Callable[[Dict[str, Any]], Any] = None, batchSize: int = None, **kw) -> Iterator:
+    '''
+    Yields a linked instance per record of the stream, as the records are parsed. Each record dictionary is set as the instance's source as is, without copying.
+    Example: for user in ingest(User, response, 'userData'): ...
+
+    Params
+    ------
+    linkedClass:type is the linked class of the instances
+    stream:file-like object or Iterable of chunks, see iterRecords
+    sourceVar:str is the source attribute name of an instance, which holds the record
+    factory:Callable is called with a record to create its instance. If None, linkedClass is called without arguments, then the record is set to its sourceVar.
+    batchSize:int if given, lists of up to batchSize instances are yielded instead
+
+    Extra keyword argument passed, would be passed directly to iterRecords
+    '''
+    def createInstance(record):
+        if factory is not None:
+            return factory(record)
+        instance = linkedClass()
+        setattr(instance, sourceVar, record)
+        return instance
+
+    instances = map(createInstance, iterRecords(stream, **kw))
+    return instances if batchSize is None else _batches(instances, batchSize)
+
+
+def ingestInto(collection: LinkedCollection, stream, batchSize: int = 1000, retireMissing: bool = False, **kw) -> RefreshResult:
+    '''
+    Upserts the records of the stream into a LinkedCollection, refreshing it batch by batch as the records are parsed.
+    New keys get an instance using the record as its source, existing instances are updated in place, see LinkedCollection.refresh.
+
+    Params
+    ------
+    collection:LinkedCollection is the collection to upsert into
+    stream:file-like object or Iterable of chunks, see iterRecords
+    batchSize:int is the amount of records per refresh
+    retireMissing:bool whether to retire the instances whose key was not found in the stream, once it is consumed. Defaults to False
+
+    Extra keyword argument passed, would be passed directly to iterRecords
+    '''
+    added = removed = changed = 0
+    seen = set()
+    for batch in _batches(iterRecords(stream, **kw), batchSize):
+        if retireMissing:
+            seen.update(record[collection.keyField] for record in batch)
+        result = collection.refresh(batch, partial=True)
+        added += result.added
+        changed += result.changed
+    if retireMissing:
+        for key in [key for key in collection.keys() if key not in seen]:
+            collection.retire(key)
+            removed += 1
+    return RefreshResult(added, removed, changed)
@@ -0,0 +1,129 @@
+import weakref
+from collections import namedtuple
+from time import perf_counter_ns
+
+from typing import Dict, List
+
+
+ReportEntry = namedtuple('ReportEntry', ['targetClass', 'targetVar', 'linker', 'gets', 'sets', 'getTime', 'setTime', 'totalTime']) # Times are in seconds
+
+
+class AccessStats:
+    '''Access counters and total time spent in the accessors (converters included) of a linked attribute, times are in nanoseconds.'''
+
+    __slots__ = ['gets', 'sets', 'getTime', 'setTime']
+
+    def __init__(self):
+        self.gets = self.sets = self.getTime = self.setTime = 0
+
+    def __repr__(self):
+        return "<{} Gets={} Sets={} Time={}ns>".format(self.__class__.__name__, self.gets, self.sets, self.getTime + self.setTime)
+
+
+class InstrumentedDescriptor:
+    '''Wraps the descriptor of a linked attribute, recording its accesses. Only installed while instrumentation is enabled.'''
+
+    __slots__ = ['descriptor', 'stats']
+
+    def __init__(self, descriptor, stats: AccessStats):
+        self.descriptor = descriptor
+        self.stats = stats
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.descriptor.__get__(instance, owner)
+        start = perf_counter_ns()
+        try:
+            return self.descriptor.__get__(instance, owner)
+        finally:
+            self.stats.getTime += perf_counter_ns() - start
+            self.stats.gets += 1
+
+    def __set__(self, instance, replacement):
+        start = perf_counter_ns()
+        try:
+            self.descriptor.__set__(instance, replacement)
+        finally:
+            self.stats.setTime += perf_counter_ns() - start
+            self.stats.sets += 1
+
+    def __delete__(self, instance):
+        self.descriptor.__delete__(instance)
+
+
+class Instrumentation:
+    '''
+    Per attribute access instrumentation for the links of a LinkManager, get one with LinkManager.enableInstrumentation().
+    While enabled, every linked attribute of the manager is wrapped by an InstrumentedDescriptor. Disabling removes them, even from within other wrappers (Ex: an index),
+    so uninstrumented accesses take the exact same path as if instrumentation was never enabled. Stats are kept until reset.
+    '''
+
+    __slots__ = ['manager', 'enabled', 'stats']
+
+    def __init__(self, manager):
+        '''
+        Params
+        ------
+        manager:LinkManager is the manager whose links are instrumented
+        '''
+        self.manager = manager
+        self.enabled = False
+        self.stats = weakref.WeakKeyDictionary() # Ex: {Class1: {targetVar1: AccessStats,...},...}
+
+    def __repr__(self):
+        return "<{} Enabled={} Attributes={}>".format(self.__class__.__name__, self.enabled, sum(len(stats) for stats in self.stats.values()))
+
+    def instrument(self, targetClass: type, targetVar: str):
+        '''Wraps the descriptor at targetVar of targetClass.'''
+        if targetClass.__dict__.get(targetVar) is None or self._wrapperAt(targetClass, targetVar) is not None:
+            return
+        stats = self.stats.setdefault(targetClass, {}).setdefault(targetVar, AccessStats())
+        self.manager._wrap(targetClass, targetVar, lambda descriptor: InstrumentedDescriptor(descriptor, stats))
+
+    def restore(self, targetClass: type, targetVar: str):
+        '''Removes the InstrumentedDescriptor at targetVar of targetClass, leaving the other wrappers of the attribute as is.'''
+        wrapper = self._wrapperAt(targetClass, targetVar)
+        if wrapper is not None:
+            self.manager._removeWrapper(targetClass, targetVar, wrapper)
+
+    def _wrapperAt(self, targetClass: type, targetVar: str) -> InstrumentedDescriptor:
+        return self.manager._findWrapper(targetClass, targetVar, lambda wrapper: isinstance(wrapper, InstrumentedDescriptor))
+
+    def enable(self):
+        '''Instruments every link of the manager, links applied afterwards are instrumented as they are applied.'''
+        self.enabled = True
+        for targetClass, targets in list(self.manager.targets.items()):
+            for targetVar in targets:
+                self.instrument(targetClass, targetVar)
+
+    def disable(self):
+        '''Removes every InstrumentedDescriptor, the attributes are then accessed as if instrumentation was never enabled.'''
+        self.enabled = False
+        for targetClass, stats in list(self.stats.items()):
+            for targetVar in list(stats):
+                self.restore(targetClass, targetVar)
+
+    def reset(self):
+        '''Clears the recorded stats.'''
+        for targetClass, stats in list(self.stats.items()):
+            for targetVar in stats:
+                stats[targetVar] = AccessStats()
+                wrapper = self._wrapperAt(targetClass, targetVar)
+                if wrapper is not None:
+                    wrapper.stats = stats[targetVar]
+
+    def entries(self) -> List[ReportEntry]:
+        '''Returns a ReportEntry for every instrumented attribute.'''
+        entries = []
+        for targetClass, stats in list(self.stats.items()):
+            linkers = self.manager.linkersOf(targetClass)
+            for targetVar, stat in stats.items():
+                entries.append(ReportEntry(targetClass, targetVar, linkers.get(targetVar), stat.gets, stat.sets,
+                                           stat.getTime / 1e9, stat.setTime / 1e9, (stat.getTime + stat.setTime) / 1e9))
+        return entries
+
+    def report(self, top: int = 10) -> Dict[str, List[ReportEntry]]:
+        '''Returns the top attributes by access count and by total time, in the form of {'byCount': [...], 'byTime': [...]}.'''
+        entries = self.entries()
+        return {'byCount': sorted(entries, key=lambda entry: entry.gets + entry.sets, reverse=True)[:top],
+                'byTime': sorted(entries, key=lambda entry: entry.totalTime, reverse=True)[:top]}
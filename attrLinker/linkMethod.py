@@ -1,9 +1,9 @@
 from enum import Enum
 
-from .presets import linkDictionary, multiLinkDictionary, linkList, multiLinkList, linkObject, multiLinkObject, formattedTextFromDict
+from .presets import linkDictionary, multiLinkDictionary, linkList, linkSlice, linkIndexes, multiLinkList, linkObject, multiLinkObject, formattedTextFromDict, linkColumn, multiLinkColumn, linkPath, multiLinkPath, linkSharedRecord, multiLinkSharedRecord, linkStruct, multiLinkStruct, linkDerived
 
 
-METHODS = {f.__name__:f for f in [linkDictionary, multiLinkDictionary, linkList, multiLinkList, linkObject, multiLinkObject, formattedTextFromDict]}
+METHODS = {f.__name__:f for f in [linkDictionary, multiLinkDictionary, linkList, linkSlice, linkIndexes, multiLinkList, linkObject, multiLinkObject, formattedTextFromDict, linkColumn, multiLinkColumn, linkPath, multiLinkPath, linkSharedRecord, multiLinkSharedRecord, linkStruct, multiLinkStruct, linkDerived]}
 
 
 class LinkMethod(Enum):
@@ -19,18 +19,40 @@ class LinkMethod(Enum):
     Dictionary = 'linkDictionary'
     MultiDictionary = 'multiLinkDictionary'
     List = 'linkList'
+    Slice = 'linkSlice'
+    Indexes = 'linkIndexes'
     MultiList = 'multiLinkList'
     Object = 'linkObject'
     MultiObject = 'multiLinkObject'
     FormattedText = 'formattedTextFromDict'
+    Column = 'linkColumn'
+    MultiColumn = 'multiLinkColumn'
+    Path = 'linkPath'
+    MultiPath = 'multiLinkPath'
+    SharedRecord = 'linkSharedRecord'
+    MultiSharedRecord = 'multiLinkSharedRecord'
+    Struct = 'linkStruct'
+    MultiStruct = 'multiLinkStruct'
+    Derived = 'linkDerived'
 
 DirectLink = LinkMethod.DirectLink
 Dictionary = LinkMethod.Dictionary
 MultiDictionary = LinkMethod.MultiDictionary
 List = LinkMethod.List
+Slice = LinkMethod.Slice
+Indexes = LinkMethod.Indexes
 MultiList = LinkMethod.MultiList
 Object = LinkMethod.Object
 MultiObject = LinkMethod.MultiObject
 FormattedText = LinkMethod.FormattedText
+Column = LinkMethod.Column
+MultiColumn = LinkMethod.MultiColumn
+Path = LinkMethod.Path
+MultiPath = LinkMethod.MultiPath
+SharedRecord = LinkMethod.SharedRecord
+MultiSharedRecord = LinkMethod.MultiSharedRecord
+Struct = LinkMethod.Struct
+MultiStruct = LinkMethod.MultiStruct
+Derived = LinkMethod.Derived
 
 __all__ = [meth.name for meth in LinkMethod]
@@ -0,0 +1,116 @@
+import re
+
+from typing import Any, List, Tuple
+
+
+# Path steps, Ex: "profile.stats['online time'].history[-1]"
+NAME, KEY, INDEX = 'name', 'key', 'index' # name is a dictionary key on dictionaries and an attribute otherwise
+_STEP_PATTERN = re.compile(r'''\.?([A-Za-z_]\w*)|\[\s*(-?\d+)\s*\]|\[\s*'([^']*)'\s*\]|\[\s*"([^"]*)"\s*\]''')
+
+
+def parsePath(path: str) -> List[Tuple[str, Any]]:
+    '''Parses a path into its steps, Ex: 'items[0].id' -> [('name', 'items'), ('index', 0), ('name', 'id')]'''
+    steps, position = [], 0
+    while position < len(path):
+        match = _STEP_PATTERN.match(path, position)
+        if match is None or (match.group(0).startswith('.') and position == 0):
+            raise ValueError("Invalid path {!r} at position {}.".format(path, position))
+        name, index, singleQuoted, doubleQuoted = match.groups()
+        if name is not None:
+            if position != 0 and not match.group(0).startswith('.'):
+                raise ValueError("Invalid path {!r} at position {}, expected '.' or '['.".format(path, position))
+            steps.append((NAME, name))
+        elif index is not None:
+            steps.append((INDEX, int(index)))
+        else:
+            steps.append((KEY, singleQuoted if singleQuoted is not None else doubleQuoted))
+        position = match.end()
+    if not steps:
+        raise ValueError("Path must not be empty.")
+    return steps
+
+
+class PathResolver:
+    '''
+    A path compiled once into a specialized getter, Ex: PathResolver('profile.stats.online_time').get(userData)
+    Names are dictionary keys on dictionaries and attributes on other objects, '[0]' is an index and "['key']" is an explicit key.
+    '''
+
+    __slots__ = ['path', 'steps', 'get']
+
+    def __init__(self, path: str):
+        self.path = path
+        self.steps = parsePath(path)
+        self.get = self._compileGetter()
+
+    def __repr__(self):
+        return "<{} Path={!r}>".format(self.__class__.__name__, self.path)
+
+    def _compileGetter(self):
+        '''Generates the getter, with every step inlined. get(obj, default=None) returns default if any step is missing.'''
+        namespace, lines = {}, []
+        for idx, (kind, key) in enumerate(self.steps):
+            namespace['k%d' % idx] = key
+            if kind == NAME:
+                lines.append('        obj = obj[k{0}] if isinstance(obj, dict) else getattr(obj, k{0})'.format(idx))
+            else:
+                lines.append('        obj = obj[k{0}]'.format(idx))
+        source = ('def get(obj, default=None):\n'
+                  '    try:\n' + '\n'.join(lines) + '\n'
+                  '    except (LookupError, AttributeError, TypeError):\n'
+                  '        return default\n'
+                  '    return obj\n')
+        exec(compile(source, '<PathResolver {!r}>'.format(self.path), 'exec'), namespace)
+        return namespace['get']
+
+    @staticmethod
+    def _step(obj, kind: str, key):
+        if kind == NAME and not isinstance(obj, dict):
+            return getattr(obj, key)
+        return obj[key]
+
+    def set(self, obj, value):
+        '''
+        Sets the value at the end of the path, creating the missing intermediates on the way, as lists before an index step and dictionaries otherwise.
+        Ex: 'items[0].id' on {} -> {'items': [{'id': value}]}. An index past the end of a list can only be appended, Ex: [2] of a list of 2 items,
+        further indexes raise IndexError.
+        '''
+        steps = self.steps
+        for idx in range(len(steps) - 1):
+            kind, key = steps[idx]
+            try:
+                obj = self._step(obj, kind, key)
+            except (KeyError, AttributeError, IndexError):
+                nextKind, nextKey = steps[idx + 1]
+                if nextKind == INDEX and nextKey != 0: # Checked before creating anything
+                    raise self._outOfRange(nextKey, 0) from None
+                child = [] if nextKind == INDEX else {}
+                self._assign(obj, kind, key, child)
+                obj = child
+        kind, key = steps[-1]
+        self._assign(obj, kind, key, value)
+
+    def _assign(self, obj, kind: str, key, value):
+        if kind == NAME and not isinstance(obj, dict):
+            setattr(obj, key, value)
+        elif kind == INDEX and isinstance(obj, list) and key == len(obj):
+            obj.append(value)
+        else:
+            try:
+                obj[key] = value
+            except IndexError:
+                raise self._outOfRange(key, len(obj)) from None
+
+    def _outOfRange(self, index: int, length: int) -> IndexError:
+        return IndexError("Index {} of path {!r} is out of range, the list has {} items and only index {} can be appended.".format(index, self.path, length, length))
+
+
+_COMPILED_PATHS = {}
+
+
+def compilePath(path: str) -> PathResolver:
+    '''Returns the PathResolver of given path, resolvers are stateless and shared between links with the same path.'''
+    resolver = _COMPILED_PATHS.get(path)
+    if resolver is None:
+        resolver = _COMPILED_PATHS[path] = PathResolver(path)
+    return resolver
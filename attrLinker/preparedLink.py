@@ -1,8 +1,13 @@
 
+import inspect
+import weakref
+
 from .attrLinker import LinkManager
 from .linkMethod import LinkMethod
 
 
+_TARGET_PARAMETERS = {} # Name and position of the targetVar or linkMap parameter of the link methods, Ex: {linkDictionary: ('targetVar', 0),...}
+
 class PreparedLink:
     
     __slots__ = ['linkMethod', 'sourceVar', 'executionArgs', 'executionKwargs', '_appliedClasses']
@@ -13,7 +18,7 @@ class PreparedLink:
         self.executionArgs = args
         self.executionKwargs = kwargs
         
-        self._appliedClasses = []
+        self._appliedClasses = weakref.WeakSet()
     
     def __repr__(self):
         return "<{} Method={} AppliedCount={}>".format(self.__class__.__name__, LinkMethod(self.linkMethod).name, len(self._appliedClasses))
@@ -24,7 +29,33 @@ class PreparedLink:
             manager.bind(targetClass, self.sourceVar, *self.executionArgs, **self.executionKwargs)
         else:
             self.linkMethod(targetClass, self.sourceVar, *self.executionArgs, **self.executionKwargs)
-        self._appliedClasses.append(targetClass)
+        self._appliedClasses.add(targetClass)
+
+    def targetVars(self):
+        '''
+        Returns the attribute names this link would be applied at, without applying it. Ex: the keys of linkMap for the Multi methods.
+        Returns None if they could not be determined from the arguments.
+        '''
+        method = self.linkMethod.getMethod()
+        if method is None:
+            method, skipped = LinkManager.bind, 3 # (managerSelf, targetClass, sourceVar, ...)
+        else:
+            skipped = 2 # (targetClass, sourceVar, ...)
+        found = _TARGET_PARAMETERS.get(method)
+        if found is None:
+            parameters = list(inspect.signature(method).parameters)
+            name = 'targetVar' if 'targetVar' in parameters else 'linkMap' if 'linkMap' in parameters else None
+            found = _TARGET_PARAMETERS[method] = (name, parameters.index(name) - skipped if name else None)
+        name, position = found
+        if name is None:
+            return None
+        if name in self.executionKwargs:
+            value = self.executionKwargs[name]
+        elif len(self.executionArgs) > position:
+            value = self.executionArgs[position]
+        else:
+            return [] if name == 'linkMap' else None
+        return [value] if name == 'targetVar' else list(value)
 
     @classmethod
     def applyLinks(targetClass, links:list):
@@ -1,12 +1,35 @@
-from .utils import DictUpdater
+import weakref
+
+from .utils import DefaultLambda, DictUpdater
 from .attrLinker import LinkManager
+from .textTemplate import CompiledTemplate
+from .columnStore import ColumnStore
+from .pathResolver import compilePath
+from .recordLayout import RecordLayout
+from . import sequences
+from .derived import derivedOf
+from .coercion import coercerOf, coercing
 
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Union, Any, Callable
 
 # TODO: Make presets on like, linking to a dictionary's value, list index x, manipulating numbers and strings, etc.
 # WARNING: For iterative linking, DO NOT use lambda directly, use it like in multiLinkDictionary using linkDictionary. OR you would be facing an issue, where every targetVar assigned, gets the last link converter.
 
-def linkDictionary(targetClass: type, sourceVar: str, targetVar: str, sourceDictKey: str = None, default: Any = None, enableSetter: Any = False, doc: str = '', **kw):
+def _coerceLink(coerce: Any, targetClass: type, targetVar: str, getterConverter: Callable, setterConverter: Callable, setterOverrider: Callable, accessSpec: tuple):
+    '''Wraps the converters of a link with the coercion of coerce, see coercerOf. The accessSpec is wrapped too, so specialized accessors read through the converters.'''
+    coercer = coercerOf(coerce)
+    classRef = weakref.ref(targetClass) # The converters are kept by the manager, they must not keep the class alive
+    getterConverter = coercing(coercer, getterConverter, lambda: (LinkManager._getDefault().linkerAt(classRef(), targetVar), targetVar))
+    if setterOverrider is not None:
+        overrider = setterOverrider
+        setterOverrider = lambda linkedSelf, linkedVar, replacement: overrider(linkedSelf, linkedVar, coercer.dump(replacement))
+    else:
+        converter = setterConverter
+        setterConverter = lambda linkedSelf, replacement: converter(linkedSelf, coercer.dump(replacement))
+    return getterConverter, setterConverter, setterOverrider, ('coerced', coercer, accessSpec)
+
+
+def linkDictionary(targetClass: type, sourceVar: str, targetVar: str, sourceDictKey: str = None, default: Any = None, enableSetter: Any = False, copyOnWrite: bool = False, doc: str = '', coerce: Any = None, **kw):
     '''
     Link an attribute on an instance of targetClass to the source attribute's key, where the source attribute type is dictionary.
     Example: linkDictionary(Foo, 'dictionary', 'bar', 'bar_key', default='default_value')
@@ -20,7 +43,9 @@ def linkDictionary(targetClass: type, sourceVar: str, targetVar: str, sourceDict
     sourceDictKey:str is the key to access the source dictionary, if None, use targetVar instead to access the dictionary.
     default:Any is the default return value for dictionary.get
     enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
+    copyOnWrite:bool whether the setter copies the source dictionary and rebinds the copy to sourceVar (snapshot semantics), instead of setting the key in place. Defaults to False(in place)
     doc:str is the documentation string for the property created
+    coerce:Any is the type the raw value is coerced to on get, and serialized back from on set, see coercerOf. Ex: int, datetime.datetime or an Enum class. Parsed strings are memoized. None for no coercion
     
     Extra keyword argument passed, would be passed directly to manager.bind
     '''
@@ -28,9 +53,17 @@ def linkDictionary(targetClass: type, sourceVar: str, targetVar: str, sourceDict
         sourceDictKey = targetVar
 
     getterConverter = lambda dict: dict.get(sourceDictKey, default)
-    setterConverter = lambda linkedSelf, replacement: DictUpdater(linkedSelf.__getattribute__(sourceVar), {sourceDictKey:replacement})
+    if copyOnWrite:
+        setterConverter = lambda linkedSelf, replacement: DictUpdater(linkedSelf.__getattribute__(sourceVar), {sourceDictKey:replacement})
+        setterOverrider = None
+    else:
+        setterConverter = DefaultLambda
+        setterOverrider = lambda linkedSelf, linkedVar, replacement: linkedSelf.__getattribute__(linkedVar).__setitem__(sourceDictKey, replacement)
+    accessSpec = ('item', sourceDictKey, default, copyOnWrite)
+    if coerce is not None:
+        getterConverter, setterConverter, setterOverrider, accessSpec = _coerceLink(coerce, targetClass, targetVar, getterConverter, setterConverter, setterOverrider, accessSpec)
     manager = LinkManager._getDefault()
-    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterConverter, setupOptions={'enableSetter': enableSetter}, doc=doc, **kw)
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterConverter, setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=accessSpec, **kw)
 
 
 def multiLinkDictionary(targetClass: type, sourceVar: str, linkMap: Union[Dict[str,str], List[str]] = {}, **kw):
@@ -52,11 +85,12 @@ def multiLinkDictionary(targetClass: type, sourceVar: str, linkMap: Union[Dict[s
         linkDictionary(targetClass, sourceVar, targetVar, sourceDictKey, **kw)
 
 
-def formattedTextFromDict(targetClass: type, sourceVar: str, targetVar: str, formattableText: str, **kw):
+def formattedTextFromDict(targetClass: type, sourceVar: str, targetVar: str, formattableText: str, default: Any = None, cache: bool = False, **kw):
     '''
     Creates a formatted text from given formattable_text which is formatted with the sourceVar dictionary.
     Similiar to linkDictionary, except you specify the dictionary keys in the formattableText, and you could specify multiple keys. Also setter is not available here.
-    Would incurr a KeyError if the key(s) in the formattable_text is not found in given source dictionary.
+    The text is compiled once, and only the keys referenced in it are extracted from the source dictionary on access. Format specs, conversions and nested fields are supported, Ex: '{user[name]:>10}'.
+    Would incurr a KeyError if the key(s) in the formattable_text is not found in given source dictionary, unless a default is given.
     Example: formattedTextFromDict(User, 'data', 'full_name', '{first_name} {last_name}')
     'User.full_name' value is '{first_name} {second_name}'.format(**User.data)
     
@@ -66,20 +100,26 @@ def formattedTextFromDict(targetClass: type, sourceVar: str, targetVar: str, for
     sourceVar:str is the source variable name of an instance of the targetClass, which must be of type dict
     targetVar:str is the attribute name on the class to be linked to
     formattableText:str is the text to be formatted with the data from the source. the format of the formattableText is "{key} {key2}" and so on.
+    default:Any is the replacement for fields whose key is missing from the source dictionary. if None, a KeyError is raised instead.
+    cache:bool whether to cache the formatted text per source dictionary, it is only formatted again when a value its fields resolve to changed, Ex: the name of {user[name]}. Defaults to False
     
     Extra keyword argument passed, would be passed directly to manager.bind
     '''
-    getterConverter = lambda dict: formattableText.format(**dict)
+    template = CompiledTemplate(formattableText, default=default, cache=cache)
+    getterConverter = template.render
     manager = LinkManager._getDefault()
-    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setupOptions={'enableSetter':False}, **kw)
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setupOptions={'enableSetter':False}, accessSpec=('template', template), **kw)
 
 
-def linkList(targetClass: type, sourceVar: str, targetVar: str, sourceIndex: int, enableSetter: bool = False, doc: str = '', **kw):
+def linkList(targetClass: type, sourceVar: str, targetVar: str, sourceIndex: int, enableSetter: bool = False, doc: str = '', coerce: Any = None, **kw):
     '''
     Link an attribute on an instance of targetClass to source attribute's item on given index. 
     Example: linkList(Foo, '_list_of_bars', 'first_bar', 0)
     'Foo.first_bar' Gets its value by 'Foo._list_of_bars[0]'
 
+    The source can be any sequence, Ex: list, tuple, deque, array.array, a buffer or a NumPy array. The setter assigns the index in place,
+    immutable sources (Ex: tuple) get a copy with the replaced item rebound to sourceVar instead.
+
     Params
     ------
     targetClass:type is the class for the linking to be applied at
@@ -88,32 +128,90 @@ def linkList(targetClass: type, sourceVar: str, targetVar: str, sourceIndex: int
     sourceIndex:int is the target index on the source object
     enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
     doc:str is the documentation string for the property created
+    coerce:Any is the type the raw value is coerced to on get, and serialized back from on set, see coercerOf. Ex: int, datetime.datetime or an Enum class. Parsed strings are memoized. None for no coercion
     
     Extra keyword argument passed, would be passed directly to manager.bind
     '''
     getterConverter = lambda _lst: _lst[sourceIndex]
-    setterOverrider = lambda linkedSelf, linkedVar, replacement: [linkedSelf.__getattribute__(linkedVar).pop(sourceIndex), linkedSelf.__getattribute__(linkedVar).insert(sourceIndex, replacement)]
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: sequences.assign(linkedSelf, linkedVar, sourceIndex, replacement)
+    accessSpec = ('index', sourceIndex)
+    if coerce is not None:
+        getterConverter, _, setterOverrider, accessSpec = _coerceLink(coerce, targetClass, targetVar, getterConverter, None, setterOverrider, accessSpec)
     manager = LinkManager._getDefault()
-    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, **kw)
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=accessSpec, **kw)
 
 
-def multiLinkList(targetClass: type, sourceVar: str, linkMap: Dict[str, int] = {}, **kw):
+def linkSlice(targetClass: type, sourceVar: str, targetVar: str, sourceSlice: slice, view: bool = True, enableSetter: bool = False, doc: str = '', **kw):
     '''
-    Calls linkList for every pair in linkMap.
+    Link an attribute on an instance of targetClass to a slice of the source attribute, where the source attribute is a sequence.
+    Example: linkSlice(Foo, 'messages', 'last_5', slice(-5, None))
+    'Foo.last_5' Gets its value by 'Foo.messages[-5:]'
 
     Params
     ------
     targetClass:type is the class for the linking to be applied at
-    sourceVar:str is the source variable name of an instance of the targetClass, which must be of type list
-    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:index_in_list,...}
+    sourceVar:str is the source variable name of an instance of the targetClass
+    targetVar:str is the attribute name on the class to be linked to
+    sourceSlice:slice is the slice of the source object
+    view:bool whether buffer sources (Ex: bytearray, array.array, mmap) are read as a memoryview of the slice, sharing their memory instead of copying it.
+    Other sources are sliced as is, NumPy arrays being views already. Defaults to True
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
 
-    Extra keyword argument passed, would be passed directly to linkList
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    getterConverter = sequences.sliceReader(sourceSlice, view)
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: sequences.assign(linkedSelf, linkedVar, sourceSlice, replacement)
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=('slice', sourceSlice, view), **kw)
+
+
+def linkIndexes(targetClass: type, sourceVar: str, targetVar: str, sourceIndexes: List[int], enableSetter: bool = False, doc: str = '', **kw):
+    '''
+    Link an attribute on an instance of targetClass to the items of the source attribute at several indexes, read as a tuple in one access.
+    Example: linkIndexes(Foo, 'point', 'xy', [0, 1])
+    'Foo.xy' Gets its value by '(Foo.point[0], Foo.point[1])', and setting it assigns both indexes.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass
+    targetVar:str is the attribute name on the class to be linked to
+    sourceIndexes:list is the indexes on the source object
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
+
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    sourceIndexes = tuple(sourceIndexes)
+    getterConverter = sequences.indexesReader(sourceIndexes)
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: sequences.assignMany(linkedSelf, linkedVar, sourceIndexes, replacement)
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=('indexes', sourceIndexes), **kw)
+
+
+def multiLinkList(targetClass: type, sourceVar: str, linkMap: Dict[str, Union[int, slice, List[int]]] = {}, **kw):
+    '''
+    Calls linkList for every pair in linkMap, or linkSlice for slices and linkIndexes for lists/tuples of indexes.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which must be a sequence
+    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:index_in_list,...}. Ex: {'first': 0, 'last_5': slice(-5, None), 'xy': (0, 1)}
+
+    Extra keyword argument passed, would be passed directly to linkList, linkSlice or linkIndexes
     '''
     for targetVar, sourceListIndex in linkMap.items():
-        linkList(targetClass, sourceVar, targetVar, sourceListIndex, **kw)
+        if isinstance(sourceListIndex, slice):
+            linkSlice(targetClass, sourceVar, targetVar, sourceListIndex, **kw)
+        elif isinstance(sourceListIndex, (list, tuple)):
+            linkIndexes(targetClass, sourceVar, targetVar, sourceListIndex, **kw)
+        else:
+            linkList(targetClass, sourceVar, targetVar, sourceListIndex, **kw)
 
 
-def linkObject(targetClass: type, sourceVar: str, targetVar: str, sourceAttribute: str = None, enableSetter: bool = False, doc: str = '', **kw):
+def linkObject(targetClass: type, sourceVar: str, targetVar: str, sourceAttribute: str = None, enableSetter: bool = False, doc: str = '', coerce: Any = None, **kw):
     '''
     Link an attribute on an instance of targetClass to source attribute's attribute, where the source attribute type is Any.
     Example: linkObject(Foo, 'obj', 'obj_attr1', 'attr_1')
@@ -127,6 +225,7 @@ def linkObject(targetClass: type, sourceVar: str, targetVar: str, sourceAttribut
     sourceAttribute:str is the attribute name on the source object, if None, use targetVar instead to access the object.
     enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
     doc:str is the documentation string for the property created
+    coerce:Any is the type the raw value is coerced to on get, and serialized back from on set, see coercerOf. Ex: int, datetime.datetime or an Enum class. Parsed strings are memoized. None for no coercion
     
     Extra keyword argument passed, would be passed directly to manager.bind
     '''
@@ -136,8 +235,11 @@ def linkObject(targetClass: type, sourceVar: str, targetVar: str, sourceAttribut
     getterConverter = lambda obj: obj.__getattribute__(sourceAttribute)
     #setterConverter = lambda linkedSelf, replacement: (lambda obj: [setattr(obj, sourceAttribute, replacement), obj][-1])(linkedSelf.__getattribute__(sourceVar))
     setterOverrider = lambda linkedSelf, linkedVar, replacement: setattr(linkedSelf.__getattribute__(linkedVar), sourceAttribute, replacement)
+    accessSpec = ('attribute', sourceAttribute)
+    if coerce is not None:
+        getterConverter, _, setterOverrider, accessSpec = _coerceLink(coerce, targetClass, targetVar, getterConverter, None, setterOverrider, accessSpec)
     manager = LinkManager._getDefault()
-    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, **kw)
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=accessSpec, **kw)
 
 
 def multiLinkObject(targetClass: type, sourceVar: str, linkMap: Union[Dict[str, str], List[str]] = {}, **kw):
@@ -157,3 +259,232 @@ def multiLinkObject(targetClass: type, sourceVar: str, linkMap: Union[Dict[str,
 
     for targetVar, sourceObjectAttr in linkMap.items():
         linkList(targetClass, sourceVar, targetVar, sourceObjectAttr, **kw)
+
+
+def linkColumn(targetClass: type, sourceVar: str, targetVar: str, store: ColumnStore, column: str = None, enableSetter: bool = False, doc: str = '', **kw):
+    '''
+    Link an attribute on an instance of targetClass to a column of a ColumnStore, where the source attribute is the instance's row index in the store.
+    Example: linkColumn(Foo, 'row', 'onlineTime', STORE, 'online_time')
+    'Foo.onlineTime' Gets value by 'STORE.columns['online_time'][Foo.row]'
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the row index of the instance
+    targetVar:str is the attribute name on the class to be linked to
+    store:ColumnStore is the store shared by the instances
+    column:str is the column name in the store, if None, use targetVar instead.
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
+    
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    if column is None:
+        column = targetVar
+
+    columns = store.columns # The store replaces its columns when it grows, so they are looked up on every access.
+    getterConverter = lambda row: columns[column][row]
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: columns[column].__setitem__(linkedSelf.__getattribute__(linkedVar), replacement)
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=('column', store, column), **kw)
+
+
+def multiLinkColumn(targetClass: type, sourceVar: str, store: ColumnStore, linkMap: Union[Dict[str, str], List[str]] = {}, **kw):
+    '''
+    Calls linkColumn for every pair in linkMap.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the row index of the instance
+    store:ColumnStore is the store shared by the instances
+    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:column_name,...} or [attribute_name_and_column_name,...], where if you pass a list, it will generate the mapping from the list instead.
+
+    Extra keyword argument passed, would be passed directly to linkColumn
+    '''
+    if isinstance(linkMap, list):
+        linkMap = {entry:entry for entry in linkMap} # Generate the dict mapping from list.
+
+    for targetVar, column in linkMap.items():
+        linkColumn(targetClass, sourceVar, targetVar, store, column, **kw)
+
+
+def linkPath(targetClass: type, sourceVar: str, targetVar: str, path: str = None, default: Any = None, enableSetter: bool = False, doc: str = '', coerce: Any = None, **kw):
+    '''
+    Link an attribute on an instance of targetClass to a nested value of the source attribute, following given path.
+    The path is compiled once, names in it are dictionary keys on dictionaries and attributes on other objects, '[0]' is an index and "['key']" is an explicit key.
+    Example: linkPath(Foo, 'data', 'online_time', 'profile.stats.online_time')
+    'Foo.online_time' Gets value by 'Foo.data['profile']['stats']['online_time']'
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass
+    targetVar:str is the attribute name on the class to be linked to
+    path:str is the path to the value in the source, if None, use targetVar instead.
+    default:Any is the return value when any step of the path is missing
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Missing intermediates are created on set, as lists before an index and dictionaries otherwise. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
+    coerce:Any is the type the raw value is coerced to on get, and serialized back from on set, see coercerOf. Ex: int, datetime.datetime or an Enum class. Parsed strings are memoized. None for no coercion
+    
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    resolver = compilePath(targetVar if path is None else path)
+    resolve = resolver.get
+    getterConverter = lambda source: resolve(source, default)
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: resolver.set(linkedSelf.__getattribute__(linkedVar), replacement)
+    accessSpec = ('path', resolver, default)
+    if coerce is not None:
+        getterConverter, _, setterOverrider, accessSpec = _coerceLink(coerce, targetClass, targetVar, getterConverter, None, setterOverrider, accessSpec)
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=accessSpec, **kw)
+
+
+def multiLinkPath(targetClass: type, sourceVar: str, linkMap: Union[Dict[str, str], List[str]] = {}, **kw):
+    '''
+    Calls linkPath for every pair in linkMap.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass
+    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:path_in_source,...} or [attribute_name_and_path,...], where if you pass a list, it will generate the mapping from the list instead.
+
+    Extra keyword argument passed, would be passed directly to linkPath
+    '''
+    if isinstance(linkMap, list):
+        linkMap = {entry:entry for entry in linkMap} # Generate the dict mapping from list.
+
+    for targetVar, path in linkMap.items():
+        linkPath(targetClass, sourceVar, targetVar, path, **kw)
+
+
+def linkSharedRecord(targetClass: type, sourceVar: str, targetVar: str, layout: RecordLayout, field: str = None, enableSetter: bool = False, doc: str = '', **kw):
+    '''
+    Link an attribute on an instance of targetClass to a field of a SharedRecord, where the source attribute is a record of a SharedRecordStore.
+    The field is decoded straight from the shared memory on every read, so processes which got the instance unpickled read the owner's current value.
+    Example: linkSharedRecord(Foo, 'record', 'onlineTime', STORE.layout, 'online_time')
+    'Foo.onlineTime' Gets value by 'Foo.record['online_time']'
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the SharedRecord of the instance
+    targetVar:str is the attribute name on the class to be linked to
+    layout:RecordLayout is the layout of the store's records
+    field:str is the field name in the layout, if None, use targetVar instead.
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Only the owner process of the store can set. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
+    
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    if field is None:
+        field = targetVar
+
+    read = layout.reader(field)
+    getterConverter = lambda record: read(record.buffer, record.offset)
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: linkedSelf.__getattribute__(linkedVar).update(**{field: replacement})
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=('sharedRecord', layout, field), **kw)
+
+
+def multiLinkSharedRecord(targetClass: type, sourceVar: str, layout: RecordLayout, linkMap: Union[Dict[str, str], List[str]] = {}, **kw):
+    '''
+    Calls linkSharedRecord for every pair in linkMap.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the SharedRecord of the instance
+    layout:RecordLayout is the layout of the store's records
+    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:field_name,...} or [attribute_name_and_field_name,...], where if you pass a list, it will generate the mapping from the list instead.
+
+    Extra keyword argument passed, would be passed directly to linkSharedRecord
+    '''
+    if isinstance(linkMap, list):
+        linkMap = {entry:entry for entry in linkMap} # Generate the dict mapping from list.
+
+    for targetVar, field in linkMap.items():
+        linkSharedRecord(targetClass, sourceVar, targetVar, layout, field, **kw)
+
+
+def linkStruct(targetClass: type, sourceVar: str, targetVar: str, layout: RecordLayout, field: str = None, enableSetter: bool = False, doc: str = '', **kw):
+    '''
+    Link an attribute on an instance of targetClass to a field of a packed binary record, where the source attribute is a bytes, bytearray or memoryview of the record.
+    Only the linked field is decoded on read, with struct.unpack_from. Writes pack the field in place, bytes sources are copied and rebound instead, being immutable.
+    Example: linkStruct(Foo, 'record', 'price', FEED_LAYOUT)
+    'Foo.price' Gets value by 'struct.unpack_from('<d', Foo.record, FEED_LAYOUT.offsets['price'])[0]'
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the bytes of the record
+    targetVar:str is the attribute name on the class to be linked to
+    layout:RecordLayout is the layout of the record
+    field:str is the field name in the layout, if None, use targetVar instead.
+    enableSetter:bool is basically, whether you want the targetVar attribute to have read-only access or full-access to the variable. Defaults to False(read-only)
+    doc:str is the documentation string for the property created
+    
+    Extra keyword argument passed, would be passed directly to manager.bind
+    '''
+    if field is None:
+        field = targetVar
+
+    read, write = layout.reader(field), layout.writer(field)
+    getterConverter = lambda record: read(record, 0)
+    setterOverrider = lambda linkedSelf, linkedVar, replacement: _writeStructField(linkedSelf, linkedVar, write, replacement)
+    manager = LinkManager._getDefault()
+    manager.bind(targetClass, sourceVar, targetVar, getterConverter, setterOverrider=setterOverrider, setupOptions={'enableSetter': enableSetter}, doc=doc, accessSpec=('struct', layout, field), **kw)
+
+
+def _writeStructField(linkedSelf, linkedVar: str, write, replacement):
+    '''Packs replacement into the record at linkedVar of linkedSelf, in place unless the record is bytes.'''
+    record = linkedSelf.__getattribute__(linkedVar)
+    if isinstance(record, bytes):
+        record = bytearray(record)
+        write(record, 0, replacement)
+        setattr(linkedSelf, linkedVar, bytes(record))
+    else:
+        write(record, 0, replacement)
+
+
+def multiLinkStruct(targetClass: type, sourceVar: str, layout: RecordLayout, linkMap: Union[Dict[str, str], List[str]] = None, **kw):
+    '''
+    Calls linkStruct for every pair in linkMap.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    sourceVar:str is the source variable name of an instance of the targetClass, which holds the bytes of the record
+    layout:RecordLayout is the layout of the record
+    linkMap:dict is the mapping for the linking, the mapping should be in the format as follows: {attribute_name_on_instance:field_name,...} or [attribute_name_and_field_name,...], where if you pass a list, it will generate the mapping from the list instead. If None, every field of the layout is linked under its own name.
+
+    Extra keyword argument passed, would be passed directly to linkStruct
+    '''
+    if linkMap is None:
+        linkMap = list(layout.fields)
+    if isinstance(linkMap, list):
+        linkMap = {entry:entry for entry in linkMap} # Generate the dict mapping from list.
+
+    for targetVar, field in linkMap.items():
+        linkStruct(targetClass, sourceVar, targetVar, layout, field, **kw)
+
+
+def linkDerived(targetClass: type, dependsOn: List[str], targetVar: str, compute: Callable, doc: str = ''):
+    '''
+    Link a read-only attribute on an instance of targetClass to a value computed from other attributes of the instance, linked or not.
+    The value is cached per instance, and only recomputed once a dependency changed, see DependencyGraph.
+    Example: linkDerived(Foo, ['sent', 'onlineTime'], 'rate', lambda sent, onlineTime: sent / onlineTime)
+    'Foo.rate' Gets its value by 'Foo.sent / Foo.onlineTime', computed again after 'Foo.sent' is set or 'Foo.userData' is replaced.
+
+    Params
+    ------
+    targetClass:type is the class for the linking to be applied at
+    dependsOn:list is the names of the attributes the value is computed from, linked attributes, derived attributes or instance variables
+    targetVar:str is the attribute name on the class to be linked to
+    compute:Callable is the function computing the value, called with the value of every dependency in order
+    doc:str is the documentation string for the attribute created
+    '''
+    if isinstance(dependsOn, str):
+        dependsOn = [dependsOn]
+    derivedOf(targetClass, create=True).add(targetVar, compute, dependsOn, doc)
@@ -1,30 +1,153 @@
+import time
+import weakref
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+
+from .exceptions import LinkerNotFound
+
+
+class CachedProp:
+    '''
+    Cached prop of a PropBinder. It is applied as a property computing the value on the first read, which then replaces itself
+    with a property returning the value as is, so steady-state reads are a plain property call. invalidate puts the computing property back.
+    With a ttl or a version on the binder, the applied property checks them on every read instead.
+    '''
+
+    __slots__ = ['binder', 'converter', 'target_class', 'target_name', 'installed', 'value', 'expires', 'version']
+
+    def __init__(self, binder, converter):
+        self.binder = binder
+        self.converter = converter
+        self.target_class = None # Weak reference, the binder's propList is weak keyed by the class
+        self.target_name = None
+        self.installed = None # The property currently set on the class
+        self.value = self.expires = self.version = None
+
+    def __repr__(self):
+        return "<{} Target={}>".format(self.__class__.__name__, self.target_name)
+
+    def apply(self, target_class, target_name):
+        self.target_class = weakref.ref(target_class)
+        self.target_name = target_name
+        self.invalidate()
+
+    def _install(self, fget):
+        target_class = self.target_class()
+        if target_class is not None:
+            self.installed = property(fget)
+            setattr(target_class, self.target_name, self.installed)
+
+    def invalidate(self):
+        '''Drops the cached value, the next read computes it again.'''
+        if self.target_class is None:
+            return
+        binder = self.binder
+        if binder.ttl is None and binder.version is None:
+            self._install(self._compute)
+        else:
+            self.expires = None
+            self._install(self._checked)
+
+    def _compute(self, _self):
+        value = self.converter(self.binder.source_obj)
+        target_class = self.target_class()
+        if target_class is not None and target_class.__dict__.get(self.target_name) is self.installed: # Not unbound or invalidated meanwhile
+            self._install(lambda _self: value)
+        return value
+
+    def _checked(self, _self):
+        binder = self.binder
+        if self.expires is None or (binder.ttl is not None and time.monotonic() >= self.expires) or (binder.version is not None and binder.version() != self.version):
+            if binder.version is not None:
+                self.version = binder.version()
+            self.value = self.converter(binder.source_obj)
+            self.expires = time.monotonic() + binder.ttl if binder.ttl is not None else float('inf')
+        return self.value
+
 
 class PropBinder:
     '''
     PropBinder behaves similiarly to the whole attrLinker, but, PropBinder makes all instance of the applied/binded class to a specific instance's value.
-    
-    PropBinder has the advantage of being bindable to other object, without connection to the object going to be binded. 
+
+    PropBinder has the advantage of being bindable to other object, without connection to the object going to be binded.
     Unlike Linker, which can only bind to object that is its attribute.
 
     PropBinder might be of use to apps which only allow up to 1 instance of a class.
+
+    With cache=True, converters are only called on the first read, until invalidate is called, the ttl expires, or the version changes.
+    Ex: PropBinder(CONFIG, cache=True, version=lambda: CONFIG.version).bindMany(App, ['debug', 'theme'])
     '''
-    def __init__(self, source_obj):
+    def __init__(self, source_obj, cache=False, ttl=None, version=None):
+        '''
+        Params
+        ------
+        source_obj:Any is the object the props are converted from
+        cache:bool whether props cache their converted value by default
+        ttl:float is the seconds a cached value is kept for, None to keep it until invalidated
+        version:Callable returns a counter of the source_obj, cached values are recomputed whenever it changes. None for no version check.
+        '''
         self.source_obj = source_obj
-        self.propList = {}
-    
+        self.cache = cache
+        self.ttl = ttl
+        self.version = version
+        self.propList = weakref.WeakKeyDictionary() # Props applied per class, Ex: {Class1: {target_name1: prop1,...},...}
+
     def __repr__(self):
         return "<{} Source={}>".format(self.__class__.__name__, self.source_obj)
-    
-    def createProp(self, converter=lambda x:x):
+
+    def createProp(self, converter=lambda x:x, cache=None):
+        '''Creates the prop of given converter, cached if cache is True, or if cache is None and the binder caches by default.'''
+        if cache is None:
+            cache = self.cache
+        if cache:
+            return CachedProp(self, converter)
         def _func(_self):
             return converter(self.source_obj)
         return property(_func)
-    
+
     def applyProp(self, prop, target_class, target_name):
-        setattr(target_class, target_name, prop)
-        self.propList["{}.{}".format(target_class, target_name)] = prop
-    
-    def bind(self, target_class, target_name, converter=lambda x:x):
-        prop = self.createProp(converter)
+        if isinstance(prop, CachedProp):
+            prop.apply(target_class, target_name)
+        else:
+            setattr(target_class, target_name, prop)
+        self.propList.setdefault(target_class, {})[target_name] = prop
+
+    def bind(self, target_class, target_name, converter=lambda x:x, cache=None):
+        prop = self.createProp(converter, cache)
         return self.applyProp(prop, target_class, target_name)
-        
+
+    def bindMany(self, target_class, converters, cache=None):
+        '''
+        Binds many props to target_class at once.
+
+        Params
+        ------
+        target_class:type is the class to bind to
+        converters:dict is the mapping of target name to converter, or a list of names, each bound to the item (for mappings) or attribute of the same name of the source_obj
+        cache:bool whether the props cache their value, the binder's default if None
+        '''
+        if isinstance(converters, (list, tuple)):
+            getter = itemgetter if isinstance(self.source_obj, Mapping) else attrgetter
+            converters = {name: getter(name) for name in converters}
+        for target_name, converter in converters.items():
+            self.bind(target_class, target_name, converter, cache)
+
+    def unbind(self, target_class, target_name):
+        '''Removes the prop at target_name of target_class.'''
+        props = self.propList.get(target_class, {})
+        if target_name not in props:
+            raise LinkerNotFound("No prop of this binder is applied to {}.{}".format(target_class.__name__, target_name))
+        prop = props.pop(target_name)
+        if not props:
+            del self.propList[target_class]
+        if target_class.__dict__.get(target_name) is (prop.installed if isinstance(prop, CachedProp) else prop):
+            delattr(target_class, target_name)
+
+    def invalidate(self, target_class=None, target_name=None):
+        '''Drops the cached values, of every prop, of the props of target_class, or of a single prop. Ex: after replacing or mutating the source_obj.'''
+        for klass, props in list(self.propList.items()):
+            if target_class is not None and klass is not target_class:
+                continue
+            for name, prop in props.items():
+                if isinstance(prop, CachedProp) and (target_name is None or name == target_name):
+                    prop.invalidate()
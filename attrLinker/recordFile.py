@@ -0,0 +1,96 @@
+import mmap
+
+from typing import Iterator
+
+from .recordLayout import RecordLayout
+
+
+class RecordFile:
+    '''
+    File of fixed size binary records of a RecordLayout, memory mapped so records are read from the page cache on access instead of being loaded.
+    Records are memoryview slices of the mapping, to be held as the source of Struct linked instances. Writable files are written in place.
+
+    Example:
+    with RecordFile('feed.bin', FEED_LAYOUT) as feed:
+        for quote in feed.instances(Quote, 'record'):
+            ...
+
+    Note that the mapping can't be closed while records of it are still referenced.
+    '''
+
+    __slots__ = ['path', 'layout', 'offset', 'stride', 'writable', 'file', 'map', 'view']
+
+    def __init__(self, path: str, layout: RecordLayout, offset: int = 0, stride: int = None, writable: bool = False):
+        '''
+        Params
+        ------
+        path:str is the path of the record file
+        layout:RecordLayout is the layout of the records
+        offset:int is the size of the file header, skipped before the first record
+        stride:int is the bytes between the start of two records, the layout size if None
+        writable:bool whether to map the file for writing, so enabled setters write through to the file
+        '''
+        self.path = path
+        self.layout = layout
+        self.offset = offset
+        self.stride = stride or layout.size
+        self.writable = writable
+        self.file = open(path, 'r+b' if writable else 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except ValueError: # Empty files can not be mapped
+            self.map = None
+        self.view = memoryview(self.map if self.map is not None else b'')
+
+    def __repr__(self):
+        return "<{} Path={!r} Records={} Writable={}>".format(self.__class__.__name__, self.path, len(self), self.writable)
+
+    def __len__(self):
+        return max(0, (len(self.view) - self.offset + self.stride - self.layout.size) // self.stride)
+
+    def __getitem__(self, index: int) -> memoryview:
+        '''Returns the record at index, a memoryview slice of the mapping which is not copied.'''
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Record index out of range.")
+        start = self.offset + index * self.stride
+        return self.view[start:start + self.layout.size]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return (self[index] for index in range(len(self)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def instances(self, linkedClass: type, sourceVar: str, start: int = 0, stop: int = None) -> Iterator:
+        '''
+        Yields an instance of linkedClass per record, with the record as its sourceVar. Instances are created without calling __init__, as they are yielded.
+
+        Params
+        ------
+        linkedClass:type is the Struct linked class of the instances
+        sourceVar:str is the source attribute name of an instance, which holds the record
+        start:int is the index of the first record
+        stop:int is the index after the last record, the end of the file if None
+        '''
+        for index in range(start, len(self) if stop is None else stop):
+            instance = linkedClass.__new__(linkedClass)
+            setattr(instance, sourceVar, self[index])
+            yield instance
+
+    def flush(self):
+        '''Flushes the writes to the file.'''
+        if self.map is not None:
+            self.map.flush()
+
+    def close(self):
+        '''Closes the mapping and the file, every record of the file must have been released beforehand.'''
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
@@ -0,0 +1,94 @@
+import struct
+
+from typing import Any, Callable, Dict, Tuple, Union
+
+
+class RecordLayout:
+    '''
+    Fixed binary layout of a record, mapping field names to struct formats packed one after the other, without padding, or at explicit offsets.
+    Fields are decoded one at a time with struct.unpack_from, straight from the buffer holding the records.
+    Bytes fields ('16s') are read with their trailing null bytes stripped, and accept str on write, which is encoded as UTF-8.
+
+    Example:
+    USER_LAYOUT = RecordLayout({'id': 'q', 'onlineTime': 'd', 'name': '32s'})
+    FEED_LAYOUT = RecordLayout({'price': ('d', 8), 'volume': ('I', 16)}, size=24) # Fields at explicit offsets
+    '''
+
+    __slots__ = ['fields', 'byteOrder', 'offsets', 'structs', 'size', '_readers', '_writers']
+
+    def __init__(self, fields: Dict[str, Union[str, Tuple[str, int]]], byteOrder: str = '<', size: int = None):
+        '''
+        Params
+        ------
+        fields:dict is the mapping of field name to struct format, in record order, or to (format, offset) for fields at an explicit offset. Ex: {'id': 'q', 'name': ('32s', 16)}
+        byteOrder:str is the struct byte order prefix shared by the fields, little-endian by default
+        size:int is the size of a record in bytes, if None, the end of its last field
+        '''
+        self.fields = dict(fields)
+        self.byteOrder = byteOrder
+        self.offsets, self.structs, offset, end = {}, {}, 0, 0
+        for name, fmt in self.fields.items():
+            if isinstance(fmt, tuple):
+                fmt, offset = fmt
+            self.offsets[name] = offset
+            self.structs[name] = struct.Struct(byteOrder + fmt)
+            offset += self.structs[name].size
+            end = max(end, offset)
+        if size is not None and size < end:
+            raise ValueError("Record size {} is smaller than the end of its fields, {}.".format(size, end))
+        self.size = end if size is None else size
+        self._readers, self._writers = {}, {}
+
+    def __repr__(self):
+        return "<{} Fields={} Size={}>".format(self.__class__.__name__, self.fields, self.size)
+
+    def __reduce__(self):
+        return (self.__class__, (self.fields, self.byteOrder, self.size))
+
+    def __eq__(self, other):
+        return isinstance(other, RecordLayout) and (self.fields, self.byteOrder, self.size) == (other.fields, other.byteOrder, other.size)
+
+    def __hash__(self):
+        return hash((tuple(self.fields.items()), self.byteOrder, self.size))
+
+    def _isBytes(self, field: str) -> bool:
+        return self.structs[field].format.endswith(('s', 'p'))
+
+    def reader(self, field: str) -> Callable[[Any, int], Any]:
+        '''Returns the function reading field from a buffer, called with (buffer, recordOffset).'''
+        reader = self._readers.get(field)
+        if reader is None:
+            unpack, fieldOffset = self.structs[field].unpack_from, self.offsets[field]
+            if self._isBytes(field):
+                reader = lambda buffer, offset: unpack(buffer, offset + fieldOffset)[0].rstrip(b'\0')
+            else:
+                reader = lambda buffer, offset: unpack(buffer, offset + fieldOffset)[0]
+            reader = self._readers[field] = reader
+        return reader
+
+    def writer(self, field: str) -> Callable[[Any, int, Any], None]:
+        '''Returns the function writing field into a writable buffer, called with (buffer, recordOffset, value).'''
+        writer = self._writers.get(field)
+        if writer is None:
+            pack, fieldOffset = self.structs[field].pack_into, self.offsets[field]
+            if self._isBytes(field):
+                writer = lambda buffer, offset, value: pack(buffer, offset + fieldOffset, value.encode() if isinstance(value, str) else value)
+            else:
+                writer = lambda buffer, offset, value: pack(buffer, offset + fieldOffset, value)
+            writer = self._writers[field] = writer
+        return writer
+
+    def read(self, buffer, offset: int, field: str):
+        return self.reader(field)(buffer, offset)
+
+    def write(self, buffer, offset: int, field: str, value: Any):
+        self.writer(field)(buffer, offset, value)
+
+    def unpack(self, buffer, offset: int = 0) -> Dict[str, Any]:
+        '''Decodes every field of the record at offset, Ex: {'id': 1, 'onlineTime': 2.5, 'name': b'Foo'}'''
+        return {field: self.reader(field)(buffer, offset) for field in self.fields}
+
+    def pack(self, buffer, offset: int = 0, values: Dict[str, Any] = {}):
+        '''Encodes given fields into the record at offset, fields not given are left as is.'''
+        for field, value in values.items():
+            self.writer(field)(buffer, offset, value)
@@ -0,0 +1,198 @@
+import asyncio
+import random
+import time
+import weakref
+
+from typing import Any, Awaitable, Callable, Dict
+
+from .collection import LinkedCollection
+
+
+class RefreshMetrics:
+    '''Fetch metrics of a refreshed target, times are from time.monotonic and durations are in seconds.'''
+
+    __slots__ = ['latency', 'lastAttempt', 'lastSuccess', 'successes', 'failures', 'consecutiveFailures', 'lastError']
+
+    def __init__(self):
+        self.latency = None # Duration of the last fetch, failed or not
+        self.lastAttempt = None
+        self.lastSuccess = None
+        self.successes = self.failures = self.consecutiveFailures = 0
+        self.lastError = None
+
+    def __repr__(self):
+        return "<{} Latency={} Staleness={} Failures={}>".format(self.__class__.__name__, self.latency, self.staleness, self.failures)
+
+    @property
+    def staleness(self):
+        '''Seconds since the source was last replaced, None if it never was.'''
+        return None if self.lastSuccess is None else time.monotonic() - self.lastSuccess
+
+
+class AsyncRefresher:
+    '''
+    Refreshes the sources of linked instances in the background with asyncio, with stale-while-revalidate semantics.
+    A source is only replaced once its fetch succeeds, in a single assignment, so linked attribute reads keep serving the last good source and never wait on a fetch.
+
+    Per instance, fetch is called with the instance and returns its new source, which is assigned to sourceVar.
+    Per collection, fetch is called without arguments and returns the payloads, which are passed to LinkedCollection.refresh.
+
+    Example:
+    refresher = AsyncRefresher(fetchUser, sourceVar='userData', interval=30)
+    refresher.add(user)
+    refresher.start() # Within a running event loop
+    '''
+
+    def __init__(self, fetch: Callable[..., Awaitable[Any]], sourceVar: str = None, collection: LinkedCollection = None, interval: float = 30.0, jitter: float = 0.1, concurrency: int = 10, timeout: float = None):
+        '''
+        Params
+        ------
+        fetch:Callable is the coroutine function which fetches the new source of an instance, or the payloads of the collection
+        sourceVar:str is the source attribute name of the instances, for per instance refreshes
+        collection:LinkedCollection is the refreshed collection, for per collection refreshes
+        interval:float is the seconds between the start of two refresh rounds
+        jitter:float is the relative random variation of the interval, Ex: 0.1 makes it vary by +-10%
+        concurrency:int is the maximum amount of fetches in flight at once
+        timeout:float is the maximum seconds of a fetch, it is counted as failed afterwards. None for no timeout.
+        '''
+        if (sourceVar is None) == (collection is None):
+            raise ValueError("AsyncRefresher needs either a sourceVar, to refresh instances, or a collection.")
+        self.fetch = fetch
+        self.sourceVar = sourceVar
+        self.collection = collection
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.instances = weakref.WeakKeyDictionary() # Refreshed instances and their metrics, Ex: {instance: RefreshMetrics,...}
+        self.collectionMetrics = RefreshMetrics()
+        self._task = None
+
+    def __repr__(self):
+        target = self.collection if self.collection is not None else "{} instances".format(len(self.instances))
+        return "<{} Target={} Interval={} Running={}>".format(self.__class__.__name__, target, self.interval, self.running)
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def add(self, instance):
+        '''Adds an instance to be refreshed, instances are held weakly.'''
+        self.instances.setdefault(instance, RefreshMetrics())
+
+    def discard(self, instance):
+        self.instances.pop(instance, None)
+
+    def metrics(self, instance=None) -> RefreshMetrics:
+        '''Returns the metrics of given instance, or of the collection if None.'''
+        return self.collectionMetrics if instance is None else self.instances[instance]
+
+    def maxStaleness(self):
+        '''Returns the staleness of the stalest target, None if a target was never refreshed.'''
+        metrics = [self.collectionMetrics] if self.collection is not None else list(self.instances.values())
+        stalenesses = [metric.staleness for metric in metrics]
+        if None in stalenesses:
+            return None
+        return max(stalenesses, default=0.0)
+
+    async def _fetch(self, metrics: RefreshMetrics, *args):
+        '''Calls fetch and records its metrics, returns (succeeded, result).'''
+        start = metrics.lastAttempt = time.monotonic()
+        try:
+            if self.timeout is None:
+                result = await self.fetch(*args)
+            else:
+                result = await asyncio.wait_for(self.fetch(*args), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            metrics.latency = time.monotonic() - start
+            self._failed(metrics, exc)
+            return False, None
+        metrics.latency = time.monotonic() - start
+        return True, result
+
+    @staticmethod
+    def _failed(metrics: RefreshMetrics, error: Exception):
+        metrics.failures += 1
+        metrics.consecutiveFailures += 1
+        metrics.lastError = error
+
+    @staticmethod
+    def _succeeded(metrics: RefreshMetrics):
+        metrics.lastSuccess = time.monotonic()
+        metrics.successes += 1
+        metrics.consecutiveFailures = 0
+        metrics.lastError = None
+
+    async def _refreshInstance(self, instance, metrics: RefreshMetrics, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            succeeded, source = await self._fetch(metrics, instance)
+        if not succeeded:
+            return
+        try:
+            setattr(instance, self.sourceVar, source) # Atomic swap, readers either see the previous source or the new one
+        except Exception as exc: # Ex: rejected by an index, recorded like a failed fetch so the other refreshes go on
+            self._failed(metrics, exc)
+        else:
+            self._succeeded(metrics)
+
+    async def refreshOnce(self):
+        '''
+        Runs a single refresh round. Failed fetches, and sources which failed to be applied (Ex: an invalid payload), are recorded in the metrics
+        and leave the previous source in place, so a background refresh keeps running through them.
+        '''
+        if self.collection is not None:
+            succeeded, payloads = await self._fetch(self.collectionMetrics)
+            if not succeeded:
+                return
+            try:
+                self.collection.refresh(payloads)
+            except Exception as exc:
+                self._failed(self.collectionMetrics, exc)
+            else:
+                self._succeeded(self.collectionMetrics)
+            return
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*[self._refreshInstance(instance, metrics, semaphore) for instance, metrics in list(self.instances.items())])
+
+    def nextDelay(self) -> float:
+        '''Returns the jittered delay until the next refresh round.'''
+        return max(0.0, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def run(self, rounds: int = None):
+        '''Refreshes the targets every jittered interval, for given amount of rounds or until cancelled.'''
+        done = 0
+        while rounds is None or done < rounds:
+            started = time.monotonic()
+            await self.refreshOnce()
+            done += 1
+            if rounds is None or done < rounds:
+                await asyncio.sleep(max(0.0, self.nextDelay() - (time.monotonic() - started)))
+
+    def start(self) -> asyncio.Task:
+        '''Starts refreshing in the background of the running event loop, returns the task.'''
+        if not self.running:
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        '''Stops the background refresh, waiting for it to be cancelled.'''
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        '''Returns aggregated metrics of every target.'''
+        metrics = [self.collectionMetrics] if self.collection is not None else list(self.instances.values())
+        latencies = [metric.latency for metric in metrics if metric.latency is not None]
+        return {'targets': len(metrics),
+                'failures': sum(metric.failures for metric in metrics),
+                'maxLatency': max(latencies, default=None),
+                'meanLatency': sum(latencies) / len(latencies) if latencies else None,
+                'maxStaleness': self.maxStaleness()}
@@ -0,0 +1,80 @@
+import array
+import mmap
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+from typing import Any, Sequence
+
+
+_BUFFERS = (bytes, bytearray, memoryview, array.array, mmap.mmap) # Sliced through a memoryview, without copying
+
+
+def sliceReader(sourceSlice: slice, view: bool = True):
+    '''
+    Returns a function reading sourceSlice of a sequence. With view=True, buffer sources (bytes, bytearray, array.array, mmap, memoryview)
+    are sliced through a memoryview, which shares their memory instead of copying it. NumPy arrays are views when sliced anyway.
+    Note that bytearray and array.array sources can not be resized while a view of them is alive.
+    '''
+    def read(source):
+        if view and isinstance(source, _BUFFERS):
+            return memoryview(source)[sourceSlice]
+        if isinstance(source, deque): # Not sliceable
+            start, stop, step = sourceSlice.indices(len(source))
+            return list(islice(source, start, stop, step)) if step > 0 else list(source)[sourceSlice]
+        return source[sourceSlice]
+    return read
+
+
+def indexesReader(indexes: Sequence[int]):
+    '''Returns a function reading the items at indexes of a sequence as a tuple, in a single itemgetter call.'''
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda source: (source[index],)
+    return itemgetter(*indexes)
+
+
+def replaced(source, key, replacement):
+    '''Returns a copy of an immutable sequence, or of a deque for slices, with the item(s) at key (an index or a slice) replaced.'''
+    items = list(source)
+    items[key] = replacement
+    if isinstance(source, str):
+        return ''.join(items)
+    if isinstance(source, deque):
+        return deque(items, source.maxlen)
+    if isinstance(source, array.array):
+        return array.array(source.typecode, items)
+    if isinstance(source, tuple) and hasattr(source, '_fields'): # namedtuple
+        return type(source)(*items)
+    return type(source)(items)
+
+
+def assign(linkedSelf, linkedVar: str, key, replacement):
+    '''
+    Sets the item(s) at key (an index or a slice) of the sequence at linkedVar of linkedSelf, in place, which is O(1) for an index of a list, an array or a buffer.
+    Sequences which can not be assigned in place (Ex: tuple, bytes, str, or a slice of a deque) get a copy with the replacement rebound to linkedVar instead.
+    '''
+    source = linkedSelf.__getattribute__(linkedVar)
+    try:
+        source[key] = replacement
+    except TypeError:
+        if isinstance(source, array.array) and isinstance(key, slice): # Slices of arrays are only assigned arrays
+            source[key] = array.array(source.typecode, replacement)
+            return
+        setattr(linkedSelf, linkedVar, replaced(source, key, replacement))
+
+
+def assignMany(linkedSelf, linkedVar: str, indexes: Sequence[int], replacements: Sequence[Any]):
+    '''Sets the items at indexes of the sequence at linkedVar of linkedSelf to replacements, in place, see assign.'''
+    replacements = tuple(replacements)
+    if len(replacements) != len(indexes):
+        raise ValueError("Expected {} values, got {}.".format(len(indexes), len(replacements)))
+    source = linkedSelf.__getattribute__(linkedVar)
+    try:
+        for index, replacement in zip(indexes, replacements):
+            source[index] = replacement
+    except TypeError:
+        items = list(source)
+        for index, replacement in zip(indexes, replacements):
+            items[index] = replacement
+        setattr(linkedSelf, linkedVar, replaced(source, slice(None), items))
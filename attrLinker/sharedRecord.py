@@ -0,0 +1,223 @@
+import struct
+import time
+import weakref
+
+from typing import Any, Dict
+
+from .recordLayout import RecordLayout
+
+try:
+    from multiprocessing import shared_memory
+except ImportError: # Not available on every platform, only needed for SharedRecordStore
+    shared_memory = None
+
+
+_HEADER = struct.Struct('<QQQ') # generation, capacity, size
+_HEADER_SIZE = 64
+_SEQUENCE = struct.Struct('<Q') # Per record write sequence, odd while the record is being written
+_STORES = weakref.WeakValueDictionary() # Stores opened in this process by name, so unpickled records share them, Ex: {name: SharedRecordStore,...}
+
+
+class SharedRecordStore:
+    '''
+    Fixed capacity array of records of a RecordLayout in a multiprocessing.shared_memory block, read by many processes without deserialization.
+    The process which creates the store owns it, it is the only one allowed to write. Other processes attach to it by name,
+    or get it by unpickling the store or one of its records, which pickle as a reference to the block and never copy the records.
+
+    Every write increments the generation counter in the header of the block, so readers know when to look again.
+    Records carry a write sequence, read(row) uses it to return a consistent record, single linked attribute reads skip it.
+
+    Example:
+    STORE = SharedRecordStore(RecordLayout({'id': 'q', 'onlineTime': 'd'}), capacity=10000)
+    user.record = STORE.allocate(id=1, onlineTime=0.0)
+    '''
+
+    __slots__ = ['layout', 'name', 'capacity', 'owner', 'memory', 'buffer', 'stride', '_freeRows', '__weakref__']
+
+    def __init__(self, layout: RecordLayout, capacity: int = 1024, name: str = None):
+        '''
+        Creates the shared memory block, the store is owned by the creating process.
+
+        Params
+        ------
+        layout:RecordLayout is the layout of the records
+        capacity:int is the amount of records, shared memory blocks can not grow
+        name:str is the name of the block, a unique name is generated if None
+        '''
+        if shared_memory is None:
+            raise ImportError("SharedRecordStore requires multiprocessing.shared_memory, which is not available on this platform.")
+        stride = self._stride(layout)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_SIZE + stride * max(capacity, 1))
+        self._open(layout, memory, owner=True)
+        _HEADER.pack_into(self.buffer, 0, 0, self.capacity, 0)
+
+    @classmethod
+    def attach(cls, name: str, layout: RecordLayout):
+        '''
+        Attaches to the store with given name, reusing the store already opened by this process if any.
+
+        Params
+        ------
+        name:str is the name of the store's shared memory block
+        layout:RecordLayout is the layout of the records, the same as the owner's
+        '''
+        store = _STORES.get(name)
+        if store is not None:
+            return store
+        if shared_memory is None:
+            raise ImportError("SharedRecordStore requires multiprocessing.shared_memory, which is not available on this platform.")
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False) # The owner is the one cleaning up the block
+        except TypeError: # Python < 3.13
+            memory = shared_memory.SharedMemory(name=name)
+        store = cls.__new__(cls)
+        store._open(layout, memory, owner=False)
+        return store
+
+    def _open(self, layout: RecordLayout, memory, owner: bool):
+        self.layout = layout
+        self.memory = memory
+        self.name = memory.name
+        self.buffer = memory.buf
+        self.owner = owner
+        self.stride = self._stride(layout)
+        self.capacity = (memory.size - _HEADER_SIZE) // self.stride
+        self._freeRows = []
+        _STORES[self.name] = self
+
+    @staticmethod
+    def _stride(layout: RecordLayout) -> int:
+        '''Bytes per record, the write sequence and the fields, rounded up to 8 bytes.'''
+        return (_SEQUENCE.size + layout.size + 7) // 8 * 8
+
+    def __repr__(self):
+        return "<{} Name={} Records={} Capacity={} Owner={}>".format(self.__class__.__name__, self.name, len(self), self.capacity, self.owner)
+
+    def __reduce__(self):
+        return (SharedRecordStore.attach, (self.name, self.layout))
+
+    def __len__(self):
+        return _HEADER.unpack_from(self.buffer, 0)[2]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    @property
+    def generation(self) -> int:
+        '''Amount of writes made to the store so far.'''
+        return _HEADER.unpack_from(self.buffer, 0)[0]
+
+    def offsetOf(self, row: int) -> int:
+        '''Returns the offset of the fields of the record at row.'''
+        if not 0 <= row < self.capacity:
+            raise IndexError("Row {} is out of the store's capacity of {}.".format(row, self.capacity))
+        return _HEADER_SIZE + row * self.stride + _SEQUENCE.size
+
+    def record(self, row: int) -> 'SharedRecord':
+        return SharedRecord(self, row)
+
+    def _checkOwner(self):
+        if not self.owner:
+            raise PermissionError("Only the process which created SharedRecordStore '{}' can write to it.".format(self.name))
+
+    def allocate(self, **values) -> 'SharedRecord':
+        '''
+        Allocates a record and returns it, reusing released records first.
+        Keyword arguments passed are set as the initial values of the record, Ex: store.allocate(id=1, onlineTime=0.0)
+        '''
+        self._checkOwner()
+        if self._freeRows:
+            row = self._freeRows.pop()
+        else:
+            generation, capacity, row = _HEADER.unpack_from(self.buffer, 0)
+            if row == capacity:
+                raise MemoryError("SharedRecordStore '{}' is full, its capacity is {} records.".format(self.name, capacity))
+            _HEADER.pack_into(self.buffer, 0, generation, capacity, row + 1)
+        self.write(row, **values)
+        return SharedRecord(self, row)
+
+    def release(self, row: int):
+        '''Zeroes the record at row and releases it to be reused by the next allocation.'''
+        self.write(row, **{field: b'' if self.layout._isBytes(field) else 0 for field in self.layout.fields})
+        self._freeRows.append(row)
+
+    def write(self, row: int, **values):
+        '''Writes given fields of the record at row, readers of the whole record never see a part of the write.'''
+        self._checkOwner()
+        offset = self.offsetOf(row)
+        sequence = _SEQUENCE.unpack_from(self.buffer, offset - _SEQUENCE.size)[0]
+        _SEQUENCE.pack_into(self.buffer, offset - _SEQUENCE.size, sequence + 1)
+        try:
+            self.layout.pack(self.buffer, offset, values)
+        finally:
+            _SEQUENCE.pack_into(self.buffer, offset - _SEQUENCE.size, sequence + 2)
+            generation, capacity, size = _HEADER.unpack_from(self.buffer, 0)
+            _HEADER.pack_into(self.buffer, 0, generation + 1, capacity, size)
+
+    def read(self, row: int) -> Dict[str, Any]:
+        '''Returns every field of the record at row, from a single write of the owner.'''
+        offset = self.offsetOf(row)
+        unpackSequence, buffer = _SEQUENCE.unpack_from, self.buffer
+        while True:
+            sequence = unpackSequence(buffer, offset - _SEQUENCE.size)[0]
+            if sequence % 2:
+                time.sleep(0) # The owner is writing the record
+                continue
+            values = self.layout.unpack(buffer, offset)
+            if unpackSequence(buffer, offset - _SEQUENCE.size)[0] == sequence:
+                return values
+
+    def close(self):
+        '''Closes this process' access to the store, records of the store are no longer readable afterwards.'''
+        if _STORES.get(self.name) is self:
+            del _STORES[self.name]
+        self.buffer = None
+        self.memory.close()
+
+    def unlink(self):
+        '''Destroys the shared memory block, once every process closed it. Only the owner unlinks.'''
+        self._checkOwner()
+        self.memory.unlink()
+
+
+class SharedRecord:
+    '''
+    A record of a SharedRecordStore, to be held as the source of linked instances. Pickles as (store, row), so it is never copied.
+    Linked attributes decode their field straight from the shared memory on every read.
+    '''
+
+    __slots__ = ['store', 'row', 'buffer', 'offset']
+
+    def __init__(self, store: SharedRecordStore, row: int):
+        '''
+        Params
+        ------
+        store:SharedRecordStore is the store of the record
+        row:int is the index of the record in the store
+        '''
+        self.store = store
+        self.row = row
+        self.buffer = store.buffer
+        self.offset = store.offsetOf(row)
+
+    def __repr__(self):
+        return "<{} Store={} Row={}>".format(self.__class__.__name__, self.store.name, self.row)
+
+    def __reduce__(self):
+        return (SharedRecord, (self.store, self.row))
+
+    def __getitem__(self, field: str):
+        return self.store.layout.read(self.buffer, self.offset, field)
+
+    def read(self) -> Dict[str, Any]:
+        '''Returns every field of the record, from a single write of the owner.'''
+        return self.store.read(self.row)
+
+    def update(self, **values):
+        '''Writes given fields of the record, only from the owner process.'''
+        self.store.write(self.row, **values)
@@ -0,0 +1,154 @@
+import datetime
+import decimal
+import string
+from operator import itemgetter
+
+from typing import Any, Dict
+
+
+_FORMATTER = string.Formatter()
+_MISSING = object()
+_IMMUTABLE = {str, int, float, bool, complex, bytes, type(None), decimal.Decimal, datetime.date, datetime.datetime, datetime.time} # Values a cached text can be kept for
+
+
+def _splitFieldName(fieldName: str):
+    '''Splits a field name into its root key and the rest of it. Ex: 'user[name].first' -> ('user', '[name].first')'''
+    for idx, char in enumerate(fieldName):
+        if char in '.[':
+            return fieldName[:idx], fieldName[idx:]
+    return fieldName, ''
+
+
+def _compile(text: str, fieldIndexes: Dict[str, int], leafPaths: Dict[str, None]):
+    '''
+    Rewrites text so its root keys become positional fields, Ex: '{name}#{id:>4}' -> '{0}#{1:>4}'.
+    Returns the rewritten text, and its parts, being literal strings and (fieldText, usedIndexes) pairs.
+    The positional field names are added to leafPaths, Ex: '0[name]'.
+    '''
+    rewritten, parts = [], []
+    for literal, fieldName, formatSpec, conversion in _FORMATTER.parse(text):
+        if literal:
+            rewritten.append(literal.replace('{', '{{').replace('}', '}}'))
+            parts.append(literal)
+        if fieldName is None:
+            continue
+        root, rest = _splitFieldName(fieldName)
+        if not root or root.isdigit():
+            raise ValueError("Positional fields are not supported in linked templates. Template: {!r}".format(text))
+        index = fieldIndexes.setdefault(root, len(fieldIndexes))
+        usedIndexes = {index}
+        leafPaths[str(index) + rest] = None
+        field = '{' + str(index) + rest
+        if conversion:
+            field += '!' + conversion
+        if formatSpec:
+            specText, specParts = _compile(formatSpec, fieldIndexes, leafPaths)
+            usedIndexes.update(idx for part in specParts if not isinstance(part, str) for idx in part[1])
+            field += ':' + specText
+        field += '}'
+        rewritten.append(field)
+        parts.append((field, frozenset(usedIndexes)))
+    return ''.join(rewritten), parts
+
+
+class CompiledTemplate:
+    '''
+    A formattable text compiled once, which only extracts the keys it references from the source mapping.
+    Supports format specs, conversions and nested fields, Ex: '{user[name]!r:>10}'.
+    '''
+
+    CACHE_SIZE = 65536 # Max cached sources, the oldest one is dropped once it is reached
+
+    __slots__ = ['text', 'fields', 'positionalText', 'parts', 'default', 'cache', '_getValues', '_getLeaves']
+
+    def __init__(self, text: str, default: Any = None, cache: bool = False):
+        '''
+        Params
+        ------
+        text:str is the formattable text, Ex: '{first_name} {last_name}'
+        default:Any is the replacement for fields whose key is missing from the source, if None, a KeyError is raised instead.
+        cache:bool whether to cache the rendered text per source, only re-rendering when a value its fields resolve to changed, Ex: the 'name' of '{user[name]}'.
+        Only texts whose fields resolve to immutable values (Ex: str, int, float, None) are cached, a list field like '{tags}' is rendered every time.
+        '''
+        fieldIndexes, leafPaths = {}, {}
+        self.text = text
+        self.positionalText, self.parts = _compile(text, fieldIndexes, leafPaths)
+        self.fields = tuple(fieldIndexes)
+        self.default = default
+        self.cache = {} if cache else None # Ex: {id(source): (leaves, text),...}
+
+        if len(self.fields) == 0:
+            self._getValues = lambda source: ()
+        elif len(self.fields) == 1:
+            key = self.fields[0]
+            self._getValues = lambda source: (source[key],)
+        else:
+            self._getValues = itemgetter(*self.fields)
+
+        if all(path.isdigit() for path in leafPaths): # No nested fields, the leaves are the values
+            self._getLeaves = lambda values: values
+        else:
+            paths = tuple(leafPaths)
+            self._getLeaves = lambda values: tuple(_FORMATTER.get_field(path, values, None)[0] for path in paths)
+
+    def __repr__(self):
+        return "<{} Text={!r} Fields={}>".format(self.__class__.__name__, self.text, self.fields)
+
+    def render(self, source) -> str:
+        '''Formats the template with the referenced keys of given source mapping.'''
+        try:
+            values = self._getValues(source)
+        except KeyError:
+            if self.default is None:
+                raise
+            return self._renderWithDefault(source)
+
+        leaves = None
+        if self.cache is not None:
+            try:
+                leaves = self._getLeaves(values)
+            except (LookupError, AttributeError):
+                pass
+            else:
+                cached = self.cache.get(id(source))
+                if cached is not None and cached[0] == leaves and all(type(old) is type(new) for old, new in zip(cached[0], leaves)): # 1 == True == 1.0
+                    return cached[1]
+
+        try:
+            result = self.positionalText.format(*values)
+        except (LookupError, AttributeError):
+            if self.default is None:
+                raise
+            result = self._renderWithDefault(source)
+
+        if leaves is not None and all(type(leaf) in _IMMUTABLE for leaf in leaves): # Mutable leaves may change in place, without being detected
+            cache = self.cache
+            if len(cache) >= self.CACHE_SIZE:
+                cache.pop(next(iter(cache), None), None)
+            cache[id(source)] = (leaves, result) # Only leaves are kept, a new source reusing the id matches only if it renders the same text
+        return result
+
+    __call__ = render
+
+    def invalidate(self):
+        '''Clears the cached results.'''
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _renderWithDefault(self, source) -> str:
+        '''Slow path, renders field by field, replacing the fields which could not be resolved with the default.'''
+        values = [source.get(key, _MISSING) for key in self.fields]
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            fieldText, usedIndexes = part
+            if any(values[idx] is _MISSING for idx in usedIndexes):
+                rendered.append(str(self.default))
+                continue
+            try:
+                rendered.append(fieldText.format(*values))
+            except (LookupError, AttributeError):
+                rendered.append(str(self.default))
+        return ''.join(rendered)
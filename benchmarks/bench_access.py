@@ -0,0 +1,130 @@
+'''
+Costs of reading and writing a linked attribute for every preset, against plain attribute, hand-written property and operator.itemgetter baselines,
+and the cost of each level of chained links, fused or not.
+Run with: python -m benchmarks.bench_access
+'''
+import array
+import datetime
+from operator import itemgetter
+
+from attrLinker.linkMethod import DirectLink, Dictionary, List, Object, FormattedText
+from attrLinker.preparedLink import PreparedLink
+from attrLinker.presets import linkDictionary, linkList, linkSlice
+from attrLinker.propBinder import PropBinder
+from attrLinker import LinkedClass, LinkManager, Linker, CompiledLinker
+
+from .harness import measure
+
+
+class Session:
+    def __init__(self):
+        self.login_time = 0
+
+
+class Plain:
+    def __init__(self):
+        self.status = 'idle'
+
+
+class HandWritten:
+    def __init__(self):
+        self.userData = {'status': 'idle'}
+
+    @property
+    def status(self):
+        return self.userData.get('status')
+
+    @status.setter
+    def status(self, value):
+        self.userData['status'] = value
+
+
+def makeLinkedClass(linkerClass: type = Linker):
+    '''Creates the linked class with given linker class, every preset is linked once.'''
+    LinkManager.changeLinkerClass(linkerClass)
+    try:
+        @LinkedClass
+        class User:
+            __LINKS__ = [PreparedLink(Dictionary, 'userData', 'status', enableSetter=True),
+                         PreparedLink(List, 'messages', 'firstMessage', 0, enableSetter=True),
+                         PreparedLink(Object, 'session', 'loginTime', 'login_time', enableSetter=True),
+                         PreparedLink(FormattedText, 'userData', 'nameTag', formattableText='{name}#{id}'),
+                         PreparedLink(DirectLink, 'userData', 'data')]
+
+            def __init__(self):
+                self.userData = {'id': 1, 'name': 'Foo', 'status': 'idle'}
+                self.messages = ['Hi There!']
+                self.session = Session()
+    finally:
+        LinkManager.changeLinkerClass(Linker)
+    return User
+
+
+def makeChainedClass(depth: int, fuse: bool = False):
+    '''Creates a class whose attribute level<depth> goes through depth chained links, Ex: level2 reads level1, which reads userData.'''
+    cls = type('Chained%d' % depth, (), {})
+    if fuse:
+        LinkManager._getDefault().fuse(cls)
+    for level in range(1, depth + 1):
+        linkDictionary(cls, 'level%d' % (level - 1) if level > 1 else 'userData', 'level%d' % level, 'next')
+    return cls
+
+
+def run():
+    binder = PropBinder({'debug': False})
+    binder.bind(Plain, 'config')
+    cachedBinder = PropBinder({'debug': False}, cache=True)
+    cachedBinder.bind(Plain, 'cachedConfig', lambda config: config['debug'])
+
+    namespace = {'plain': Plain(), 'handWritten': HandWritten(), 'getStatus': itemgetter('status')}
+    namespace['source'] = namespace['handWritten'].userData
+    get = {'baseline:plain_attribute': measure('plain.status', namespace),
+           'baseline:property': measure('handWritten.status', namespace),
+           'baseline:itemgetter': measure('getStatus(source)', namespace),
+           'PropBinder': measure('plain.config', namespace),
+           'PropBinder[cached]': measure('plain.cachedConfig', namespace)}
+    sets = {'baseline:plain_attribute': measure("plain.status = 'online'", namespace),
+            'baseline:property': measure("handWritten.status = 'online'", namespace)}
+
+    for label, linkerClass in [('', Linker), ('[compiled]', CompiledLinker)]:
+        namespace['user'] = makeLinkedClass(linkerClass)()
+        get.update({'linkDictionary' + label: measure('user.status', namespace),
+                    'linkList' + label: measure('user.firstMessage', namespace),
+                    'linkObject' + label: measure('user.loginTime', namespace),
+                    'formattedTextFromDict' + label: measure('user.nameTag', namespace),
+                    'DirectLink' + label: measure('user.data', namespace)})
+        sets.update({'linkDictionary' + label: measure("user.status = 'online'", namespace),
+                     'linkList' + label: measure("user.firstMessage = 'Hello!'", namespace),
+                     'linkObject' + label: measure('user.loginTime = 1', namespace)})
+
+    window = type('Window', (), {})
+    linkList(window, 'values', 'first', 0, enableSetter=True)
+    linkSlice(window, 'values', 'last5', slice(-5, None))
+    namespace['window'] = window()
+    namespace['window'].values = array.array('d', range(1000000)) # Rolling window, indexes are set in place whatever its size
+    get['linkSlice[array 1M]'] = measure('window.last5', namespace)
+    sets['linkList[array 1M]'] = measure('window.first = 1.0', namespace)
+
+    stamped = type('Stamped', (), {})
+    LinkManager._getDefault().bind(stamped, 'userData', 'parsedEveryRead', lambda userData: datetime.datetime.fromisoformat(userData['seen']))
+    linkDictionary(stamped, 'userData', 'coerced', 'seen', coerce=datetime.datetime)
+    namespace['stamped'] = stamped()
+    namespace['stamped'].userData = {'seen': '2024-05-01T10:00:00+00:00'}
+    get['converter[fromisoformat]'] = measure('stamped.parsedEveryRead', namespace)
+    get['linkDictionary[coerce=datetime]'] = measure('stamped.coerced', namespace)
+
+    chain = {}
+    for depth in range(1, 5):
+        userData = value = {}
+        for _ in range(depth):
+            value['next'] = value = {}
+        for label, fuse in [('', False), ('[fused]', True)]:
+            namespace['chained'] = makeChainedClass(depth, fuse)()
+            namespace['chained'].userData = userData
+            chain['depth%d%s' % (depth, label)] = measure('chained.level%d' % depth, namespace)
+    return {'unit': 'ns/op', 'get': get, 'set': sets, 'chain': chain}
+
+
+if __name__ == '__main__':
+    from .harness import dump
+    dump(run())
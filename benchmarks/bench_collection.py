@@ -0,0 +1,79 @@
+'''
+Compares LinkedCollection.refresh against the naive per-instance loop, where every instance gets its source dictionary replaced,
+and indexed lookups against linear scans.
+Run with: python -m benchmarks.bench_collection
+'''
+import random
+import timeit
+
+from attrLinker.linkMethod import MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkedCollection, HashIndex, SortedIndex
+
+
+ENTRIES = 50000
+STATUSES = ['idle', 'online', 'away']
+
+
+@LinkedClass
+class User:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'name': 'name', 'onlineTime': 'online_time', 'status': 'status'}, enableSetter=True)]
+
+    def __init__(self):
+        self.userData = {}
+
+
+@LinkedClass
+class IndexedUser(User):
+    __LINKS__ = []
+    __INDEXES__ = [HashIndex('ID', unique=True), HashIndex('status'), SortedIndex('onlineTime')]
+
+
+def makeResponse(poll: int):
+    rng = random.Random(poll)
+    # Every poll, some users go away, some new users show up and some change their status.
+    return [{'id': idx, 'name': 'user%d' % idx, 'online_time': idx, 'status': rng.choice(STATUSES) if rng.random() < 0.1 else 'idle'}
+            for idx in range(poll * 100, ENTRIES + poll * 100)]
+
+
+def naiveRefresh(users: dict, response: list):
+    seen = set()
+    for payload in response:
+        key = payload['id']
+        seen.add(key)
+        user = users.get(key)
+        if user is None:
+            user = users[key] = User()
+        user.userData = payload
+    for key in [key for key in users if key not in seen]:
+        del users[key]
+
+
+def run(polls: int = 5):
+    responses = [makeResponse(poll) for poll in range(polls)]
+    # Each poll parses a fresh response, copy the payloads so both contenders get their own dictionaries.
+    naiveResponses = [[payload.copy() for payload in response] for response in responses]
+    collectionResponses = [[payload.copy() for payload in response] for response in responses]
+
+    users = {}
+    naive = timeit.timeit(lambda: naiveRefresh(users, naiveResponses.pop(0)), number=polls)
+    collection = LinkedCollection(User, 'userData', 'id')
+    bulk = timeit.timeit(lambda: collection.refresh(collectionResponses.pop(0)), number=polls)
+
+    indexed = LinkedCollection(IndexedUser, 'userData', 'id')
+    indexed.refresh(makeResponse(0))
+    indexes = indexed.indexes
+    lookups = {'status_scan_s': lambda: [user for user in indexed if user.status == 'online'],
+               'status_index_s': lambda: indexes['status'].get('online'),
+               'id_scan_s': lambda: next(user for user in indexed if user.ID == ENTRIES - 1),
+               'id_index_s': lambda: indexes['ID'].one(ENTRIES - 1),
+               'range_scan_s': lambda: [user for user in indexed if 100 <= user.onlineTime < 200],
+               'range_index_s': lambda: indexes['onlineTime'].range(100, 200, includeHigh=False)}
+    results = {'entries': ENTRIES, 'polls': polls, 'naive_loop_s': naive / polls, 'linked_collection_s': bulk / polls}
+    results.update({label: min(timeit.repeat(lookup, number=10, repeat=3)) / 10 for label, lookup in lookups.items()})
+    return results
+
+
+if __name__ == '__main__':
+    from .harness import dump
+    dump(run())
@@ -0,0 +1,54 @@
+'''
+Costs of decorating a class with LinkedClass given a large __LINKS__, and memory per instance of a linked class, with and without slots (LinkedClass(slots=True)).
+Run with: python -m benchmarks.bench_decoration
+'''
+from attrLinker.linkMethod import Dictionary, MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkManager
+
+from .harness import measureOnce, memoryPerInstance
+
+
+FIELDS = ['field%d' % idx for idx in range(500)]
+INSTANCES = 1000000
+
+
+def decorate(links: list):
+    cls = LinkedClass(type('Decorated', (), {'__LINKS__': links}))
+    LinkManager._getDefault().unlinkClass(cls)
+
+
+class Plain:
+    def __init__(self):
+        self.id, self.name, self.status, self.onlineTime = 1, 'Foo', 'idle', 0
+
+
+@LinkedClass
+class Linked:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'name': 'name', 'status': 'status', 'onlineTime': 'online_time'})]
+
+    def __init__(self):
+        self.userData = {'id': 1, 'name': 'Foo', 'status': 'idle', 'online_time': 0}
+
+
+@LinkedClass(slots=True)
+class SlottedLinked:
+    __LINKS__ = Linked.__LINKS__
+
+    def __init__(self):
+        self.userData = {'id': 1, 'name': 'Foo', 'status': 'idle', 'online_time': 0}
+
+
+def run():
+    multiLink = [PreparedLink(MultiDictionary, 'userData', linkMap=FIELDS)]
+    singleLinks = [PreparedLink(Dictionary, 'userData', field) for field in FIELDS]
+    return {'decorate_s': {'MultiDictionary[500]': measureOnce(lambda: decorate(multiLink)),
+                           'Dictionary x500': measureOnce(lambda: decorate(singleLinks))},
+            'memory_bytes_per_instance': {'baseline:plain_attributes': memoryPerInstance(Plain, INSTANCES),
+                                          'MultiDictionary[4]': memoryPerInstance(Linked, INSTANCES),
+                                          'MultiDictionary[4][slots]': memoryPerInstance(SlottedLinked, INSTANCES)}}
+
+
+if __name__ == '__main__':
+    from .harness import dump
+    dump(run())
@@ -0,0 +1,39 @@
+'''
+Costs of exporting linked instances with a generated Exporter, against getattr on every linked attribute.
+Run with: python -m benchmarks.bench_export
+'''
+from attrLinker.linkMethod import MultiDictionary, FormattedText
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, getExporter
+
+from .harness import measure
+
+
+FIELDS = ['field%d' % idx for idx in range(20)]
+
+
+@LinkedClass
+class Metrics:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap=FIELDS),
+                 PreparedLink(FormattedText, 'userData', 'label', formattableText='{field0}/{field1}')]
+
+    def __init__(self, idx=0):
+        self.userData = {field: idx for field in FIELDS}
+
+
+def run():
+    exporter = getExporter(Metrics)
+    instances = [Metrics(idx) for idx in range(1000)]
+    namespace = {'instance': instances[0], 'instances': instances, 'exporter': exporter, 'fields': exporter.fields}
+    return {'unit': 'ns/op', 'fields': len(exporter.fields),
+            'getattr_dict': measure('{field: getattr(instance, field) for field in fields}', namespace),
+            'toDict': measure('exporter.toDict(instance)', namespace),
+            'toTuple': measure('exporter.toTuple(instance)', namespace),
+            'toNamedTuple': measure('exporter.toNamedTuple(instance)', namespace),
+            'getattr_columns[1000]': measure('{field: [getattr(instance, field) for instance in instances] for field in fields}', namespace, repeat=3),
+            'columns[1000]': measure('exporter.columns(instances)', namespace, repeat=3)}
+
+
+if __name__ == '__main__':
+    from .harness import dump
+    dump(run())
@@ -0,0 +1,63 @@
+'''
+Startup cost of defining many linked classes, eagerly against lazily (LinkedClass(lazy=True)), and the cost of the first access of a lazy class.
+Run with: python -m benchmarks.bench_startup
+'''
+import gc
+import time
+
+from attrLinker.linkMethod import Dictionary, MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkManager
+
+from .harness import measureOnce
+
+
+CLASSES = 500
+FIELDS = ['field%d' % idx for idx in range(50)]
+
+
+def defineClasses(lazy: bool, multi: bool):
+    classes = []
+    for idx in range(CLASSES):
+        if multi:
+            links = [PreparedLink(MultiDictionary, 'userData', linkMap=FIELDS)]
+        else:
+            links = [PreparedLink(Dictionary, 'userData', field) for field in FIELDS]
+        classes.append(LinkedClass(type('Model%d' % idx, (), {'__LINKS__': links}), lazy=lazy))
+    return classes
+
+
+def cleanup(classes: list):
+    manager = LinkManager._getDefault()
+    for cls in classes:
+        manager.unlinkClass(cls)
+    classes.clear()
+    gc.collect()
+
+
+def measureDefinition(lazy: bool, multi: bool, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        classes = defineClasses(lazy, multi)
+        best = min(best, time.perf_counter() - start)
+        cleanup(classes)
+    return best
+
+
+def run():
+    results = {'classes': CLASSES, 'links_per_class': len(FIELDS)}
+    for multi in [True, False]:
+        label = 'MultiDictionary' if multi else 'Dictionary'
+        results['define_s:' + label] = measureDefinition(False, multi)
+        results['define_s:{}:lazy'.format(label)] = measureDefinition(True, multi)
+        classes = defineClasses(True, multi)
+        results['first_access_s:{}:lazy'.format(label)] = measureOnce(lambda: [getattr(cls, 'field0') for cls in classes], repeat=1)
+        cleanup(classes)
+    return results
+
+
+if __name__ == '__main__':
+    from .harness import dump
+    dump(run())
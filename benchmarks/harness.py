@@ -0,0 +1,56 @@
+'''Shared helpers for the benchmarks, every benchmark module exposes a run() function returning a JSON serializable dictionary.'''
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+from typing import Any, Callable, Dict
+
+
+def measure(stmt: str, namespace: Dict[str, Any], repeat: int = 5) -> float:
+    '''Returns the best time of given statement in nanoseconds per execution.'''
+    timer = timeit.Timer(stmt, globals=namespace)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def measureOnce(func: Callable, repeat: int = 3) -> float:
+    '''Returns the best time of calling func in seconds, for benchmarks too slow to be looped by timeit.'''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def memoryPerInstance(factory: Callable, count: int = 10000) -> float:
+    '''Returns the average traced memory in bytes of an object created by factory, including the objects it owns.'''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def metadata() -> Dict[str, Any]:
+    return {'python': sys.version.split()[0], 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+
+
+def dump(results: Dict[str, Any], path: str = None):
+    '''Writes the results as JSON to given path, or to stdout if None.'''
+    text = json.dumps({'metadata': metadata(), 'results': results}, indent=2, sort_keys=True)
+    if path is None:
+        print(text)
+    else:
+        with open(path, 'w') as file:
+            file.write(text + '\n')
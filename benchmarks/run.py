@@ -0,0 +1,27 @@
+'''
+Runs the benchmark suites and writes their results as JSON, to track regressions between releases.
+Run with: python -m benchmarks.run [--output results.json] [--only access decoration ...]
+'''
+import argparse
+
+from . import bench_access, bench_decoration, bench_collection, bench_startup, bench_export
+from .harness import dump
+
+
+SUITES = {'access': bench_access.run,
+          'decoration': bench_decoration.run,
+          'collection': bench_collection.run,
+          'startup': bench_startup.run,
+          'export': bench_export.run}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', default=None, help='Path of the JSON results, printed to stdout if not given.')
+    parser.add_argument('--only', nargs='*', choices=sorted(SUITES), default=None, help='Suites to run, every suite if not given.')
+    args = parser.parse_args(argv)
+    dump({name: SUITES[name]() for name in (args.only or SUITES)}, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+from attrLinker.linkMethod import MultiDictionary, FormattedText
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkManager, LinkedCollection, Change, linkDictionary
+
+
+@LinkedClass
+class TrackedUser:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'status': 'status', 'onlineTime': 'online_time'}, enableSetter=True),
+                 PreparedLink(FormattedText, 'userData', 'nameTag', formattableText='{id}:{status}')]
+
+    def __init__(self):
+        self.userData = {'id': 0, 'status': 'idle', 'online_time': 0}
+
+
+TRACKER = LinkManager._getDefault().enableChangeTracking()
+
+
+def test_changedTargetVars():
+    user = TrackedUser()
+    TRACKER.track(user)
+    with TRACKER.batch([user]):
+        user.userData = {'id': 0, 'status': 'online', 'online_time': 0}
+    assert TRACKER.changed(user) == {'status', 'nameTag'}
+    TRACKER.refresh([user])
+    assert TRACKER.changed(user) == frozenset()
+
+def test_notificationsAreCoalesced():
+    received = []
+    callback = received.append
+    TRACKER.subscribe(TrackedUser, 'status', callback)
+    try:
+        users = [TrackedUser() for _ in range(3)]
+        for user in users:
+            TRACKER.track(user)
+        with TRACKER.batch(users):
+            users[0].status = 'online'
+            users[2].status = 'away'
+            users[1].onlineTime = 5
+        assert len(received) == 1
+        assert received[0] == [Change(users[0], 'status', 'idle', 'online'), Change(users[2], 'status', 'idle', 'away')]
+    finally:
+        TRACKER.unsubscribe(TrackedUser, 'status', callback)
+
+def test_collectionRefreshReportsChanges():
+    received = []
+    TRACKER.subscribe(TrackedUser, None, received.append)
+    try:
+        collection = LinkedCollection(TrackedUser, 'userData', 'id', tracker=TRACKER)
+        collection.refresh([{'id': 1, 'status': 'idle', 'online_time': 0}, {'id': 2, 'status': 'idle', 'online_time': 0}])
+        collection.refresh([{'id': 1, 'status': 'idle', 'online_time': 0}, {'id': 2, 'status': 'online', 'online_time': 0}])
+        assert TRACKER.changed(collection[2]) == {'status', 'nameTag'} and TRACKER.changed(collection[1]) == frozenset()
+        assert len(received) == 1 and {change.targetVar for change in received[0]} == {'status', 'nameTag'}
+    finally:
+        TRACKER.unsubscribe(TrackedUser, None, received.append)
+
+def test_attributeLinkedAfterTracking():
+    class LateUser:
+        def __init__(self):
+            self.userData = {'id': 0, 'status': 'idle'}
+    linkDictionary(LateUser, 'userData', 'ID', 'id')
+    user = LateUser()
+    TRACKER.track(user)
+    linkDictionary(LateUser, 'userData', 'status', 'status', enableSetter=True)
+    user.status = 'online'
+    assert [change.targetVar for change in TRACKER.refresh([user])] == ['status']
+
+def test_inPlaceChangesOfMutableValues():
+    class Messenger:
+        def __init__(self):
+            self.userData = {'sent_messages': ['Hello!']}
+    linkDictionary(Messenger, 'userData', 'sent_messages', 'sent_messages')
+    user = Messenger()
+    TRACKER.track(user)
+    user.userData['sent_messages'].append('Goodbye!')
+    assert TRACKER.refresh([user]) == [Change(user, 'sent_messages', ['Hello!'], ['Hello!', 'Goodbye!'])]
+    assert TRACKER.refresh([user]) == []
+
+def test_subscribedClassesAreFreed():
+    import gc
+    import weakref
+    Temporary = type('Temporary', (), {})
+    linkDictionary(Temporary, 'data', 'value', 'value')
+    TRACKER.subscribe(Temporary, None, print)
+    reference = weakref.ref(Temporary)
+    LinkManager._getDefault().unlinkClass(Temporary)
+    del Temporary
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,73 @@
+import datetime
+import enum
+import json
+
+import pytest
+
+from attrLinker import LinkManager, CompiledLinker, Linker, CoercionError, Coercer, coercerOf, getExporter
+from attrLinker.presets import multiLinkDictionary, linkDictionary, linkList, linkObject, linkPath
+
+
+class Status(enum.Enum):
+    IDLE = 'idle'
+    ONLINE = 'online'
+
+
+class Session:
+    def __init__(self):
+        self.started = '2024-05-01T10:00:00Z'
+
+
+def makeUser(linkerClass=Linker):
+    cls = type('Typed', (), {})
+    LinkManager.changeLinkerClass(linkerClass)
+    try:
+        multiLinkDictionary(cls, 'userData', linkMap={'ID': 'id', 'score': 'score'}, coerce=int, enableSetter=True)
+        multiLinkDictionary(cls, 'userData', linkMap={'status': 'status'}, coerce=Status, enableSetter=True)
+        multiLinkDictionary(cls, 'userData', linkMap={'verified': 'verified'}, coerce=bool, copyOnWrite=True, enableSetter=True)
+        linkList(cls, 'history', 'lastRate', -1, coerce=float, enableSetter=True)
+        linkObject(cls, 'session', 'started', coerce=datetime.datetime, enableSetter=True)
+        linkPath(cls, 'userData', 'joined', 'profile.joined', coerce=datetime.date)
+    finally:
+        LinkManager.changeLinkerClass(Linker)
+    user = cls()
+    user.userData = {'id': '42', 'score': '7', 'status': 'online', 'verified': 'False', 'profile': {'joined': '2020-01-02'}}
+    user.history = ['1.5', '2.25']
+    user.session = Session()
+    return user
+
+
+@pytest.mark.parametrize('linkerClass', [Linker, CompiledLinker])
+def test_coercedLinks(linkerClass):
+    user = makeUser(linkerClass)
+    assert (user.ID, user.score, user.status, user.verified, user.lastRate) == (42, 7, Status.ONLINE, False, 2.25)
+    assert user.started == datetime.datetime(2024, 5, 1, 10, tzinfo=datetime.timezone.utc) and user.joined == datetime.date(2020, 1, 2)
+    user.score, user.status, user.verified, user.lastRate = 8, Status.IDLE, True, 3.0
+    user.started = datetime.datetime(2024, 1, 1)
+    assert user.userData['score'] == '8' and user.userData['status'] == 'idle' and user.userData['verified'] == 'true'
+    assert user.history == ['1.5', '3.0'] and user.session.started == '2024-01-01T00:00:00'
+    assert getExporter(type(user)).toDict(user)['status'] is Status.IDLE
+    LinkManager._getDefault().unlinkClass(type(user))
+
+def test_memoizedParsing():
+    calls = []
+    coercer = coercerOf(Coercer(int, lambda raw: calls.append(raw) or int(raw), str, memoize=True))
+    assert [coercer('1'), coercer('1'), coercer(''.join(['1'])), coercer('2'), coercer(None)] == [1, 1, 1, 2, None] and calls == ['1', '2']
+    assert coercerOf(Status)('ONLINE') is Status.ONLINE and coercerOf(int)(5) == 5
+
+def test_callablesAreNotMemoized():
+    Message = type('Message', (), {'__init__': lambda self: setattr(self, 'data', {'meta': '{"tags": []}'})})
+    linkDictionary(Message, 'data', 'meta', 'meta', coerce=json.loads)
+    first, second = Message(), Message()
+    first.meta['tags'].append('a') # Parsed per read, so instances never share the same dict
+    assert second.meta == {'tags': []} and first.meta is not second.meta
+    LinkManager._getDefault().unlinkClass(Message)
+
+def test_coercionError():
+    user = makeUser()
+    user.userData['score'] = 'seven'
+    with pytest.raises(CoercionError) as info:
+        user.score
+    assert info.value.targetVar == 'score' and info.value.value == 'seven' and info.value.linker is LinkManager._getDefault().linkerAt(type(user), 'score')
+    assert isinstance(info.value.__cause__, ValueError)
+    LinkManager._getDefault().unlinkClass(type(user))
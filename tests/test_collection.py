@@ -0,0 +1,42 @@
+from attrLinker.linkMethod import MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkedCollection, RefreshResult
+
+
+@LinkedClass
+class Entry:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'status': 'status', 'onlineTime': 'online_time'})]
+
+    def __init__(self):
+        self.userData = {}
+
+
+def makePayloads(count, status='idle'):
+    return [{'id': idx, 'status': status, 'online_time': idx} for idx in range(count)]
+
+
+def test_refreshAddsUpdatesAndRetires():
+    retired = []
+    collection = LinkedCollection(Entry, 'userData', 'id', onRetire=retired.append)
+    assert collection.refresh(makePayloads(5)) == RefreshResult(5, 0, 0)
+    assert collection[3].status == 'idle' and collection[3].onlineTime == 3
+
+    first = collection[0]
+    source = first.userData
+    payloads = makePayloads(4)
+    payloads[0]['status'] = 'online'
+    assert collection.refresh(payloads) == RefreshResult(0, 1, 1)
+    assert collection[0] is first and first.userData is source and first.status == 'online'
+    assert len(collection) == 4 and 4 not in collection and [entry.ID for entry in retired] == [4]
+
+def test_partialRefresh():
+    collection = LinkedCollection(Entry, 'userData', 'id')
+    collection.refresh(makePayloads(3))
+    assert collection.refresh([{'id': 1, 'status': 'online', 'online_time': 1}], partial=True) == RefreshResult(0, 0, 1)
+    assert len(collection) == 3
+
+def test_removedKeysAreDropped():
+    collection = LinkedCollection(Entry, 'userData', 'id')
+    collection.refresh([{'id': 1, 'status': 'idle', 'extra': True}])
+    collection.refresh([{'id': 1, 'status': 'idle'}])
+    assert collection[1].userData == {'id': 1, 'status': 'idle'}
@@ -0,0 +1,47 @@
+import pytest
+
+from attrLinker.linkMethod import MultiColumn
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, ColumnStore
+
+
+STORE = ColumnStore({'id': 'q', 'online_time': 'd', 'status': None}, capacity=2)
+
+
+@LinkedClass
+class ColumnUser:
+    __LINKS__ = [PreparedLink(MultiColumn, 'row', store=STORE, linkMap={'ID': 'id', 'onlineTime': 'online_time', 'status': 'status'}, enableSetter=True)]
+
+    def __init__(self, **values):
+        self.row = STORE.allocate(**values)
+
+
+USERS = [ColumnUser(id=idx, online_time=idx * 10, status='idle') for idx in range(5)] # Grows the store past its capacity
+
+
+def test_perInstanceAccess():
+    user = USERS[3]
+    assert (user.ID, user.onlineTime, user.status) == (3, 30.0, 'idle')
+    user.status = 'online'
+    user.onlineTime += 1
+    assert STORE.get(user.row, 'status') == 'online' and STORE.get(user.row, 'online_time') == 31.0
+
+def test_vectorizedColumns():
+    before = [user.onlineTime for user in USERS]
+    STORE.add('online_time', 5)
+    assert [user.onlineTime for user in USERS] == [value + 5 for value in before]
+    STORE.setValues('status', ['away'] * len(STORE))
+    assert all(user.status == 'away' for user in USERS)
+    assert list(STORE.values('id')) == [user.ID for user in USERS]
+    with pytest.raises(ValueError):
+        STORE.setValues('id', [1])
+
+def test_releasedRowsAreReused():
+    store = ColumnStore({'value': 'i'})
+    row = store.allocate(value=3)
+    store.release(row)
+    assert store.allocate() == row and store.get(row, 'value') == 0
+    store.allocate(value=1)
+    store.release(row)
+    store.setValues('value', [7, 8])
+    assert store.size == len(store) == 1 and store.rows == 2
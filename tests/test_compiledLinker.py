@@ -0,0 +1,66 @@
+from attrLinker import Linker, LinkManager, CompiledLinker
+from attrLinker.compiledLinker import DictItemDescriptor, IndexDescriptor, AttributeDescriptor, TemplateDescriptor
+from attrLinker.presets import multiLinkDictionary, multiLinkList, formattedTextFromDict, linkObject
+from tests.simple_implementation import User
+
+
+class CompiledUser(User):
+    pass
+
+
+LinkManager.changeLinkerClass(CompiledLinker)
+try:
+    linkMap_dict = ['id', 'name', 'online_time', 'status', 'sent_messages']
+    multiLinkDictionary(CompiledUser, 'userData', linkMap=linkMap_dict, enableSetter=True)
+    linkMap_list = {'first_message': 0, 'last_message': -1}
+    multiLinkList(CompiledUser, 'sent_messages', linkMap=linkMap_list, enableSetter=True)
+    formattedTextFromDict(CompiledUser, 'userData', 'name_tag', '{name}#{id}')
+    linkObject(CompiledUser, 'online_time', 'login_time')
+finally:
+    LinkManager.changeLinkerClass(Linker)
+
+user = CompiledUser(id=1234, name='Steve')
+user.send_message('Hi There!')
+user.send_message('Goodbye!')
+
+
+def test_descriptorsAreSpecialized():
+    assert type(CompiledUser.__dict__['name']) is DictItemDescriptor
+    assert type(CompiledUser.__dict__['first_message']) is IndexDescriptor
+    assert type(CompiledUser.__dict__['login_time']) is AttributeDescriptor
+    assert type(CompiledUser.__dict__['name_tag']) is TemplateDescriptor
+
+def test_compiledGetters():
+    for linked in linkMap_dict:
+        assert user.__getattribute__(linked) == user.userData.get(linked)
+    for linkedAttr, linkedIdx in linkMap_list.items():
+        assert user.__getattribute__(linkedAttr) == user.sent_messages[linkedIdx]
+    assert user.name_tag == '{name}#{id}'.format(**user.userData)
+    assert user.login_time == user.online_time.login_time
+
+def test_compiledSetters():
+    other = CompiledUser(id=1, name='Alex')
+    other.send_message('a')
+    other.send_message('b')
+    other.status = 'online'
+    other.last_message = 'c'
+    assert other.userData['status'] == 'online'
+    assert other.sent_messages == ['a', 'c']
+
+def test_readOnlyDescriptor():
+    try:
+        user.login_time = 0
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Setting a read-only compiled link should raise AttributeError.")
+
+def test_linksBookkeeping():
+    linker = CompiledUser.__dict__['name'].linker
+    assert isinstance(linker, CompiledLinker) and linker.ready
+    assert linker.links[CompiledUser] == ['name']
+
+def test_compiledDictSetterInPlace():
+    source = user.userData
+    user.status = 'away'
+    assert user.userData is source and source['status'] == 'away'
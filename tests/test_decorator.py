@@ -1,3 +1,5 @@
+import pytest
+
 from attrLinker.linkMethod import *
 from attrLinker.preparedLink import PreparedLink
 from attrLinker import LinkedClass
@@ -15,6 +17,10 @@ class ImplementedUser(User):
 class ImplementedUserWithSlots(ImplementedUser):
     __slots__ = ['user']
 
+@LinkedClass
+class SnapshotUser(User):
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap=['id', 'status'], enableSetter=True, copyOnWrite=True)]
+
 
 CLASSES_TO_TEST = [ImplementedUser, ImplementedUserWithSlots]
 
@@ -44,3 +50,102 @@ def test_formattedTextFromDict():
 def test_linkObject():
     for user in USERS_TO_TEST:
         assert user.login_time == user.online_time.login_time, "linkObject is not working as expected. user.attr={0} user.obj.attr={1}".format(user.login_time, user.online_time.login_time)
+
+def test_multiLinkDictionaryCopyOnWrite():
+    user = SnapshotUser(id=1)
+    snapshot = user.userData
+    user.status = 'online'
+    assert user.status == 'online' and user.userData is not snapshot and snapshot['status'] == 'idle'
+
+def test_lazyLinkedClass():
+    from attrLinker import LinkManager
+    from attrLinker.decorator import LazyLink
+
+    @LinkedClass(lazy=True)
+    class LazyUser(User):
+        __LINKS__ = ImplementedUser.__LINKS__
+
+    assert isinstance(LazyUser.__dict__['name'], LazyLink) and isinstance(LazyUser.__dict__['name_tag'], LazyLink)
+    user = LazyUser(id=1234, name='Steve')
+    user.send_message('Hi There!')
+    assert user.name_tag == 'Steve#1234' # First access applies every link of the class
+    assert isinstance(LazyUser.__dict__['name'], property) and user.first_message == 'Hi There!'
+
+    @LinkedClass(lazy=True)
+    class LazySetterUser(User):
+        __LINKS__ = ImplementedUser.__LINKS__[:1]
+
+    user = LazySetterUser()
+    user.status = 'online'
+    assert user.userData['status'] == 'online'
+
+    @LinkedClass(lazy=True)
+    class LazyIntrospectedUser(User):
+        __LINKS__ = ImplementedUser.__LINKS__[:1]
+
+    assert set(LinkManager._getDefault().linkersOf(LazyIntrospectedUser)) == {'id', 'name', 'online_time', 'status', 'sent_messages'}
+
+def test_lazyLinksAppliedOnce():
+    import threading
+
+    @LinkedClass(lazy=True)
+    class ConcurrentUser(User):
+        __LINKS__ = ImplementedUser.__LINKS__
+
+    barrier, names, errors = threading.Barrier(4), [], []
+    def read():
+        user = ConcurrentUser(name='Steve')
+        barrier.wait()
+        try:
+            names.append(user.name)
+        except Exception as exc:
+            errors.append(exc)
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [] and names == ['Steve'] * 4
+
+def test_lazyLinkFailure():
+    @LinkedClass(lazy=True)
+    class BrokenUser(User):
+        __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap=['name'], unknownOption=True)]
+
+    user = BrokenUser()
+    for _ in range(2): # Raised again on every access, instead of recursing through the placeholder
+        with pytest.raises(TypeError):
+            user.name
+
+@LinkedClass(slots=True, extraSlots=['session'])
+class SlottedUser:
+    __LINKS__ = ImplementedUser.__LINKS__
+
+    def __init__(self, **kw):
+        self.userData = {'id': 1, 'name': 'user_name', 'online_time': None, 'status': 'idle', 'sent_messages': []}
+        self.userData.update(kw)
+        self.session = None
+
+    def __repr__(self):
+        return '<{} {}>'.format(__class__.__name__, self.name)
+
+@LinkedClass(slots=True)
+class SlottedSubUser(SlottedUser):
+    __LINKS__ = [PreparedLink(Dictionary, 'profile', 'bio')]
+
+    def __init__(self, **kw):
+        super().__init__(**kw)
+        self.profile = {'bio': 'Hi'}
+
+
+def test_slottedLinkedClass():
+    import pickle
+    assert SlottedUser.__slots__ == ('userData', 'session', '__weakref__') and SlottedSubUser.__slots__ == ('profile',)
+    user = SlottedSubUser(id=5, name='Steve')
+    user.sent_messages.append('Hi There!')
+    assert not hasattr(user, '__dict__') and (user.id, user.first_message, user.bio) == (5, 'Hi There!', 'Hi')
+    with pytest.raises(AttributeError):
+        user.nickname = 'Foo'
+    assert repr(user) == '<SlottedUser Steve>' # __class__ refers to the slotted class
+    copied = pickle.loads(pickle.dumps(user))
+    assert type(copied) is SlottedSubUser and (copied.name, copied.last_message, copied.bio, copied.session) == ('Steve', 'Hi There!', 'Hi', None)
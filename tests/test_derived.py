@@ -0,0 +1,107 @@
+import pytest
+
+from attrLinker import LinkedClass, LinkedCollection, LinkManager, DependencyCycle, derivedOf
+from attrLinker.linkMethod import Derived, MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker.presets import linkDerived, linkDictionary, linkObject
+
+
+CALLS = []
+
+class Session:
+    def __init__(self, minutes):
+        self.minutes = minutes
+
+def rate(sent, onlineTime):
+    CALLS.append('rate')
+    return sent / onlineTime
+
+
+@LinkedClass
+class Stats:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'sent': 'sent', 'onlineTime': 'online_time'}, enableSetter=True),
+                 PreparedLink(Derived, ['sent', 'onlineTime'], 'rate', rate),
+                 PreparedLink(Derived, ['rate', 'threshold'], 'isActive', lambda rate, threshold: rate >= threshold)]
+    threshold = 1
+
+    def __init__(self, userData=None):
+        self.userData = userData or {'id': 1, 'sent': 10, 'online_time': 5}
+
+
+def test_derivedCache():
+    CALLS.clear()
+    stats = Stats()
+    assert (stats.rate, stats.rate, stats.isActive) == (2, 2, True) and CALLS == ['rate']
+    stats.sent = 2 # Through the linked setter
+    assert (stats.rate, stats.isActive) == (0.4, False) and CALLS == ['rate'] * 2
+    stats.userData = {'id': 1, 'sent': 30, 'online_time': 10} # Source swapped
+    assert stats.rate == 3 and CALLS == ['rate'] * 3
+    stats.userData['sent'] = 60 # Mutated in place, the cached value is kept until invalidated
+    assert stats.rate == 3
+    derivedOf(Stats).invalidate(stats, 'sent')
+    assert stats.rate == 6 and Stats().rate == 2
+    with pytest.raises(AttributeError):
+        stats.rate = 1
+
+def test_relinkAndRefresh():
+    Relinked = type('Relinked', (Stats,), {})
+    stats = Relinked()
+    assert stats.rate == 2
+    collection = LinkedCollection(Stats, 'userData', 'id')
+    collection.refresh([{'id': 1, 'sent': 10, 'online_time': 5}])
+    assert collection[1].rate == 2
+    collection.refresh([{'id': 1, 'sent': 20, 'online_time': 5}])
+    assert collection[1].rate == 4
+
+    linkDictionary(Stats, 'userData', 'onlineTime', 'online_minutes') # Rebinding a dependency drops the cached values
+    collection[1].userData['online_minutes'] = 10
+    assert collection[1].rate == 2
+    linkDictionary(Stats, 'userData', 'onlineTime', 'online_time', enableSetter=True)
+
+def test_unrelatedLinksKeepCache():
+    CALLS.clear()
+    stats = Stats()
+    assert stats.rate == 2 and CALLS == ['rate']
+    linkDictionary(type('Unrelated', (), {}), 'data', 'value', 'value')
+    assert stats.rate == 2 and CALLS == ['rate']
+
+def test_unbindDependency():
+    cls = type('Unbound', (), {'__init__': lambda self: setattr(self, 'data', {'x': 1})})
+    linkDictionary(cls, 'data', 'x', 'x', enableSetter=True)
+    linkDerived(cls, ['x'], 'double', lambda x: x * 2)
+    instance = cls()
+    instance.x = 2
+    assert instance.double == 4
+    LinkManager._getDefault().unbind(cls, 'x')
+    assert 'x' not in cls.__dict__
+    with pytest.raises(AttributeError):
+        instance.x
+
+def test_inheritedAndChainedDependencies():
+    Base = type('Base', (), {'__init__': lambda self: setattr(self, 'data', {'sent': 1, 'online_time': Session(1)})})
+    linkDictionary(Base, 'data', 'sent', 'sent', enableSetter=True)
+    linkDictionary(Base, 'data', 'online_time', 'online_time', enableSetter=True)
+    linkObject(Base, 'online_time', 'login_time', 'minutes', enableSetter=True)
+    Child = type('Child', (Base,), {})
+    linkDerived(Child, ['sent'], 'double', lambda sent: sent * 2)
+    linkDerived(Child, ['login_time'], 'doubled', lambda minutes: minutes * 2)
+    child = Child()
+    assert (child.double, child.doubled) == (2, 2)
+    child.sent = 10 # Linked on the base
+    assert child.double == 20
+    child.online_time = Session(5) # Written in place, through the link login_time reads
+    assert child.doubled == 10
+    child.login_time = 6
+    assert child.doubled == 12
+    assert Base().sent == 1
+
+def test_dependencyCycle():
+    with pytest.raises(DependencyCycle, match='c -> a -> b -> c'):
+        @LinkedClass
+        class Cyclic:
+            __LINKS__ = [PreparedLink(Derived, ['b'], 'a', lambda b: b),
+                         PreparedLink(Derived, ['c'], 'b', lambda c: c),
+                         PreparedLink(Derived, ['a'], 'c', lambda a: a)]
+    cls = type('SelfDependent', (), {})
+    with pytest.raises(DependencyCycle):
+        linkDerived(cls, 'value', 'value', lambda value: value)
@@ -0,0 +1,38 @@
+from attrLinker import LinkManager, Exporter, getExporter
+from tests.test_decorator import ImplementedUser
+
+
+def makeUsers(count):
+    users = []
+    for idx in range(count):
+        user = ImplementedUser(id=idx, name='user%d' % idx)
+        user.send_message('Hi There!')
+        users.append(user)
+    return users
+
+
+def test_exportMatchesGetattr():
+    user = makeUsers(1)[0]
+    exporter = getExporter(ImplementedUser)
+    assert set(exporter.fields) == set(LinkManager._getDefault().linkersOf(ImplementedUser))
+    expected = {field: getattr(user, field) for field in exporter.fields}
+    assert exporter.toDict(user) == expected
+    assert exporter.toTuple(user) == tuple(expected.values())
+    assert exporter.toNamedTuple(user)._asdict() == expected
+
+def test_exportSelectedFields():
+    user = makeUsers(1)[0]
+    exporter = Exporter(ImplementedUser, fields=['name_tag', 'id'])
+    assert exporter.toTuple(user) == ('user0#0', 0) and exporter.toNamedTuple(user).name_tag == 'user0#0'
+
+def test_columns():
+    users = makeUsers(3)
+    columns = Exporter(ImplementedUser, fields=['id', 'name']).columns(users)
+    assert columns == {'id': [0, 1, 2], 'name': ['user0', 'user1', 'user2']}
+    assert Exporter(ImplementedUser, fields=['id']).columns([]) == {'id': []}
+
+def test_exporterRebuiltAfterRelink():
+    exporter = getExporter(ImplementedUser)
+    version = exporter.version
+    LinkManager._getDefault().version += 1
+    assert getExporter(ImplementedUser) is exporter and exporter.version == version + 1
@@ -0,0 +1,48 @@
+from attrLinker import LinkedClass, LinkManager
+from attrLinker.fusion import fusedChainOf
+from attrLinker.presets import linkDictionary, linkObject
+from tests.simple_implementation import OnlineTime, User
+from tests.test_decorator import ImplementedUser
+
+
+@LinkedClass(fuse=True)
+class FusedUser(User):
+    __LINKS__ = ImplementedUser.__LINKS__
+
+class FusedSubUser(FusedUser):
+    pass
+
+
+def test_fusedChains():
+    assert [linker.sourceVar for linker in fusedChainOf(FusedUser.__dict__['login_time'])] == ['userData', 'online_time']
+    assert len(fusedChainOf(FusedUser.__dict__['first_message'])) == 2 and fusedChainOf(FusedUser.__dict__['name']) is None
+    assert fusedChainOf(ImplementedUser.__dict__['login_time']) is None
+    for cls in (FusedUser, FusedSubUser):
+        user = cls(id=1, name='Foo')
+        user.send_message('Hi There!')
+        user.send_message('Goodbye!')
+        assert (user.first_message, user.last_message) == ('Hi There!', 'Goodbye!') and user.login_time == user.userData['online_time'].login_time
+        user.first_message = 'Hello!' # Setters still go through the chain
+        assert user.sent_messages == ['Hello!', 'Goodbye!']
+
+def test_refuseOnRebind():
+    manager = LinkManager._getDefault()
+
+    @LinkedClass(fuse=True)
+    class Rebound(User):
+        __LINKS__ = ImplementedUser.__LINKS__
+
+    user = Rebound()
+    user.userData['session'] = OnlineTime(42)
+    linkDictionary(Rebound, 'userData', 'online_time', 'session') # The root link of login_time is rebound
+    assert user.login_time == 42 and fusedChainOf(Rebound.__dict__['login_time'])[0] is manager.linkerAt(Rebound, 'online_time')
+    linkObject(Rebound, 'online_time', 'login_time', 'total_time') # The outer link is rebound
+    assert 0 < user.login_time and fusedChainOf(Rebound.__dict__['login_time'])[-1] is manager.linkerAt(Rebound, 'login_time')
+
+    manager.unbind(Rebound, 'online_time')
+    user.online_time = OnlineTime(7)
+    assert Rebound.__dict__['login_time'] is manager.linkerAt(Rebound, 'login_time').property and 0 < user.login_time
+    manager.unfuse(Rebound)
+    user.send_message('Hi There!')
+    assert fusedChainOf(Rebound.__dict__['first_message']) is None and user.first_message == 'Hi There!'
+    manager.unlinkClass(Rebound)
@@ -0,0 +1,96 @@
+import pytest
+
+from attrLinker.linkMethod import MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkedCollection, LinkManager, HashIndex, SortedIndex, indexesOf
+from attrLinker.index import Index
+
+
+@LinkedClass
+class IndexedUser:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'status': 'status', 'onlineTime': 'online_time'}, enableSetter=True)]
+    __INDEXES__ = [HashIndex('ID', unique=True), HashIndex('status'), SortedIndex('onlineTime')]
+
+    def __init__(self):
+        self.userData = {}
+
+
+def makePayloads(count):
+    return [{'id': idx, 'status': 'online' if idx % 3 == 0 else 'idle', 'online_time': (idx * 7) % 10} for idx in range(count)]
+
+
+def test_collectionMaintainsIndexes():
+    indexes = indexesOf(IndexedUser)
+    collection = LinkedCollection(IndexedUser, 'userData', 'id')
+    collection.refresh(makePayloads(30))
+    assert indexes['ID'].one(12) is collection[12]
+    assert sorted(user.ID for user in indexes['status'].get('online')) == list(range(0, 30, 3))
+    assert sorted(user.ID for user in indexes['onlineTime'].range(2, 4, includeHigh=False)) == sorted(user.ID for user in collection if 2 <= user.onlineTime < 4)
+
+    payloads = makePayloads(20)
+    payloads[1]['status'] = 'online'
+    collection.refresh(payloads)
+    assert len(indexes) == 20 and indexes['ID'].one(25) is None
+    assert collection[1] in indexes['status'].get('online') and indexes['status'].count('online') == 8
+
+def test_settersReindex():
+    indexes = indexesOf(IndexedUser)
+    collection = LinkedCollection(IndexedUser, 'userData', 'id')
+    collection.refresh([{'id': 100, 'status': 'idle', 'online_time': 5}])
+    user = collection[100]
+    user.status = 'away'
+    user.onlineTime = 50
+    assert indexes['status'].get('away') == [user] and user not in indexes['status'].get('idle')
+    assert indexes['onlineTime'].last() == [user]
+    other = IndexedUser()
+    other.userData = {'id': 100}
+    with pytest.raises(ValueError):
+        indexes.add(other)
+    collection.retire(100)
+    assert user not in indexes['status'] and indexes['ID'].one(100) is None
+
+def test_unreadableValuesAreLeftOut():
+    index = SortedIndex('onlineTime')
+    user = IndexedUser()
+    user.userData = {'id': 1}
+    index.add(user)
+    assert user in index and index.range() == []
+    with pytest.raises(TypeError): # Abstract
+        Index('onlineTime')
+
+def test_swapAndUnbindIndexedAttribute():
+    @LinkedClass
+    class SwappedUser:
+        __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'status': 'status'}, enableSetter=True)]
+        __INDEXES__ = [HashIndex('status')]
+
+        def __init__(self, userData):
+            self.userData = userData
+
+    indexes = indexesOf(SwappedUser)
+    user = SwappedUser({'status': 'a', 'state': 'b'})
+    indexes.add(user)
+    manager = LinkManager._getDefault()
+    manager.swap(SwappedUser, [PreparedLink(MultiDictionary, 'userData', linkMap={'status': 'state'}, enableSetter=True)])
+    assert user.status == 'b'
+    user.status = 'z'
+    assert user.userData['state'] == 'z' and indexes['status'].get('z') == [user] and user not in indexes['status'].get('a')
+    manager.unbind(SwappedUser, 'status')
+    assert 'status' not in SwappedUser.__dict__
+    with pytest.raises(AttributeError):
+        user.status
+
+def test_rejectedWritesAreRolledBack():
+    indexes = indexesOf(IndexedUser)
+    collection = LinkedCollection(IndexedUser, 'userData', 'id')
+    collection.refresh([{'id': 200, 'status': 'idle', 'online_time': 1}, {'id': 201, 'status': 'idle', 'online_time': 2}])
+    user = collection[201]
+    with pytest.raises(ValueError):
+        user.ID = 200
+    assert user.userData['id'] == 201 and indexes['ID'].one(201) is user and indexes['ID'].one(200) is collection[200]
+
+    unhashable = IndexedUser()
+    unhashable.userData = {'id': 202, 'status': ['idle'], 'online_time': 3}
+    with pytest.raises(TypeError):
+        indexes.add(unhashable)
+    assert unhashable not in indexes['ID'] and unhashable not in indexes['status'] and id(unhashable) not in indexes.members
@@ -0,0 +1,66 @@
+import io
+import json
+
+import pytest
+
+from attrLinker import LinkedCollection, RefreshResult, iterRecords, ingest, ingestInto
+from tests.test_collection import Entry
+
+
+RECORDS = [{'id': idx, 'status': 'idle', 'online_time': idx * 1.5, 'name': 'Ünïcode %d' % idx} for idx in range(50)]
+
+
+def chunked(data: bytes, size: int):
+    return (data[idx:idx + size] for idx in range(0, len(data), size))
+
+
+@pytest.mark.parametrize('body', [
+    json.dumps(RECORDS).encode(),
+    json.dumps(RECORDS, indent=2).encode(),
+    '\n'.join(map(json.dumps, RECORDS)).encode() + b'\n',
+], ids=['array', 'indentedArray', 'ndjson'])
+def test_iterRecords(body):
+    assert list(iterRecords(chunked(body, 7))) == RECORDS
+    assert list(iterRecords(io.BytesIO(body), chunkSize=5)) == RECORDS
+    assert list(iterRecords(io.StringIO(body.decode()))) == RECORDS
+
+def test_invalidStreams():
+    assert list(iterRecords(io.BytesIO(b'  '))) == []
+    assert list(iterRecords([b'[1, 2', b'3, 4]'])) == [1, 23, 4]
+    with pytest.raises(ValueError):
+        list(iterRecords([b'[{"id": 1}, {"id": ']))
+    with pytest.raises(ValueError):
+        list(iterRecords(io.BytesIO(b'{"id": 1}'), format='json'))
+
+def test_ingestIsLazy():
+    records = iter(RECORDS)
+    chunks = (json.dumps(next(records)).encode() + b'\n' for _ in range(len(RECORDS)))
+    instances = ingest(Entry, chunks, 'userData')
+    first = next(instances)
+    assert (first.ID, first.onlineTime) == (0, 0.0) and next(records)['id'] == 1 # Only the first record was parsed
+
+    batches = list(ingest(Entry, io.BytesIO(json.dumps(RECORDS).encode()), 'userData', batchSize=20))
+    assert [len(batch) for batch in batches] == [20, 20, 10] and batches[2][-1].ID == 49
+
+def test_ingestInto():
+    collection = LinkedCollection(Entry, 'userData', 'id')
+    collection.refresh(RECORDS[40:] + [{'id': 100, 'status': 'idle', 'online_time': 0}])
+    updated = [dict(record, status='online') for record in RECORDS]
+    result = ingestInto(collection, io.BytesIO(json.dumps(updated).encode()), batchSize=16, retireMissing=True)
+    assert result == RefreshResult(40, 1, 10)
+    assert len(collection) == 50 and 100 not in collection and collection[45].status == 'online'
+
+def test_recordsSpanningChunksAreDecodedOnce(monkeypatch):
+    import sys
+    records = [{'text': 'a "quoted" [bracket} \\ ' * 50, 'items': [[1, {'x': 'y'}]] * 20}, 'string ] "', 12345]
+    body = json.dumps(records).encode()
+    calls = []
+    class CountingDecoder:
+        def raw_decode(self, text, position):
+            calls.append(position)
+            return json.JSONDecoder().raw_decode(text, position)
+    monkeypatch.setattr(sys.modules['attrLinker.ingest'], '_DECODER', CountingDecoder())
+    assert list(iterRecords(chunked(body, 3))) == records
+    assert len(calls) < 10 # Not once per chunk
+    with pytest.raises(ValueError):
+        list(iterRecords([b'[{"id": 1 2}', b']']))
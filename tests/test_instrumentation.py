@@ -0,0 +1,65 @@
+from attrLinker.linkMethod import MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkManager
+from attrLinker.instrumentation import InstrumentedDescriptor
+
+
+@LinkedClass
+class ProfiledUser:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap=['id', 'status'], enableSetter=True)]
+
+    def __init__(self):
+        self.userData = {'id': 1, 'status': 'idle'}
+
+
+def test_instrumentationReport():
+    manager = LinkManager._getDefault()
+    original = ProfiledUser.__dict__['status']
+    instrumentation = manager.enableInstrumentation()
+    try:
+        assert isinstance(ProfiledUser.__dict__['status'], InstrumentedDescriptor)
+        user = ProfiledUser()
+        for _ in range(3):
+            user.status
+        user.status = 'online'
+        user.id
+        report = manager.report(top=2)
+        assert [(entry.targetClass, entry.targetVar) for entry in report['byCount']] == [(ProfiledUser, 'status'), (ProfiledUser, 'id')]
+        top = report['byCount'][0]
+        assert (top.gets, top.sets) == (3, 1) and top.totalTime > 0 and top.linker.links[ProfiledUser] == ['status']
+        assert len(report['byTime']) == 2
+    finally:
+        manager.disableInstrumentation()
+    assert ProfiledUser.__dict__['status'] is original
+    user.status # Not recorded once disabled
+    assert instrumentation.stats[ProfiledUser]['status'].gets == 3
+
+def test_instrumentationWithinOtherWrappers():
+    from attrLinker import HashIndex, indexesOf
+    from attrLinker.index import IndexedDescriptor
+
+    @LinkedClass
+    class IndexedProfiledUser:
+        __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap=['status'], enableSetter=True)]
+        __INDEXES__ = [HashIndex('status')]
+
+        def __init__(self):
+            self.userData = {'status': 'idle'}
+
+    manager = LinkManager._getDefault()
+    original = IndexedProfiledUser.__dict__['status']
+    instrumentation = manager.enableInstrumentation()
+    try:
+        user = IndexedProfiledUser()
+        indexesOf(IndexedProfiledUser).add(user) # Wraps the instrumented descriptor
+        assert isinstance(IndexedProfiledUser.__dict__['status'], IndexedDescriptor)
+        user.status = 'online'
+        instrumentation.reset()
+        user.status
+        assert instrumentation.stats[IndexedProfiledUser]['status'].gets == 1
+    finally:
+        manager.disableInstrumentation()
+    wrapper = IndexedProfiledUser.__dict__['status']
+    assert isinstance(wrapper, IndexedDescriptor) and wrapper.descriptor is original
+    user.status = 'away'
+    assert indexesOf(IndexedProfiledUser)['status'].get('away') == [user]
@@ -0,0 +1,62 @@
+import pytest
+
+from attrLinker import LinkManager, LinkerNotFound
+from attrLinker.linkMethod import Dictionary, MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker.presets import multiLinkDictionary, linkDictionary
+
+
+class Session:
+    def __init__(self, userData):
+        self.userData = userData
+
+
+def test_introspection():
+    manager = LinkManager._getDefault()
+    cls = type('Table', (Session,), {})
+    multiLinkDictionary(cls, 'userData', linkMap={'name': 'name', 'onlineTime': 'online_time'})
+    linkDictionary(cls, 'profile', 'bio')
+    assert manager.targetsOf(cls, 'userData') == {'name', 'onlineTime'} and manager.targetsOf(cls, 'profile') == {'bio'}
+    assert manager.linkerAt(cls, 'name') is manager.links[cls]['name'] is manager.linkersOf(cls)['name']
+    assert manager.linkerAt(type('Sub', (cls,), {}), 'bio').sourceVar == 'profile' and manager.linkerAt(cls, 'missing') is None
+
+    linkDictionary(cls, 'profile', 'name', 'full_name') # Moving a link to another source
+    assert manager.targetsOf(cls, 'userData') == {'onlineTime'} and manager.targetsOf(cls, 'profile') == {'bio', 'name'}
+    manager.unlinkClass(cls)
+    assert manager.targetsOf(cls, 'profile') == frozenset() and cls not in manager.sources
+
+def test_renamedKeySwap():
+    manager = LinkManager._getDefault()
+    cls = type('Renamed', (Session,), {})
+    multiLinkDictionary(cls, 'userData', linkMap={'name': 'name', 'onlineTime': 'online_time', 'status': 'status'})
+    session = cls({'name': 'Foo', 'online_time': 5, 'onlineSeconds': 5, 'status': 'idle'})
+    linkerCount, version = len(manager.linkers), manager.version
+
+    with manager.staging():
+        linkDictionary(cls, 'userData', 'onlineTime', 'onlineSeconds') # Same generated name, replaces the current linker
+        manager.unbind(cls, 'status')
+        assert session.status == 'idle' and manager.linkerAt(cls, 'onlineTime').accessSpec[1] == 'online_time' # Not swapped in yet
+    session.userData['onlineSeconds'] = 7
+    assert session.onlineTime == 7 and not hasattr(cls, 'status') and manager.version == version + 2
+    assert len(manager.linkers) == linkerCount - 1 and manager.links[cls]['onlineTime'].links[cls] == ['onlineTime']
+
+    with pytest.raises(RuntimeError):
+        with manager.staging():
+            linkDictionary(cls, 'userData', 'name', 'login')
+            raise RuntimeError
+    assert session.name == 'Foo' and len(manager.linkers) == linkerCount - 1
+    with pytest.raises(LinkerNotFound):
+        with manager.staging():
+            manager.unbind(cls, 'status')
+    manager.unlinkClass(cls)
+
+def test_swap():
+    manager = LinkManager._getDefault()
+    cls = type('Swapped', (Session,), {})
+    manager.swap(cls, [PreparedLink(MultiDictionary, 'userData', linkMap={'name': 'name', 'onlineTime': 'online_time'})])
+    session = cls({'name': 'Foo', 'online_time': 5, 'onlineSeconds': 6})
+    assert manager.snapshot(session) == {'name': 'Foo', 'onlineTime': 5}
+
+    manager.swap(cls, [PreparedLink(Dictionary, 'userData', 'onlineTime', 'onlineSeconds')])
+    assert manager.snapshot(session) == {'onlineTime': 6} and not hasattr(session, 'name')
+    manager.unlinkClass(cls)
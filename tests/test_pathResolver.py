@@ -0,0 +1,66 @@
+import pytest
+
+from attrLinker.linkMethod import MultiPath
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, PathResolver
+from attrLinker.pathResolver import parsePath
+
+
+class Session:
+    def __init__(self):
+        self.device = {'name': 'phone'}
+
+
+@LinkedClass
+class NestedUser:
+    __LINKS__ = [PreparedLink(MultiPath, 'userData', linkMap={'onlineTime': 'profile.stats.online_time', 'firstItemID': 'items[0].id',
+                                                              'lastItem': "items[-1]['name']", 'device': 'session.device.name', 'level': 'profile.level'},
+                              default=-1, enableSetter=True)]
+
+    def __init__(self):
+        self.userData = {'profile': {'stats': {'online_time': 10}}, 'items': [{'id': 5, 'name': 'sword'}, {'id': 6, 'name': 'shield'}], 'session': Session()}
+
+
+def test_parsePath():
+    assert parsePath("items[0].id") == [('name', 'items'), ('index', 0), ('name', 'id')]
+    assert parsePath("a['b.c'][\"d\"][-2]") == [('name', 'a'), ('key', 'b.c'), ('key', 'd'), ('index', -2)]
+    for invalid in ['', '.a', 'a..b', 'a[0]b', 'a.0']:
+        with pytest.raises(ValueError):
+            parsePath(invalid)
+
+def test_linkPathGetters():
+    user = NestedUser()
+    assert (user.onlineTime, user.firstItemID, user.lastItem, user.device) == (10, 5, 'shield', 'phone')
+    assert user.level == -1
+    user.userData = {}
+    assert user.onlineTime == -1 and user.firstItemID == -1
+
+def test_linkPathSetters():
+    user = NestedUser()
+    user.onlineTime += 5
+    user.device = 'tablet'
+    assert user.userData['profile']['stats']['online_time'] == 15 and user.userData['session'].device['name'] == 'tablet'
+    user.userData = {}
+    user.onlineTime = 1
+    assert user.userData == {'profile': {'stats': {'online_time': 1}}}
+
+def test_resolverDefault():
+    resolver = PathResolver('a.b')
+    assert resolver.get({'a': None}) is None and resolver.get({'a': {'b': 2}}) == 2 and resolver.get({}, 'missing') == 'missing'
+
+def test_indexSetters():
+    user = NestedUser()
+    user.firstItemID = 7
+    assert user.userData['items'][0] == {'id': 7, 'name': 'sword'}
+    user.userData = {}
+    user.firstItemID = 3
+    assert user.userData == {'items': [{'id': 3}]}
+    resolver = PathResolver('items[1]')
+    data = {'items': [1]}
+    resolver.set(data, 2) # Appended
+    assert data == {'items': [1, 2]}
+    with pytest.raises(IndexError, match="items\\[3\\]"):
+        PathResolver('items[3]').set(data, 4)
+    with pytest.raises(IndexError):
+        PathResolver('rows[2].id').set(data, 4)
+    assert 'rows' not in data
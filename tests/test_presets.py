@@ -36,3 +36,8 @@ def test_formattedTextFromDict():
 
 def test_linkObject():
     assert user.login_time == user.online_time.login_time, "linkObject is not working as expected. user.attr={0} user.obj.attr={1}".format(user.login_time, user.online_time.login_time)
+
+def test_linkDictionarySetterInPlace():
+    source = user.userData
+    user.status = 'online'
+    assert user.userData is source and source['status'] == 'online'
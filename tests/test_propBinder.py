@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from attrLinker.propBinder import PropBinder
+from attrLinker import LinkerNotFound
+
+
+class Config:
+    def __init__(self):
+        self.flags = {'debug': False, 'theme': 'dark'}
+        self.version = 0
+
+
+def test_uncachedBindMany():
+    class App:
+        pass
+
+    binder = PropBinder({'debug': False, 'theme': 'dark'})
+    binder.bindMany(App, ['debug', 'theme'])
+    app = App()
+    binder.source_obj['theme'] = 'light'
+    assert (app.debug, app.theme) == (False, 'light')
+    with pytest.raises(AttributeError):
+        app.theme = 'dark'
+
+    binder.unbind(App, 'theme')
+    assert not hasattr(app, 'theme') and list(binder.propList[App]) == ['debug']
+    with pytest.raises(LinkerNotFound):
+        binder.unbind(App, 'theme')
+
+def test_cachedAndInvalidate():
+    class App:
+        pass
+
+    calls = []
+    binder = PropBinder({'debug': False}, cache=True)
+    binder.bindMany(App, {'debug': lambda source: calls.append(1) or source['debug'], 'raw': lambda source: dict(source)})
+    app, other = App(), App()
+    assert [app.debug, other.debug, app.debug] == [False] * 3 and len(calls) == 1
+    binder.source_obj['debug'] = True
+    assert app.debug is False
+    binder.invalidate(App, 'debug')
+    assert app.debug is True and len(calls) == 2
+    with pytest.raises(AttributeError):
+        app.debug = False
+
+def test_versionAndTtl():
+    class App:
+        pass
+
+    config = Config()
+    binder = PropBinder(config, cache=True, version=lambda: config.version)
+    binder.bind(App, 'theme', lambda config: config.flags['theme'])
+    app = App()
+    assert app.theme == 'dark'
+    config.flags['theme'] = 'light'
+    assert app.theme == 'dark'
+    config.version += 1
+    assert app.theme == 'light'
+
+    binder = PropBinder(config, cache=True, ttl=0.01)
+    binder.bind(App, 'debug', lambda config: config.flags['debug'])
+    assert app.debug is False
+    config.flags['debug'] = True
+    assert app.debug is False
+    time.sleep(0.02)
+    assert app.debug is True
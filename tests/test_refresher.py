@@ -0,0 +1,88 @@
+import asyncio
+
+from attrLinker.linkMethod import MultiDictionary
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, LinkedCollection, AsyncRefresher
+
+
+@LinkedClass
+class PolledUser:
+    __LINKS__ = [PreparedLink(MultiDictionary, 'userData', linkMap={'ID': 'id', 'status': 'status'})]
+
+    def __init__(self, id=0):
+        self.userData = {'id': id, 'status': 'idle'}
+
+
+def test_staleWhileRevalidate():
+    users = [PolledUser(idx) for idx in range(6)]
+    inFlight, peak = [0], [0]
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def fetch(user):
+            inFlight[0] += 1
+            peak[0] = max(peak[0], inFlight[0])
+            await gate.wait()
+            inFlight[0] -= 1
+            if user.ID == 5:
+                raise ConnectionError('server down')
+            return {'id': user.ID, 'status': 'online'}
+
+        refresher = AsyncRefresher(fetch, sourceVar='userData', concurrency=2)
+        for user in users:
+            refresher.add(user)
+        task = asyncio.ensure_future(refresher.refreshOnce())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert all(user.status == 'idle' for user in users) # Reads serve the previous source while fetching
+        gate.set()
+        await task
+        return refresher
+
+    refresher = asyncio.run(scenario())
+    assert peak[0] == 2
+    assert [user.status for user in users] == ['online'] * 5 + ['idle']
+    assert refresher.metrics(users[5]).failures == 1 and isinstance(refresher.metrics(users[5]).lastError, ConnectionError)
+    assert refresher.metrics(users[0]).staleness >= 0 and refresher.metrics(users[5]).staleness is None
+    assert refresher.stats()['failures'] == 1 and refresher.maxStaleness() is None
+
+def test_collectionRefresher():
+    collection = LinkedCollection(PolledUser, 'userData', 'id')
+    polls = [0]
+
+    async def fetch():
+        polls[0] += 1
+        return [{'id': idx, 'status': 'online' if polls[0] > 1 else 'idle'} for idx in range(3)]
+
+    async def scenario():
+        refresher = AsyncRefresher(fetch, collection=collection, interval=0.01, jitter=0.5)
+        await refresher.run(rounds=2)
+        refresher.start()
+        await asyncio.sleep(0.02)
+        await refresher.stop()
+        return refresher
+
+    refresher = asyncio.run(scenario())
+    assert polls[0] >= 3 and len(collection) == 3 and collection[1].status == 'online'
+    assert refresher.metrics().successes == polls[0] and not refresher.running
+
+def test_failedRefreshKeepsRunning():
+    collection = LinkedCollection(PolledUser, 'userData', 'id')
+    polls = [0]
+
+    async def fetch():
+        polls[0] += 1
+        if polls[0] == 1:
+            return [{'status': 'online'}] # No id, LinkedCollection.refresh raises
+        return [{'id': 1, 'status': 'online'}]
+
+    async def scenario():
+        refresher = AsyncRefresher(fetch, collection=collection, interval=0.001, jitter=0)
+        await refresher.run(rounds=2)
+        return refresher
+
+    refresher = asyncio.run(scenario())
+    metrics = refresher.metrics()
+    assert polls[0] == 2 and collection[1].status == 'online'
+    assert metrics.failures == 1 and metrics.successes == 1 and metrics.consecutiveFailures == 0
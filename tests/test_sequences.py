@@ -0,0 +1,70 @@
+import array
+from collections import deque, namedtuple
+
+import pytest
+
+from attrLinker import LinkManager, Linker, CompiledLinker
+from attrLinker.presets import linkList, linkSlice, linkIndexes, multiLinkList
+
+
+Point = namedtuple('Point', 'x y z')
+
+
+def makeWindow():
+    cls = type('Window', (), {'__init__': lambda self, values: setattr(self, 'values', values)})
+    multiLinkList(cls, 'values', linkMap={'first': 0, 'last': -1, 'last3': slice(-3, None), 'ends': (0, -1)}, enableSetter=True)
+    return cls
+
+
+@pytest.mark.parametrize('source', [[1, 2, 3, 4, 5], (1, 2, 3, 4, 5), deque([1, 2, 3, 4, 5], maxlen=5), array.array('d', [1, 2, 3, 4, 5]), Point(1, 2, 3)],
+                         ids=['list', 'tuple', 'deque', 'array', 'namedtuple'])
+def test_sequenceSources(source):
+    cls = makeWindow()
+    window = cls(source)
+    kind, last = type(source), source[-1]
+    assert (window.first, window.last, window.ends) == (1, last, (1, last)) and list(window.last3) == list(source)[-3:]
+    original = window.values
+    window.first = 10
+    window.ends = (7, 8)
+    assert (window.values[0], window.values[-1]) == (7, 8) and type(window.values) is kind
+    assert (window.values is original) == (kind in (list, deque, array.array))
+    window.last3 = list(window.values)[-3:][::-1] if kind is not deque else [0, 0, 0]
+    assert type(window.values) is kind and len(window.values) == len(source)
+    if kind is deque:
+        assert window.values.maxlen == 5
+    LinkManager._getDefault().unlinkClass(cls)
+
+def test_bufferViews():
+    cls = makeWindow()
+    window = cls(array.array('i', range(10)))
+    view = window.last3
+    assert isinstance(view, memoryview) and view.tolist() == [7, 8, 9]
+    window.values[-1] = 90
+    assert view[-1] == 90 # Shares the memory of the array
+    window.last3 = array.array('i', [1, 2, 3])
+    assert window.values.tolist()[-4:] == [6, 1, 2, 3]
+    del view, window
+    raw = cls(b'abcdef')
+    assert raw.first == ord('a') and bytes(raw.last3) == b'def'
+    raw.last = ord('z')
+    assert raw.values == b'abcdez'
+    linkSlice(cls, 'values', 'copied', slice(0, 2), view=False)
+    assert raw.copied == b'ab'
+    LinkManager._getDefault().unlinkClass(cls)
+
+def test_compiledSetters():
+    LinkManager.changeLinkerClass(CompiledLinker)
+    try:
+        cls = type('Compiled', (), {})
+        linkList(cls, 'values', 'first', 0, enableSetter=True)
+        linkIndexes(cls, 'values', 'xy', [0, 1], enableSetter=True)
+    finally:
+        LinkManager.changeLinkerClass(Linker)
+    instance = cls()
+    instance.values = (1, 2, 3)
+    instance.first = 5
+    instance.xy = (8, 9)
+    assert instance.values == (8, 9, 3) and instance.xy == (8, 9)
+    with pytest.raises(ValueError):
+        instance.xy = (1,)
+    LinkManager._getDefault().unlinkClass(cls)
@@ -0,0 +1,62 @@
+import multiprocessing
+import pickle
+
+import pytest
+
+from attrLinker.linkMethod import MultiSharedRecord
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, RecordLayout, SharedRecordStore
+
+
+LAYOUT = RecordLayout({'id': 'q', 'online_time': 'd', 'name': '16s'})
+
+
+@LinkedClass
+class SharedUser:
+    __LINKS__ = [PreparedLink(MultiSharedRecord, 'record', layout=LAYOUT, linkMap={'ID': 'id', 'onlineTime': 'online_time', 'name': 'name'}, enableSetter=True)]
+
+    def __init__(self, record):
+        self.record = record
+
+
+def readUser(user):
+    return (user.ID, user.onlineTime, user.name, user.record.store.owner)
+
+def writeUser(user):
+    try:
+        user.ID = 5
+    except PermissionError:
+        return 'denied'
+
+
+@pytest.fixture
+def store():
+    with SharedRecordStore(LAYOUT, capacity=4) as store:
+        yield store
+
+def test_ownerAccess(store):
+    user = SharedUser(store.allocate(id=1, online_time=2.5, name='Foo'))
+    assert (user.ID, user.onlineTime, user.name) == (1, 2.5, b'Foo')
+    generation = store.generation
+    user.onlineTime += 1
+    assert store.generation == generation + 1 and user.record.read() == {'id': 1, 'online_time': 3.5, 'name': b'Foo'}
+    store.release(user.record.row)
+    assert store.allocate().row == user.record.row and user.ID == 0
+    for _ in range(len(store), store.capacity):
+        store.allocate()
+    with pytest.raises(MemoryError):
+        store.allocate()
+
+def test_recordsPickleByReference(store):
+    user = SharedUser(store.allocate(id=7, name='Bar'))
+    data = pickle.dumps(user)
+    assert len(data) < 300
+    assert pickle.loads(data).record.store is store
+
+def test_workersReadSharedMemory(store):
+    users = [SharedUser(store.allocate(id=idx, online_time=idx / 2, name='user%d' % idx)) for idx in range(3)]
+    users[2].name = 'renamed'
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        results = pool.map(readUser, users)
+        assert pool.apply(writeUser, (users[0],)) == 'denied'
+    assert results == [(idx, idx / 2, b'user%d' % idx, False) for idx in range(2)] + [(2, 1.0, b'renamed', False)]
@@ -0,0 +1,55 @@
+import struct
+
+import pytest
+
+from attrLinker.linkMethod import MultiStruct
+from attrLinker.preparedLink import PreparedLink
+from attrLinker import LinkedClass, RecordLayout, RecordFile, getExporter
+
+
+QUOTE_LAYOUT = RecordLayout({'symbol': '8s', 'price': ('d', 8), 'volume': ('I', 16)}, size=24)
+
+
+@LinkedClass
+class Quote:
+    __LINKS__ = [PreparedLink(MultiStruct, 'record', layout=QUOTE_LAYOUT, enableSetter=True)]
+
+    def __init__(self, record):
+        self.record = record
+
+
+def packQuote(symbol, price, volume):
+    return struct.pack('<8sdI4x', symbol, price, volume)
+
+
+def test_sources():
+    for source in (packQuote(b'ABC', 1.5, 10), bytearray(packQuote(b'ABC', 1.5, 10)), memoryview(bytearray(packQuote(b'ABC', 1.5, 10)))):
+        quote = Quote(source)
+        assert (quote.symbol, quote.price, quote.volume) == (b'ABC', 1.5, 10)
+        quote.volume += 5
+        assert quote.volume == 15 and type(quote.record) is type(source)
+    bytearrayQuote = Quote(bytearray(packQuote(b'ABC', 1.5, 10)))
+    record = bytearrayQuote.record
+    bytearrayQuote.price = 2.0
+    assert bytearrayQuote.record is record and struct.unpack_from('<d', record, 8)[0] == 2.0
+    assert getExporter(Quote).toDict(bytearrayQuote) == {'symbol': b'ABC', 'price': 2.0, 'volume': 10}
+
+def test_layoutOffsets():
+    assert QUOTE_LAYOUT.offsets == {'symbol': 0, 'price': 8, 'volume': 16} and QUOTE_LAYOUT.size == 24
+    with pytest.raises(ValueError):
+        RecordLayout({'price': ('d', 8)}, size=12)
+
+def test_recordFile(tmp_path):
+    path = tmp_path / 'quotes.bin'
+    path.write_bytes(b'HEAD' + b''.join(packQuote(b'Q%d' % idx, idx * 1.5, idx) for idx in range(100)))
+
+    with RecordFile(str(path), QUOTE_LAYOUT, offset=4) as quotes:
+        assert len(quotes) == 100
+        assert [quote.volume for quote in quotes.instances(Quote, 'record', 95)] == [95, 96, 97, 98, 99]
+        assert QUOTE_LAYOUT.unpack(quotes[-1]) == {'symbol': b'Q99', 'price': 148.5, 'volume': 99}
+
+    with RecordFile(str(path), QUOTE_LAYOUT, offset=4, writable=True) as quotes:
+        quote = next(quotes.instances(Quote, 'record', 3))
+        quote.symbol = 'NEW'
+        del quote
+    assert path.read_bytes()[4 + 3 * 24:4 + 3 * 24 + 8] == b'NEW\0\0\0\0\0'
@@ -0,0 +1,62 @@
+import pytest
+
+from attrLinker import CompiledTemplate
+
+
+def test_onlyReferencedFields():
+    template = CompiledTemplate('{name}#{id}')
+    assert template.fields == ('name', 'id')
+    assert template.render({'name': 'Steve', 'id': 1234, 'status': 'idle'}) == 'Steve#1234'
+
+def test_specsConversionsAndNestedFields():
+    source = {'user': {'name': 'Steve'}, 'score': 3.14159, 'width': 8, 'tags': ['a', 'b']}
+    template = CompiledTemplate('{user[name]!r:>{width}}|{score:.2f}|{tags[1]}|{{literal}}')
+    assert template.render(source) == '{user[name]!r:>{width}}|{score:.2f}|{tags[1]}|{{literal}}'.format(**source)
+
+def test_missingKey():
+    with pytest.raises(KeyError):
+        CompiledTemplate('{name}#{id}').render({'name': 'Steve'})
+    template = CompiledTemplate('{name}#{id}|{user[name]}', default='?')
+    assert template.render({'name': 'Steve', 'user': {}}) == 'Steve#?|?'
+
+def test_positionalFieldsRejected():
+    with pytest.raises(ValueError):
+        CompiledTemplate('{} {0}')
+
+def test_cacheInvalidatedOnChange():
+    template = CompiledTemplate('{name}#{id}', cache=True)
+    source = {'name': 'Steve', 'id': 1}
+    first = template.render(source)
+    assert template.render(source) is first
+    source['id'] = 2
+    assert template.render(source) == 'Steve#2'
+    source['status'] = 'online' # Unreferenced keys do not invalidate
+    assert template.render(source) == 'Steve#2'
+
+def test_cacheNestedValueChangedInPlace():
+    template = CompiledTemplate('{user[name]} {tags[1]}', cache=True)
+    source = {'user': {'name': 'a'}, 'tags': [0, 1]}
+    assert template.render(source) == 'a 1'
+    source['user']['name'] = 'b'
+    source['tags'][1] = 2
+    assert template.render(source) == 'b 2'
+    other = {'user': {'name': 'c'}, 'tags': [0, 3]} # Cached per source
+    assert template.render(other) == 'c 3'
+    assert template.render(source) == 'b 2'
+
+def test_cacheSkipsMutableLeaves():
+    template = CompiledTemplate('{tags}', cache=True)
+    source = {'tags': [1]}
+    assert template.render(source) == '[1]'
+    source['tags'].append(2)
+    assert template.render(source) == '[1, 2]'
+    assert template.cache == {}
+
+def test_cacheComparesTypes():
+    template = CompiledTemplate('{value}', cache=True)
+    source = {'value': 1}
+    rendered = []
+    for value in (1, True, 1.0):
+        source['value'] = value
+        rendered.append(template.render(source))
+    assert rendered == ['1', 'True', '1.0']
@@ -0,0 +1,82 @@
+import threading
+
+from attrLinker import LinkManager
+from attrLinker.presets import linkList, multiLinkDictionary
+
+
+class Account:
+    def __init__(self, userData):
+        self.userData = userData
+
+multiLinkDictionary(Account, 'userData', linkMap=['name', 'status', 'messages'], enableSetter=True)
+linkList(Account, 'messages', 'lastMessage', -1)
+
+
+def runThreads(target, count, *args):
+    threads = [threading.Thread(target=target, args=(idx,) + args) for idx in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrentBinds():
+    manager = LinkManager()
+    classes = [type('Concurrent%d' % idx, (), {}) for idx in range(8)]
+
+    def bindAll(idx):
+        for field in range(50):
+            manager.bind(classes[idx], 'data', 'f%d' % field, getterConverter=lambda data, field=field: data[field])
+
+    runThreads(bindAll, len(classes))
+    assert len(manager.linkers) == 8 * 50 and manager.version == 8 * 50
+    assert all(len(manager.linkersOf(cls)) == 50 for cls in classes)
+
+def test_snapshot():
+    manager = LinkManager._getDefault()
+    account = Account({'name': 'Foo', 'status': 'idle', 'messages': ['hi', 'bye']})
+    assert manager.snapshot(account, ['name', 'lastMessage']) == {'name': 'Foo', 'lastMessage': 'bye'}
+    assert set(manager.snapshot(account)) == {'name', 'status', 'messages', 'lastMessage'}
+
+def test_snapshotIsConsistentUnderWrites():
+    manager = LinkManager._getDefault()
+    account = Account({'name': 'v0', 'status': 'v0', 'messages': []})
+    done, torn = threading.Event(), []
+
+    def write(idx):
+        for version in range(1, 3000):
+            if version % 2:
+                account.userData = {'name': 'v%d' % version, 'status': 'v%d' % version, 'messages': []}
+            else:
+                with manager.writing(account):
+                    account.name = account.status = 'v%d' % version
+        done.set()
+
+    def read(idx):
+        while not done.is_set():
+            values = manager.snapshot(account, ['name', 'status'])
+            if values['name'] != values['status']:
+                torn.append(values)
+
+    runThreads(lambda idx: write(idx) if idx == 0 else read(idx), 4)
+    assert torn == []
+
+def test_writingDoesNotBlockOtherInstances():
+    manager = LinkManager._getDefault()
+    written, other = Account({'name': 'Foo', 'status': 'idle', 'messages': []}), Account({'name': 'Bar', 'status': 'idle', 'messages': []})
+    entered, release, results = threading.Event(), threading.Event(), []
+
+    def write(idx):
+        with manager.writing(written):
+            entered.set()
+            release.wait(5)
+
+    def read(idx):
+        entered.wait(5)
+        results.append(manager.snapshot(other, ['name']))
+        with manager.writing(other): # Writers of another instance are not serialized with it either
+            other.status = 'online'
+        results.append(manager.snapshot(other, ['status']))
+        release.set()
+
+    runThreads(lambda idx: write(idx) if idx == 0 else read(idx), 2)
+    assert results == [{'name': 'Bar'}, {'status': 'online'}]
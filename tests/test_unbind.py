@@ -0,0 +1,63 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from attrLinker import LinkManager, LinkerNotFound
+from attrLinker.presets import multiLinkDictionary, linkDictionary
+
+
+def makeLinkedClass(idx):
+    cls = type('Dynamic%d' % idx, (), {})
+    multiLinkDictionary(cls, 'data', linkMap=['id', 'name', 'status'], enableSetter=True)
+    return cls
+
+
+def test_unbind():
+    manager = LinkManager._getDefault()
+    cls = makeLinkedClass(0)
+    instance = cls()
+    instance.data = {'id': 1, 'name': 'Foo', 'status': 'idle'}
+    linkerCount = len(manager.linkers)
+
+    manager.unbind(cls, 'name')
+    assert 'name' not in cls.__dict__ and not hasattr(instance, 'name')
+    assert set(manager.linkersOf(cls)) == {'id', 'status'} and len(manager.linkers) == linkerCount - 1
+    with pytest.raises(LinkerNotFound):
+        manager.unbind(cls, 'name')
+
+    manager.unlinkClass(cls)
+    assert manager.linkersOf(cls) == {} and len(manager.linkers) == linkerCount - 3
+    assert cls not in manager.links and cls not in manager.targets
+
+def test_rebindReleasesPreviousLinker():
+    manager = LinkManager._getDefault()
+    cls = makeLinkedClass(1)
+    linkerCount = len(manager.linkers)
+    linkDictionary(cls, 'profile', 'name', 'full_name')
+    instance = cls()
+    instance.profile = {'full_name': 'Foo Bar'}
+    assert instance.name == 'Foo Bar' and len(manager.linkers) == linkerCount
+    manager.unlinkClass(cls)
+
+def test_droppedClassesAreFreed():
+    manager = LinkManager._getDefault()
+    gc.collect()
+    linkerCount = len(manager.linkers)
+
+    def churn(count):
+        for idx in range(count):
+            makeLinkedClass(idx)
+        gc.collect()
+
+    tracemalloc.start()
+    try:
+        churn(500) # Warm up, so allocator caches do not count as growth
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(4):
+            churn(500)
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert len(manager.linkers) == linkerCount
+    assert growth < 256 * 1024, "Memory grew by {} bytes after dropping linked classes".format(growth)